@@ -0,0 +1,15 @@
+"""Executa o fluxo do script para todas as contas definidas em `accounts`."""
+
+from src.common.echo import echo
+from src.pipeline.batch_runner import BatchRunner
+
+# Protege a criação dos processos de trabalho, que importam este módulo no Windows
+if __name__ == "__main__":
+    try:
+        runner = BatchRunner()
+        results = runner.run()
+    except KeyboardInterrupt:
+        echo("Lote interrompido pelo usuário.", "warn")
+    else:
+        failed = sum(result["status"] == "error" for result in results)
+        echo("Lote finalizado.", "info" if not failed else "warn")
@@ -1,14 +1,9 @@
-"""Função principal que executa o fluxo do script."""
+"""Função principal que executa o fluxo do script pela interface de linha de comando."""
 
-from src.common.echo import echo
-from src.pipeline.selenium_scraper_pipeline import SeleniumScraperPipeline
+import sys
 
-try:
-    scraper = SeleniumScraperPipeline(show_browser=False)
-    scraper.run_workflow()
-except RuntimeError:
-    echo("Ocorreu um erro", "error")
-except KeyboardInterrupt:
-    echo("Script interrompido pelo usuário.", "warn")
-else:
-    echo("Script finalizado.", "info")
+from src.cli import main
+
+# Protege a criação dos processos de trabalho do lote, que importam este módulo no Windows
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Pacote com o portal simulado e os benchmarks de desempenho do pipeline."""
@@ -0,0 +1,150 @@
+"""Módulo de benchmark do pipeline completo executado contra o portal simulado."""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from src.benchmark.mock_portal import MockPortal
+from src.common.echo import echo
+
+PHASES: tuple[str, ...] = (
+    "driver_resolution",
+    "setup_webdriver",
+    "login",
+    "access_course",
+    "find_subjects",
+    "fetch_subjects",
+    "export",
+)
+"""Spans do pipeline reportados como fases do benchmark."""
+
+
+def run_benchmark(
+    subjects: int = 8,
+    activities: int = 30,
+    latency_ms: float = 0,
+    overrides: dict[str, Any] | None = None,
+    engine: str = "sync",
+) -> dict[str, Any]:
+    """Executa o `run_workflow` em modo headless contra o portal simulado e retorna as métricas."""
+    # Importa o pipeline apenas aqui, pois ele carrega selenium e inicializa o logger
+    from src.pipeline.async_scraper_pipeline import AsyncSeleniumScraperPipeline  # noqa: PLC0415
+    from src.pipeline.exporters import DEFAULT_FORMATS  # noqa: PLC0415
+    from src.pipeline.selenium_scraper_pipeline import SeleniumScraperPipeline  # noqa: PLC0415
+
+    with (
+        MockPortal(subjects, activities, latency_ms) as portal,
+        tempfile.TemporaryDirectory(prefix="benchmark_") as output_dir,
+        tempfile.TemporaryDirectory(prefix="benchmark_cache_") as cache_dir,
+    ):
+        settings = {**portal.settings(), **(overrides or {})}
+        # As disciplinas são conferidas no JSON, exportado mesmo fora de `export_formats`
+        formats = list(settings.get("export_formats") or DEFAULT_FORMATS)
+        settings["export_formats"] = formats if "json" in formats else [*formats, "json"]
+        pipeline_class = (
+            AsyncSeleniumScraperPipeline if engine == "async" else SeleniumScraperPipeline
+        )
+        # Cada execução usa caches vazios, sem ler nem sobrescrever os de `data/cache`
+        pipeline = pipeline_class(
+            settings, show_browser=False, output_dir=output_dir, cache_dir=cache_dir
+        )
+
+        start = time.perf_counter()
+        if isinstance(pipeline, AsyncSeleniumScraperPipeline):
+            asyncio.run(pipeline.run_workflow())
+        else:
+            pipeline.run_workflow()
+        total = time.perf_counter() - start
+
+        summary = pipeline.metrics.summary()
+        phases = {name: summary[name]["total_s"] for name in PHASES if name in summary}
+        exported = json.loads(pipeline.exporter.path("json").read_text(encoding="utf-8"))
+        fetch_time = phases.get("fetch_subjects", 0.0)
+        return {
+            "subjects": subjects,
+            "activities": activities,
+            "latency_ms": latency_ms,
+            "engine": engine,
+            "overrides": overrides or {},
+            "total_s": total,
+            "phases_s": phases,
+            "pages_per_second": len(exported) / fetch_time if fetch_time else 0.0,
+            "subjects_exported": len(exported),
+            "portal_requests": portal.requests,
+            "webdriver_commands": pipeline.metrics.counters["webdriver_commands"],
+            "startup_to_first_get_s": pipeline.metrics.gauges.get("startup_to_first_get_s", 0.0),
+            "driver_source": pipeline.driver_resolver.source,
+        }
+
+
+def print_report(result: dict[str, Any]) -> None:
+    """Exibe o resultado de um benchmark no terminal."""
+    echo(
+        f"Benchmark: {result['subjects']} disciplinas x {result['activities']} atividades, "
+        f"latência {result['latency_ms']:.0f} ms, motor {result['engine']}, "
+        f"opções {result['overrides']}",
+        "time",
+    )
+    for name, elapsed in result["phases_s"].items():
+        echo(f"{name:<30} {elapsed * 1000:>10.1f} ms", "bullet")
+    echo(f"{'total':<30} {result['total_s'] * 1000:>10.1f} ms", "arrow")
+    echo(
+        f"{result['pages_per_second']:.2f} páginas/s, "
+        f"{result['subjects_exported']} disciplinas exportadas, "
+        f"{result['portal_requests']} requisições ao portal, "
+        f"{result['webdriver_commands']} comandos ao WebDriver",
+        "success",
+    )
+
+
+def _parse_args() -> argparse.Namespace:
+    """Lê os argumentos de linha de comando do benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark do pipeline no portal simulado.")
+    parser.add_argument("--subjects", type=int, default=8, help="Quantidade de disciplinas.")
+    parser.add_argument("--activities", type=int, default=30, help="Atividades por disciplina.")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Latência por requisição.")
+    parser.add_argument(
+        "--engine", choices=["sync", "async"], default="sync", help="Motor do pipeline."
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Quantidade de execuções.")
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="CHAVE=VALOR",
+        help="Sobrescreve uma configuração do pipeline (valor em YAML), ex.: --set pool_size=4.",
+    )
+    parser.add_argument("--output", type=Path, help="Arquivo JSON para salvar os resultados.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Executa o benchmark a partir da linha de comando."""
+    args = _parse_args()
+    overrides: dict[str, Any] = {}
+    for item in args.set:
+        key, _, value = item.partition("=")
+        overrides[key] = yaml.safe_load(value)
+
+    results = []
+    for _ in range(args.repeat):
+        result = run_benchmark(
+            args.subjects, args.activities, args.latency_ms, overrides, args.engine
+        )
+        print_report(result)
+        results.append(result)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=4), encoding="utf-8")
+        echo(f"Resultados salvos em '{args.output}'", "success")
+
+
+if __name__ == "__main__":
+    main()
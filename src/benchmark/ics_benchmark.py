@@ -0,0 +1,140 @@
+"""Micro-benchmark da geração do ICS: template compilado em fluxo contra a montagem em memória."""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.common.echo import echo
+from src.config.constants import BRT
+
+ICS_TEMPLATE: Path = Path("./src/config/files/ics_template.ics")
+"""Template ICS usado pelo pipeline."""
+
+CONFIG: dict[str, str] = {
+    "nome_aluno": "Aluno Benchmark",
+    "semestre": "1o",
+    "nome_curso": "Curso Benchmark",
+}
+"""Campos do cabeçalho do calendário."""
+
+
+def build_subjects(subjects: int, activities: int) -> dict[str, Any]:
+    """Monta disciplinas sintéticas com atividades de um e de vários dias."""
+    return {
+        f"Disciplina {index:04d}, turma A": {
+            "link_disciplina": f"https://portal.invalid/disciplina/{index}",
+            "atividades": [
+                {
+                    "tipo_atividade": "Avaliação Virtual",
+                    "nome_atividade": f"Atividade {activity}; unidade {activity % 4 + 1}",
+                    "periodo": (
+                        f"{activity % 28 + 1:02d}/03/25 - {activity % 28 + 1:02d}/03/25"
+                        if activity % 3 == 0
+                        else f"{activity % 28 + 1:02d}/03/25 - {activity % 28 + 1:02d}/06/25"
+                    ),
+                }
+                for activity in range(activities)
+            ],
+        }
+        for index in range(subjects)
+    }
+
+
+def legacy_generate(informacoes: dict[str, Any], output_path: Path) -> None:
+    """Reproduz a geração anterior: template relido, `str.format` por evento e texto único."""
+    template = ICS_TEMPLATE.read_text(encoding="utf-8").strip()
+    header, event_template = template.split("BEGIN:VEVENT", 1)
+    event_template = "BEGIN:VEVENT" + event_template
+    header = header.format(**CONFIG).strip()
+
+    def convert(date_str: str) -> str:
+        return datetime.strptime(date_str, "%d%m%y").replace(tzinfo=BRT).strftime("%Y%m%d")
+
+    eventos = []
+    for disciplina, dados in informacoes.items():
+        for atividade in dados["atividades"]:
+            periodo = str(atividade["periodo"]).split(" - ")
+            inicio = convert(periodo[0].replace("/", ""))
+            fim = convert(periodo[1].replace("/", ""))
+            eventos.append(
+                event_template.format(
+                    tipo_periodo="Início",
+                    nome_atividade=atividade["nome_atividade"],
+                    data_periodo=inicio,
+                    disciplina=disciplina,
+                )
+            )
+            if inicio != fim:
+                eventos.append(
+                    event_template.format(
+                        tipo_periodo="Fim",
+                        nome_atividade=atividade["nome_atividade"],
+                        data_periodo=fim,
+                        disciplina=disciplina,
+                    )
+                )
+
+    ics_content = f"{header}\n" + "\n".join(eventos) + "\nEND:VCALENDAR\n"
+    with output_path.open("w", encoding="utf-8") as ics_file:
+        ics_file.write(ics_content)
+
+
+def streaming_generate(informacoes: dict[str, Any], output_path: Path) -> None:
+    """Gera o calendário com o `IcsWriter`, incluindo a compilação do template e os registros."""
+    from src.pipeline.ics_writer import IcsWriter  # noqa: PLC0415
+    from src.pipeline.records import subjects_from_dict  # noqa: PLC0415
+
+    IcsWriter(ICS_TEMPLATE).write(subjects_from_dict(informacoes), output_path, CONFIG)
+
+
+def measure(
+    generate: Callable[[dict[str, Any], Path], None], informacoes: dict[str, Any], repeat: int
+) -> dict[str, float]:
+    """Retorna o melhor tempo, o pico de memória alocada e o tamanho do arquivo gerado."""
+    with tempfile.TemporaryDirectory(prefix="ics_benchmark_") as directory:
+        output_path = Path(directory) / "calendario.ics"
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            generate(informacoes, output_path)
+            best = min(best, time.perf_counter() - start)
+
+        # Mede a memória em uma execução separada, pois o tracemalloc distorce o tempo
+        tracemalloc.start()
+        generate(informacoes, output_path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {"best_s": best, "peak_bytes": peak, "file_bytes": output_path.stat().st_size}
+
+
+def main() -> None:
+    """Compara as duas gerações a partir da linha de comando."""
+    parser = argparse.ArgumentParser(description="Micro-benchmark da geração do arquivo ICS.")
+    parser.add_argument("--subjects", type=int, default=200, help="Quantidade de disciplinas.")
+    parser.add_argument("--activities", type=int, default=100, help="Atividades por disciplina.")
+    parser.add_argument("--repeat", type=int, default=3, help="Execuções cronometradas.")
+    args = parser.parse_args()
+
+    informacoes = build_subjects(args.subjects, args.activities)
+    echo(
+        f"Benchmark ICS: {args.subjects} disciplinas x {args.activities} atividades, "
+        f"melhor de {args.repeat} execuções",
+        "time",
+    )
+    for name, generate in (("legado", legacy_generate), ("fluxo", streaming_generate)):
+        result = measure(generate, informacoes, args.repeat)
+        echo(
+            f"{name:<8} {result['best_s'] * 1000:>10.1f} ms "
+            f"{result['peak_bytes'] / 2**20:>8.2f} MiB de pico "
+            f"{result['file_bytes'] / 2**20:>8.2f} MiB em disco",
+            "bullet",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Analisador dos logs estruturados: percentis de latência de cada etapa entre execuções."""
+
+import argparse
+import json
+import statistics
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from src.common.echo import echo
+
+PERCENTILES: tuple[int, ...] = (50, 95, 99)
+"""Percentis exibidos para cada etapa."""
+
+GROUP_FIELDS: tuple[str, ...] = ("phase", "account", "run_id", "subject")
+"""Campos aceitos em `--by`, combinados à etapa no agrupamento."""
+
+
+def log_files(paths: Iterable[Path]) -> Iterator[Path]:
+    """Expande os diretórios nos arquivos de log, incluindo os rotacionados (`app.log.1`)."""
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(file for file in path.glob("*.log*") if file.is_file())
+        else:
+            yield path
+
+
+def span_records(files: Iterable[Path]) -> Iterator[dict[str, Any]]:
+    """Gera os registros de conclusão de etapa, ignorando linhas em texto ou malformadas."""
+    for file in files:
+        with file.open(encoding="utf-8", errors="replace") as lines:
+            for line in lines:
+                if not line.startswith("{"):
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("event") == "span" and record.get("elapsed_ms") is not None:
+                    yield record
+
+
+def percentile_table(records: Iterable[dict[str, Any]], by: str) -> list[dict[str, Any]]:
+    """Agrupa as durações por etapa (e pelo campo de `--by`) e calcula os percentis."""
+    durations: dict[tuple[str, ...], list[float]] = {}
+    runs: dict[tuple[str, ...], set[str]] = {}
+    for record in records:
+        key = (str(record.get("phase")),)
+        if by != "phase":
+            key = (*key, str(record.get(by)))
+        durations.setdefault(key, []).append(float(record["elapsed_ms"]))
+        runs.setdefault(key, set()).add(str(record.get("run_id")))
+
+    table = []
+    for key, values in sorted(durations.items()):
+        # Com uma única amostra, todos os percentis são a própria duração
+        cuts = (
+            statistics.quantiles(values, n=100, method="inclusive")
+            if len(values) > 1
+            else [values[0]] * 99
+        )
+        table.append(
+            {
+                "phase": key[0],
+                **({by: key[1]} if by != "phase" else {}),
+                "runs": len(runs[key]),
+                "count": len(values),
+                **{f"p{percentile}_ms": cuts[percentile - 1] for percentile in PERCENTILES},
+                "max_ms": max(values),
+            }
+        )
+    return table
+
+
+def main() -> None:
+    """Lê os logs informados e exibe os percentis a partir da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Percentis de latência por etapa a partir dos logs estruturados (JSON)."
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="Arquivos ou diretórios de log.")
+    parser.add_argument(
+        "--by", choices=GROUP_FIELDS, default="phase", help="Campo agrupado junto à etapa."
+    )
+    parser.add_argument("--output", type=Path, help="Arquivo JSON onde salvar a tabela.")
+    args = parser.parse_args()
+
+    table = percentile_table(span_records(log_files(args.paths)), args.by)
+    if not table:
+        echo("Nenhum registro de etapa encontrado; use `logger.file.format: json`.", "warn")
+        return
+
+    echo(f"Latência por etapa em {sum(row['count'] for row in table)} registros:", "time")
+    for row in table:
+        label = row["phase"] if args.by == "phase" else f"{row['phase']} [{row[args.by]}]"
+        echo(
+            f"{label:<40} {row['count']:>6}x em {row['runs']:>3} execuções "
+            + " ".join(f"p{p}={row[f'p{p}_ms']:>9.1f} ms" for p in PERCENTILES),
+            "bullet",
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(table, ensure_ascii=False, indent=4), encoding="utf-8")
+        echo(f"Tabela salva em '{args.output}'", "success")
+
+
+if __name__ == "__main__":
+    main()
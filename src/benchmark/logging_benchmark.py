@@ -0,0 +1,95 @@
+"""Micro-benchmark do custo de cada chamada de log nos modos síncrono e com fila."""
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+from src.common.echo import echo
+from src.infrastructure.logger import LoggerSingleton
+
+
+def _config(log_path: Path, *, queue: bool, max_bytes: int) -> dict[str, Any]:
+    """Monta a configuração do logger para um modo do benchmark."""
+    return {
+        "logger": {
+            "file": {
+                "enabled": True,
+                "level": "DEBUG",
+                "path": str(log_path),
+                "max_bytes": max_bytes,
+                "backup_count": 2,
+            },
+            "console": {"level": "INFO"},
+            "queue": queue,
+        }
+    }
+
+
+def measure(mode: str, calls: int, threads: int, max_bytes: int) -> dict[str, float]:
+    """Retorna o custo por chamada, no chamador, e o tempo até a gravação completa."""
+    with (
+        tempfile.TemporaryDirectory(prefix="logging_benchmark_") as directory,
+        redirect_stderr(StringIO()),
+    ):
+        # O console é redirecionado para a memória para medir apenas o custo do logging
+        logger = LoggerSingleton.reconfigure(
+            _config(Path(directory) / "app.log", queue=mode == "queue", max_bytes=max_bytes)
+        )
+        per_thread = calls // threads
+
+        def work(worker: int) -> None:
+            for index in range(per_thread):
+                logger.info(f"Informações da disciplina '{worker}-{index}' capturadas.")
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(work, range(threads)))
+        caller = time.perf_counter() - start
+        LoggerSingleton.flush()
+        total = time.perf_counter() - start
+        LoggerSingleton.shutdown()
+
+    return {
+        "us_per_call": caller / (per_thread * threads) * 1e6,
+        "caller_s": caller,
+        "total_s": total,
+    }
+
+
+def main() -> None:
+    """Compara os modos de logging a partir da linha de comando."""
+    parser = argparse.ArgumentParser(description="Micro-benchmark do logging do pipeline.")
+    parser.add_argument("--calls", type=int, default=20000, help="Chamadas de log por execução.")
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 4], help="Threads que registram em paralelo."
+    )
+    parser.add_argument(
+        "--max-bytes", type=int, default=0, help="Rotação do arquivo de log (0 desativa)."
+    )
+    args = parser.parse_args()
+
+    results = [
+        (mode, threads, measure(mode, args.calls, threads, args.max_bytes))
+        for threads in args.threads
+        for mode in ("sync", "queue")
+    ]
+    # Restaura o logger padrão antes de exibir os resultados
+    LoggerSingleton.reconfigure(LoggerSingleton().get_default_config())
+
+    echo(f"Benchmark de logging: {args.calls} chamadas por execução", "time")
+    for mode, threads, result in results:
+        echo(
+            f"{mode:<6} {threads:>2} threads {result['us_per_call']:>8.2f} us/chamada "
+            f"{result['caller_s'] * 1000:>8.1f} ms no chamador "
+            f"{result['total_s'] * 1000:>8.1f} ms até gravar",
+            "bullet",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Módulo do portal Colaborar simulado, servido localmente para testes de desempenho."""
+
+import hashlib
+import secrets
+import threading
+import time
+from datetime import date, timedelta
+from html import escape
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+from urllib.parse import parse_qs, urlsplit
+
+ACTIVITY_TYPES: tuple[str, ...] = (
+    "Portfólio",
+    "Avaliação Virtual",
+    "Prova Presencial da Disciplina",
+    "Leitura",
+    "Teleaula",
+    "Conteúdo WEB",
+)
+"""Tipos de atividade gerados nas linhas do tempo, alternados em sequência."""
+
+SESSION_COOKIE: str = "MOCKSESSIONID"
+"""Nome do cookie de sessão emitido pelo login simulado."""
+
+
+class MockPortal:
+    """Servidor HTTP que reproduz as páginas e seletores usados pelo pipeline."""
+
+    def __init__(
+        self,
+        subjects: int = 8,
+        activities: int = 30,
+        latency_ms: float = 0,
+        course_name: str = "Curso Simulado",
+        matricula: str = "123456",
+    ) -> None:
+        """Inicializa o portal com a quantidade de disciplinas, atividades e a latência."""
+        self.subjects = subjects
+        """Quantidade de disciplinas listadas na página do curso."""
+
+        self.activities = activities
+        """Quantidade de atividades na linha do tempo de cada disciplina."""
+
+        self.latency = latency_ms / 1000
+        """Latência, em segundos, adicionada a cada resposta."""
+
+        self.course_name = course_name
+        """Nome do curso exibido no botão de acesso."""
+
+        self.matricula = matricula
+        """Matrícula usada nas URLs do curso."""
+
+        self.sessions: set[str] = set()
+        """Tokens de sessão emitidos pelo login."""
+
+        self.requests = 0
+        """Quantidade de requisições atendidas."""
+
+        self._lock = threading.Lock()
+        """Protege as sessões e o contador de requisições."""
+
+        self._server: ThreadingHTTPServer | None = None
+        """Servidor HTTP em execução."""
+
+        self._thread: threading.Thread | None = None
+        """Thread que atende as requisições do servidor."""
+
+    @property
+    def base_url(self) -> str:
+        """Retorna a URL base do servidor em execução."""
+        if self._server is None:
+            raise RuntimeError("O portal simulado não foi iniciado.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def index_url(self) -> str:
+        """Retorna a URL da página inicial do aluno, equivalente a `colaborar_index_url`."""
+        return f"{self.base_url}/aluno/timeline/index"
+
+    def start(self) -> Self:
+        """Inicia o servidor em uma porta livre do localhost."""
+        handler = type("MockPortalHandler", (_MockPortalHandler,), {"portal": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Encerra o servidor."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+
+    def __enter__(self) -> Self:
+        """Inicia o servidor ao entrar no bloco `with`."""
+        return self.start()
+
+    def __exit__(self, *_: object) -> None:
+        """Encerra o servidor ao sair do bloco `with`."""
+        self.stop()
+
+    def settings(self) -> dict[str, Any]:
+        """Retorna as configurações do pipeline apontadas para o portal simulado."""
+        return {
+            "usuario": "00000000000",
+            "senha": "senha",
+            "matricula": self.matricula,
+            "nome_curso": self.course_name,
+            "semestre": "1o",
+            "nome_aluno": "Aluno Simulado",
+            "colaborar_url": f"{self.base_url}/login/auth",
+            "colaborar_index_url": self.index_url,
+            "atividades_ignoradas": ["Conteúdo WEB", "Leitura", "Teleaula"],
+            "session_cache_minutes": 0,
+        }
+
+    def create_session(self) -> str:
+        """Emite um novo token de sessão."""
+        token = secrets.token_hex(16)
+        with self._lock:
+            self.sessions.add(token)
+        return token
+
+    def count_request(self) -> None:
+        """Incrementa o contador de requisições atendidas."""
+        with self._lock:
+            self.requests += 1
+
+    def login_page(self) -> str:
+        """Retorna a página de login com aviso de cookies."""
+        return f"""<!DOCTYPE html>
+<html><head><title>Login</title></head><body>
+<div id="cookies-banner">Este site usa cookies.
+  <button id="btnCookiesAuth" type="button"
+    onclick="document.getElementById('cookies-banner').style.display='none'">OK</button>
+</div>
+<form method="post" action="/login/auth">
+  <input id="username" name="username" type="text">
+  <input id="password" name="password" type="password">
+  <input type="hidden" name="matricula" value="{self.matricula}">
+  <button class="btn btn-primary btn-lg btn-block mb-10" type="submit">Entrar</button>
+</form>
+</body></html>"""
+
+    def dashboard_page(self) -> str:
+        """Retorna o painel do aluno com o botão de acesso ao curso."""
+        course_url = f"/aluno/timeline/index/{self.matricula}"
+        return f"""<!DOCTYPE html>
+<html><head><title>Dashboard</title></head><body>
+<button class="btn btn-primary entrar" title="Entrar em {escape(self.course_name)}"
+  onclick="window.location.href='{course_url}'">Entrar</button>
+</body></html>"""
+
+    def course_page(self) -> str:
+        """Retorna a página do curso com a lista de disciplinas."""
+        items = [
+            (
+                f'<li class="atividadesCronograma"><a class="atividadeNome" '
+                f'href="/aluno/timeline/index/{self.matricula}" title="Todas">Todas</a></li>'
+            )
+        ]
+        items.extend(
+            f'<li class="atividadesCronograma"><a class="atividadeNome" '
+            f'href="/aluno/timeline/index/{self.matricula}/disciplina/{index}" '
+            f'title="Disciplina {index:02d}">Disciplina {index:02d}</a></li>'
+            for index in range(1, self.subjects + 1)
+        )
+        return f"""<!DOCTYPE html>
+<html><head><title>Curso</title></head><body>
+<ul class="cronograma">{"".join(items)}</ul>
+</body></html>"""
+
+    def subject_page(self, subject: int) -> str:
+        """Retorna a linha do tempo de uma disciplina."""
+        inicio = date(2025, 2, 3)
+        items = []
+        for index in range(self.activities):
+            tipo = ACTIVITY_TYPES[index % len(ACTIVITY_TYPES)]
+            start = inicio + timedelta(days=index * 3)
+            end = start + timedelta(days=7 + index % 5)
+            items.append(
+                f"""<li class="atividades">
+  <div class="timeline-panel"><div class="timeline-heading">
+    <h4 class="timeline-title">{tipo}<br>
+      <small>Atividade {index + 1:03d} - Disciplina {subject:02d}</small></h4>
+    <p><small class="text-muted"><i class="fa fa-clock"></i>
+      <em>{start:%d/%m/%y} - {end:%d/%m/%y}</em></small></p>
+  </div></div>
+</li>"""
+            )
+        return f"""<!DOCTYPE html>
+<html><head><title>Disciplina {subject:02d}</title></head><body>
+<ul id="js-activities-container" class="timeline">{"".join(items)}</ul>
+</body></html>"""
+
+
+class _MockPortalHandler(BaseHTTPRequestHandler):
+    """Atende as rotas do portal simulado."""
+
+    portal: MockPortal
+    """Portal simulado ao qual o handler está associado."""
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Silencia o log de acesso do servidor."""
+
+    def _authenticated(self) -> bool:
+        """Indica se a requisição traz um cookie de sessão válido."""
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookies.get(SESSION_COOKIE)
+        return morsel is not None and morsel.value in self.portal.sessions
+
+    def _send_html(self, html: str, status: HTTPStatus = HTTPStatus.OK) -> None:
+        """Envia uma página HTML com ETag, respondendo 304 quando o cliente já a possui."""
+        body = html.encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if status == HTTPStatus.OK and self.headers.get("If-None-Match") == etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _redirect(self, location: str, cookie: str | None = None) -> None:
+        """Redireciona para outra rota, opcionalmente definindo o cookie de sessão."""
+        self.send_response(HTTPStatus.FOUND)
+        self.send_header("Location", location)
+        if cookie is not None:
+            self.send_header("Set-Cookie", f"{SESSION_COOKIE}={cookie}; Path=/; HttpOnly")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        """Atende as páginas de login, painel, curso e disciplinas."""
+        self.portal.count_request()
+        time.sleep(self.portal.latency)
+        path = urlsplit(self.path).path.rstrip("/")
+        course_path = f"/aluno/timeline/index/{self.portal.matricula}"
+
+        if path in {"", "/favicon.ico"}:
+            self._send_html("<!DOCTYPE html><html><body></body></html>")
+        elif path == "/login/auth":
+            self._send_html(self.portal.login_page())
+        elif not self._authenticated():
+            self._redirect("/login/auth")
+        elif path == "/aluno/dashboard/index":
+            self._send_html(self.portal.dashboard_page())
+        elif path == course_path:
+            self._send_html(self.portal.course_page())
+        elif path.startswith(f"{course_path}/disciplina/"):
+            subject = path.rsplit("/", 1)[-1]
+            if not subject.isdigit() or not 1 <= int(subject) <= self.portal.subjects:
+                self._send_html("Disciplina não encontrada", HTTPStatus.NOT_FOUND)
+                return
+            self._send_html(self.portal.subject_page(int(subject)))
+        else:
+            self._send_html("Página não encontrada", HTTPStatus.NOT_FOUND)
+
+    def do_POST(self) -> None:
+        """Atende o envio do formulário de login."""
+        self.portal.count_request()
+        time.sleep(self.portal.latency)
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+
+        if urlsplit(self.path).path != "/login/auth" or not form.get("username"):
+            self._redirect("/login/auth")
+            return
+
+        token = self.portal.create_session()
+        self._redirect(f"/aluno/dashboard/index?matriculaId={self.portal.matricula}", cookie=token)
@@ -0,0 +1,83 @@
+"""Benchmark de memória das disciplinas: dicionários do JSON contra os registros tipados."""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from src.benchmark.ics_benchmark import build_subjects
+from src.common.echo import echo
+
+ACTIVITY_TYPES: tuple[str, ...] = (
+    "Avaliação Virtual",
+    "Atividade de Aprendizagem",
+    "Prova Presencial",
+    "Fórum",
+)
+"""Tipos de atividade que se repetem entre as disciplinas, como no portal."""
+
+
+def build_payload(subjects: int, activities: int) -> str:
+    """Monta o texto de `informacoes_disciplinas.json` com tipos de atividade variados."""
+    informacoes = build_subjects(subjects, activities)
+    for dados in informacoes.values():
+        for index, atividade in enumerate(dados["atividades"]):
+            atividade["tipo_atividade"] = ACTIVITY_TYPES[index % len(ACTIVITY_TYPES)]
+    return json.dumps(informacoes, ensure_ascii=False)
+
+
+def load_dicts(payload: str) -> Any:
+    """Carrega as disciplinas como dicionários aninhados, como antes dos registros."""
+    return json.loads(payload)
+
+
+def load_records(payload: str) -> Any:
+    """Carrega as disciplinas como registros, descartando os dicionários do JSON."""
+    from src.pipeline.records import subjects_from_dict  # noqa: PLC0415
+
+    return subjects_from_dict(json.loads(payload))
+
+
+def retained_bytes(load: Callable[[str], Any], payload: str) -> tuple[int, int]:
+    """Retorna a memória mantida pelas disciplinas carregadas e o pico durante a carga."""
+    gc.collect()
+    tracemalloc.start()
+    loaded = load(payload)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return current, peak
+
+
+def main() -> None:
+    """Compara a memória das duas representações a partir da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Memória das disciplinas em dicionários e em registros tipados."
+    )
+    parser.add_argument("--subjects", type=int, default=200, help="Quantidade de disciplinas.")
+    parser.add_argument("--activities", type=int, default=100, help="Atividades por disciplina.")
+    args = parser.parse_args()
+
+    payload = build_payload(args.subjects, args.activities)
+    # Aquece o cache de períodos e os módulos, que não fazem parte da memória das disciplinas
+    load_records(payload)
+
+    total = args.subjects * args.activities
+    echo(f"Memória de {args.subjects} disciplinas x {args.activities} atividades:", "time")
+    results = {}
+    for name, load in (("dicts", load_dicts), ("registros", load_records)):
+        current, peak = retained_bytes(load, payload)
+        results[name] = current
+        echo(
+            f"{name:<10} {current / 2**20:>8.2f} MiB mantidos "
+            f"({current / total:>6.0f} B por atividade) {peak / 2**20:>8.2f} MiB de pico",
+            "bullet",
+        )
+    echo(f"Redução: {1 - results['registros'] / results['dicts']:.0%}", "success")
+
+
+if __name__ == "__main__":
+    main()
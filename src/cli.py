@@ -0,0 +1,203 @@
+"""Interface de linha de comando com os subcomandos `scrape`, `replay`, `export` e `bench`.
+
+Os módulos pesados (selenium, webdriver-manager, exportadores) são importados apenas pelo
+subcomando que os usa, e o `settings.yaml` é lido uma única vez e repassado ao logger e ao
+pipeline. O `export` registra apenas no console, sem arquivo de log nem fila.
+"""
+
+import argparse
+import sys
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from src.common.echo import echo
+from src.common.errors.errors import SettingsError
+from src.config.constants import ICS_TEMPLATE_FILE, OUTPUT_DIR, SETTINGS_FILE
+
+BENCHMARKS: dict[str, str] = {
+    "portal": "src.benchmark.harness",
+    "ics": "src.benchmark.ics_benchmark",
+    "logging": "src.benchmark.logging_benchmark",
+    "logs": "src.benchmark.log_analyzer",
+    "records": "src.benchmark.records_benchmark",
+}
+"""Benchmarks disponíveis em `bench`, mapeados ao módulo executado."""
+
+EXIT_INTERRUPTED: int = 130
+"""Código de saída quando o usuário interrompe a execução."""
+
+
+def _configure_logger(settings: Mapping[str, Any], *, console_only: bool = False) -> None:
+    """Configura o logger com as configurações já lidas, sem reabrir o arquivo."""
+    from src.infrastructure.logger import LoggerSingleton  # noqa: PLC0415
+
+    if console_only:
+        # Sem arquivo nem fila, o logger não abre o log nem carrega `logging.handlers`
+        console = (settings.get("logger") or {}).get("console") or {"level": "INFO"}
+        file = {"enabled": False, "level": "DEBUG", "path": ""}
+        LoggerSingleton({"logger": {"console": console, "file": file}})
+    elif "logger" in settings:
+        LoggerSingleton(settings)
+    else:
+        LoggerSingleton.get_logger()
+
+
+def _scrape(args: argparse.Namespace, settings: Mapping[str, Any]) -> int:
+    """Executa o pipeline de uma conta, ou de todas as contas de `accounts` com `--batch`."""
+    if args.batch:
+        from src.pipeline.batch_runner import FAILED_STATUSES, BatchRunner  # noqa: PLC0415
+
+        results = BatchRunner(settings, max_workers=args.workers).run()
+        failed = sum(result["status"] in FAILED_STATUSES for result in results)
+        echo("Lote finalizado.", "info" if not failed else "warn")
+        return 1 if failed else 0
+
+    if args.engine == "async":
+        import asyncio  # noqa: PLC0415
+
+        from src.pipeline.async_scraper_pipeline import (  # noqa: PLC0415
+            AsyncSeleniumScraperPipeline,
+        )
+
+        pipeline = AsyncSeleniumScraperPipeline(settings, show_browser=args.show_browser)
+        asyncio.run(pipeline.run_workflow())
+    else:
+        from src.pipeline.selenium_scraper_pipeline import SeleniumScraperPipeline  # noqa: PLC0415
+
+        SeleniumScraperPipeline(settings, show_browser=args.show_browser).run_workflow()
+    echo("Script finalizado.", "info")
+    return 0
+
+
+def _replay(args: argparse.Namespace, settings: Mapping[str, Any]) -> int:
+    """Executa o pipeline sobre as capturas de HTML gravadas, sem abrir o navegador."""
+    args.batch = False
+    return _scrape(args, {**settings, "snapshot_mode": "replay"})
+
+
+def _export(args: argparse.Namespace, settings: Mapping[str, Any]) -> int:
+    """Regrava os formatos de exportação a partir do JSON salvo, sem selenium nem navegador."""
+    import json  # noqa: PLC0415
+
+    from src.pipeline.exporters import Exporter  # noqa: PLC0415
+    from src.pipeline.records import subjects_from_dict  # noqa: PLC0415
+
+    if not args.input.is_file():
+        echo(f"Arquivo de entrada não encontrado: '{args.input}'", "error")
+        return 1
+    with args.input.open(encoding="utf-8") as file:
+        subjects = subjects_from_dict(json.load(file))
+
+    exporter = Exporter(
+        args.output_dir,
+        args.formats or settings.get("export_formats"),
+        ics_template=ICS_TEMPLATE_FILE,
+    )
+    paths = exporter.export(subjects, settings)
+    echo(f"{len(paths)} formatos exportados em '{args.output_dir}'", "success")
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    """Executa um benchmark com os argumentos restantes da linha de comando."""
+    import importlib  # noqa: PLC0415
+
+    module = importlib.import_module(BENCHMARKS[args.benchmark])
+    # Os benchmarks leem `sys.argv`; o nome do subcomando é exibido na ajuda de cada um
+    sys.argv = [f"bench {args.benchmark}", *args.arguments]
+    module.main()
+    return 0
+
+
+def _add_pipeline_options(parser: argparse.ArgumentParser) -> None:
+    """Acrescenta as opções comuns a `scrape` e `replay`."""
+    parser.add_argument(
+        "--engine", choices=["sync", "async"], default="sync", help="Motor do pipeline."
+    )
+    parser.add_argument(
+        "--show-browser", action="store_true", help="Exibe o navegador (desativa o headless)."
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Monta o parser com os subcomandos."""
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Exporta as datas das atividades do portal Colaborar para ICS, JSON e YAML.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Os subcomandos que leem o `settings.yaml` compartilham a opção `--settings`
+    settings = argparse.ArgumentParser(add_help=False)
+    settings.add_argument(
+        "--settings",
+        type=Path,
+        default=SETTINGS_FILE,
+        help=f"Arquivo de configurações (padrão: {SETTINGS_FILE}).",
+    )
+
+    scrape = subparsers.add_parser(
+        "scrape", parents=[settings], help="Acessa o portal e exporta as atividades."
+    )
+    _add_pipeline_options(scrape)
+    scrape.add_argument(
+        "--batch", action="store_true", help="Executa todas as contas definidas em `accounts`."
+    )
+    scrape.add_argument("--workers", type=int, help="Processos do lote (padrão: núcleos de CPU).")
+
+    replay = subparsers.add_parser(
+        "replay", parents=[settings], help="Reprocessa as capturas de HTML gravadas."
+    )
+    _add_pipeline_options(replay)
+
+    export = subparsers.add_parser(
+        "export", parents=[settings], help="Regrava os formatos a partir do JSON salvo."
+    )
+    export.add_argument(
+        "--input",
+        type=Path,
+        default=OUTPUT_DIR / "informacoes_disciplinas.json",
+        help="JSON das disciplinas gerado por uma execução anterior.",
+    )
+    export.add_argument(
+        "--output-dir", type=Path, default=OUTPUT_DIR, help="Diretório dos arquivos gerados."
+    )
+    export.add_argument(
+        "--formats", nargs="+", help="Formatos exportados (padrão: `export_formats`)."
+    )
+
+    bench = subparsers.add_parser("bench", help="Executa um dos benchmarks do projeto.")
+    bench.add_argument("benchmark", choices=sorted(BENCHMARKS), help="Benchmark executado.")
+    bench.add_argument(
+        "arguments", nargs=argparse.REMAINDER, help="Argumentos repassados ao benchmark."
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Interpreta a linha de comando e executa o subcomando, `scrape` por padrão."""
+    arguments = list(sys.argv[1:] if argv is None else argv)
+    # Sem subcomando, mantém o comportamento anterior do `main.py`: executar o pipeline
+    if not arguments or (arguments[0].startswith("-") and arguments[0] not in {"-h", "--help"}):
+        arguments.insert(0, "scrape")
+    args = build_parser().parse_args(arguments)
+
+    try:
+        if args.command == "bench":
+            return _bench(args)
+
+        from src.config.settings import load_settings  # noqa: PLC0415
+
+        settings = load_settings(args.settings)
+        _configure_logger(settings, console_only=args.command == "export")
+        commands = {"scrape": _scrape, "replay": _replay, "export": _export}
+        return commands[args.command](args, settings)
+    except SettingsError as error:
+        echo(str(error), "error")
+    except RuntimeError:
+        echo("Ocorreu um erro", "error")
+    except KeyboardInterrupt:
+        echo("Script interrompido pelo usuário.", "warn")
+        return EXIT_INTERRUPTED
+    return 1
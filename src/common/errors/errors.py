@@ -7,3 +7,19 @@ class ProjectError(Exception):
 
 class LoggerError(ProjectError):
     """Exceção para erros relacionados à configuração do logger."""
+
+
+class DriverResolutionError(ProjectError):
+    """Exceção para falhas ao localizar o executável do chromedriver."""
+
+
+class CircuitOpenError(ProjectError):
+    """Exceção para chamadas ao portal bloqueadas pelo disjuntor aberto."""
+
+
+class PeriodFormatError(ProjectError):
+    """Exceção para períodos de atividade fora do formato `dd/mm/yy - dd/mm/yy`."""
+
+
+class SettingsError(ProjectError):
+    """Exceção para arquivos de configuração ausentes, malformados ou com valores inválidos."""
@@ -1,5 +1,6 @@
 """Módulo de definição de constantes globais para o projeto."""
 
+import time
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -23,3 +24,30 @@ OUTPUT_DIR: Path = Path("./data/output")
 
 IMAGE_DIR: Path = Path("./data/output/images")
 """Diretório de saída para imagens: `./data/output/images`"""
+
+ICS_TEMPLATE_FILE: Path = Path("./src/config/files/ics_template.ics")
+"""Template dos eventos do calendário: `./src/config/files/ics_template.ics`"""
+
+USER_AGENT: str = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/110.0.5481.77 Safari/537.36"
+)
+"""User-agent enviado pelo Chrome e pelas requisições HTTP feitas fora do navegador."""
+
+CACHE_DIR: Path = Path("./data/cache")
+"""Diretório de cache local entre execuções: `./data/cache`"""
+
+SESSION_CACHE_FILE: Path = CACHE_DIR / "session.json"
+"""Arquivo com os cookies da sessão autenticada: `./data/cache/session.json`"""
+
+SUBJECT_CACHE_FILE: Path = CACHE_DIR / "subjects.json"
+"""Arquivo com o resultado e a impressão digital das disciplinas: `./data/cache/subjects.json`"""
+
+DRIVER_CACHE_FILE: Path = CACHE_DIR / "chromedriver.json"
+"""Arquivo com o chromedriver resolvido por versão do Chrome: `./data/cache/chromedriver.json`"""
+
+HTML_DIR: Path = Path("./data/html")
+"""Diretório das capturas de HTML das páginas do portal: `./data/html`"""
+
+PROCESS_START: float = time.perf_counter()
+"""Instante, no relógio monotônico, em que as constantes do projeto foram carregadas."""
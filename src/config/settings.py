@@ -0,0 +1,218 @@
+"""Módulo das configurações: esquema tipado, validação, cache e variáveis de ambiente."""
+
+import os
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from threading import Lock
+from typing import Any, NamedTuple
+
+import yaml
+
+from src.common.errors.errors import SettingsError
+from src.config.constants import SETTINGS_FILE
+from src.config.constypes import PathLike
+
+ENV_PREFIX: str = "COLABORAR_"
+"""Prefixo das variáveis de ambiente que sobrescrevem as configurações (`COLABORAR_SENHA`)."""
+
+YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""Loader YAML seguro da libyaml em C, ou o loader em Python puro quando ela não está disponível."""
+
+
+class SettingField(NamedTuple):
+    """Campo tipado das configurações: tipo, valor padrão e restrições."""
+
+    type: type
+    """Tipo do valor depois da conversão (`str`, `int` ou `bool`)."""
+
+    default: Any
+    """Valor usado quando a chave não está no arquivo."""
+
+    choices: tuple[str, ...] = ()
+    """Valores aceitos; vazio aceita qualquer valor do tipo."""
+
+    minimum: int = 0
+    """Menor valor aceito nos campos inteiros."""
+
+    env: bool = False
+    """Indica se o campo pode ser sobrescrito pela variável de ambiente `COLABORAR_<CAMPO>`."""
+
+
+SCHEMA: dict[str, SettingField] = {
+    "usuario": SettingField(str, "", env=True),
+    "senha": SettingField(str, "", env=True),
+    "matricula": SettingField(str, "", env=True),
+    "nome_curso": SettingField(str, "", env=True),
+    "nome_aluno": SettingField(str, "", env=True),
+    "semestre": SettingField(str, ""),
+    "pool_size": SettingField(int, 1, minimum=1, env=True),
+    "prefetch_tabs": SettingField(int, 0, env=True),
+    "async_tabs": SettingField(int, 4, minimum=1, env=True),
+    "http_max_workers": SettingField(int, 16, minimum=1, env=True),
+    "session_cache_minutes": SettingField(int, 60),
+    "extraction_mode": SettingField(str, "element", choices=("element", "script")),
+    "fetch_engine": SettingField(str, "selenium", choices=("selenium", "http")),
+    "snapshot_mode": SettingField(str, "off", choices=("off", "record", "replay")),
+    "subject_cache": SettingField(bool, True),  # noqa: FBT003
+    "metrics_prometheus": SettingField(bool, False),  # noqa: FBT003
+}
+"""Campos tipados e validados na carga; as demais chaves são mantidas como no arquivo."""
+
+_cache: dict[Path, tuple[tuple[Any, ...], "Settings"]] = {}
+"""Configurações carregadas por caminho, com a assinatura do arquivo e do ambiente."""
+
+_cache_lock = Lock()
+"""Protege o cache quando as configurações são carregadas em várias threads."""
+
+
+def _env_name(name: str) -> str:
+    """Retorna o nome da variável de ambiente de um campo."""
+    return f"{ENV_PREFIX}{name.upper()}"
+
+
+def _coerce(name: str, field: SettingField, value: Any) -> Any:
+    """Converte um valor do arquivo ou do ambiente para o tipo do campo."""
+    if field.type is str:
+        # O YAML 1.1 lê `off` como booleano; nos campos de escolha, ele volta a ser `off`
+        if value is False and "off" in field.choices:
+            return "off"
+        if isinstance(value, (str, int)) and not isinstance(value, bool):
+            return str(value)
+    elif field.type is int:
+        if isinstance(value, str) and value.strip().isdigit():
+            return int(value)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    elif field.type is bool:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.lower() in {"1", "true", "0", "false"}:
+            return value.lower() in {"1", "true"}
+    msg = f"'{name}' deve ser do tipo {field.type.__name__}, mas recebeu {value!r}"
+    raise SettingsError(msg)
+
+
+def _validate(name: str, field: SettingField, value: Any) -> Any:
+    """Converte o valor e verifica os valores aceitos e o mínimo do campo."""
+    value = _coerce(name, field, value)
+    if field.choices and value not in field.choices:
+        msg = f"'{name}' inválido: {value!r}; aceitos: {field.choices}"
+        raise SettingsError(msg)
+    if field.type is int and value < field.minimum:
+        msg = f"'{name}' deve ser maior ou igual a {field.minimum}, mas é {value}"
+        raise SettingsError(msg)
+    return value
+
+
+class Settings(Mapping[str, Any]):
+    """Configurações validadas, com os campos do esquema tipados e acesso de dicionário."""
+
+    __slots__ = ("_data", "path", *SCHEMA)
+
+    usuario: str
+    senha: str
+    matricula: str
+    nome_curso: str
+    nome_aluno: str
+    semestre: str
+    pool_size: int
+    prefetch_tabs: int
+    async_tabs: int
+    http_max_workers: int
+    session_cache_minutes: int
+    extraction_mode: str
+    fetch_engine: str
+    snapshot_mode: str
+    subject_cache: bool
+    metrics_prometheus: bool
+
+    def __init__(
+        self,
+        data: Mapping[str, Any],
+        path: Path | None = None,
+        environ: Mapping[str, str] | None = None,
+    ) -> None:
+        """Aplica as variáveis de `environ`, valida os campos e levanta `SettingsError`."""
+        environ = environ or {}
+        values = dict(data)
+        errors = []
+        for name, field in SCHEMA.items():
+            if field.env and _env_name(name) in environ:
+                values[name] = environ[_env_name(name)]
+            try:
+                value = _validate(name, field, values.get(name, field.default))
+            except SettingsError as error:
+                errors.append(str(error))
+                continue
+            setattr(self, name, value)
+            if name in values:
+                values[name] = value
+
+        accounts = values.get("accounts") or []
+        if not isinstance(accounts, list) or not all(isinstance(a, dict) for a in accounts):
+            errors.append("'accounts' deve ser uma lista de contas")
+        if errors:
+            source = f" em '{path}'" if path else ""
+            msg = f"Configurações inválidas{source}: " + "; ".join(errors)
+            raise SettingsError(msg)
+
+        self._data: dict[str, Any] = values
+        """Todas as chaves do arquivo, já com os campos convertidos e sobrescritos."""
+
+        self.path = path
+        """Arquivo de origem, ou `None` para configurações montadas em memória."""
+
+    def __getitem__(self, key: str) -> Any:
+        """Retorna o valor de uma chave, como em um dicionário."""
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Itera sobre as chaves do arquivo."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de chaves do arquivo."""
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        """Representa as configurações sem expor a senha."""
+        return f"Settings(path={str(self.path)!r}, keys={sorted(self._data)})"
+
+
+def load_settings(path: PathLike = SETTINGS_FILE) -> Settings:
+    """Carrega e valida as configurações, reaproveitando-as enquanto o arquivo não mudar."""
+    file_path = Path(path).resolve()
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError as error:
+        msg = f"Arquivo de configurações não encontrado: '{path}'"
+        raise SettingsError(msg) from error
+
+    # A assinatura inclui as variáveis de ambiente, que também alteram o resultado
+    environment = tuple(
+        os.environ.get(_env_name(name)) for name, field in SCHEMA.items() if field.env
+    )
+    signature = (stat.st_mtime_ns, stat.st_size, environment)
+    with _cache_lock:
+        cached = _cache.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        try:
+            with file_path.open(encoding="utf-8") as file:
+                data = yaml.load(file, Loader=YAML_LOADER) or {}  # noqa: S506
+        except yaml.YAMLError as error:
+            msg = f"Erro ao interpretar '{path}': {error}"
+            raise SettingsError(msg) from error
+        if not isinstance(data, dict):
+            msg = f"Esperado um dicionário em '{path}', mas recebeu: {type(data).__name__}"
+            raise SettingsError(msg)
+
+        settings = Settings(data, Path(path), os.environ)
+        _cache[file_path] = (signature, settings)
+        return settings
+
+
+def as_settings(config: Mapping[str, Any]) -> Settings:
+    """Valida um dicionário de configurações, reaproveitando um `Settings` já validado."""
+    return config if isinstance(config, Settings) else Settings(config)
@@ -0,0 +1,94 @@
+"""Módulo de contexto dos logs estruturados: execução, conta, disciplina e etapa atuais."""
+
+import json
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from types import MappingProxyType
+from typing import Any
+
+LOG_FIELDS: tuple[str, ...] = ("run_id", "account", "subject", "phase")
+"""Campos de correlação gravados em cada registro estruturado."""
+
+_context: ContextVar[MappingProxyType[str, Any]] = ContextVar(
+    "log_context", default=MappingProxyType({})
+)
+"""Campos do contexto atual, herdados por tarefas assíncronas e `asyncio.to_thread`."""
+
+_process_context: dict[str, Any] = {}
+"""Campos válidos em todas as threads do processo, como a execução e a conta."""
+
+
+def bind_process_context(**fields: Any) -> None:
+    """Define campos comuns a todas as threads do processo, inclusive as de pools."""
+    _process_context.update(fields)
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """Acrescenta campos ao contexto dos registros emitidos dentro do bloco."""
+    token = _context.set(MappingProxyType({**_context.get(), **fields}))
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+def current_log_context() -> dict[str, Any]:
+    """Retorna os campos do processo combinados aos do contexto atual."""
+    return {**_process_context, **_context.get()}
+
+
+class ContextFilter(logging.Filter):
+    """Copia o contexto para o registro na thread que o emitiu, antes de qualquer fila."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Anexa os campos de correlação ao registro e sempre o aceita."""
+        if not hasattr(record, "log_context"):
+            record.log_context = current_log_context()
+        return True
+
+
+class SpanRecordFilter(logging.Filter):
+    """Descarta os registros de conclusão de etapa, destinados apenas ao arquivo estruturado."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Aceita somente registros que não sejam de conclusão de etapa."""
+        return getattr(record, "event", None) != "span"
+
+
+class JsonFormatter(logging.Formatter):
+    """Formata cada registro como uma linha JSON com os campos de correlação."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serializa o registro, calculando `elapsed_ms` desde o início da etapa atual."""
+        context: dict[str, Any] = getattr(record, "log_context", None) or current_log_context()
+        elapsed_ms = getattr(record, "elapsed_ms", None)
+        if elapsed_ms is None and "phase_started" in context:
+            elapsed_ms = (record.created - context["phase_started"]) * 1000
+
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "module": record.module,
+            "line": record.lineno,
+            "message": record.getMessage(),
+            **{field: context.get(field) for field in LOG_FIELDS},
+            "elapsed_ms": round(elapsed_ms, 3) if elapsed_ms is not None else None,
+        }
+        if getattr(record, "event", None):
+            entry["event"] = record.event
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def phase_fields(name: str, attributes: dict[str, Any]) -> dict[str, Any]:
+    """Retorna os campos de contexto de uma etapa cronometrada."""
+    fields: dict[str, Any] = {"phase": name, "phase_started": time.time()}
+    if "disciplina" in attributes:
+        fields["subject"] = attributes["disciplina"]
+    return fields
@@ -0,0 +1,14 @@
+"""Módulo do handler de fila do logger, importado apenas quando `logger.queue` está ativo."""
+
+import logging
+from logging.handlers import QueueHandler
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Enfileira o registro sem formatá-lo, deixando a formatação para a thread de escrita."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve apenas os argumentos da mensagem, mantendo a exceção para o formatador."""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
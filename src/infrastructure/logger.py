@@ -1,17 +1,25 @@
 """Módulo de configuração e acesso ao logger singleton da aplicação."""
 
+import atexit
 import json
 import logging
 import warnings
-from typing import Any, ClassVar, Optional
-
-import yaml
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 from src.common.base.base_class import BaseClass
 from src.common.echo import echo
-from src.common.errors.errors import LoggerError
+from src.common.errors.errors import LoggerError, SettingsError
 from src.config.constants import SETTINGS_FILE
 from src.config.constypes import LoggerDict, PathLike
+from src.config.settings import load_settings
+from src.infrastructure.log_context import ContextFilter, JsonFormatter, SpanRecordFilter
+
+# `logging.handlers` importa socket e pickle; só é carregado com a rotação ou a fila ativas
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+LOG_FORMATS: tuple[str, ...] = ("text", "json")
+"""Formatos aceitos em `logger.file.format`."""
 
 
 class LoggerSingleton(BaseClass):
@@ -26,7 +34,13 @@ class LoggerSingleton(BaseClass):
     logger: logging.Logger | None = None
     """Logger configurado para uso na aplicação."""
 
-    def __new__(cls) -> "LoggerSingleton":
+    _listener: ClassVar["QueueListener | None"] = None
+    """Thread que grava os registros enfileirados no modo `queue`."""
+
+    structured: ClassVar[bool] = False
+    """Indica se o arquivo de log recebe linhas JSON, incluindo a conclusão de cada etapa."""
+
+    def __new__(cls, *_: Any) -> "LoggerSingleton":
         """Cria ou retorna a instância única da classe Singleton."""
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -85,8 +99,8 @@ class LoggerSingleton(BaseClass):
             return self.get_default_config()
         try:
             echo(f"Carregando configuração de logging: '{file_path}'", "info")
-            with file_path.open("r", encoding="utf-8") as file:
-                config: dict[str, dict] = yaml.safe_load(file)
+            # O arquivo é lido uma vez e compartilhado com o pipeline pelo cache de configurações
+            config = load_settings(file_path)
 
             # Validação das chaves esperadas
             required_keys = {"file", "console"}
@@ -95,7 +109,7 @@ class LoggerSingleton(BaseClass):
 
             echo("Configuração carregada com sucesso!", "success")
             super()._separator_line()
-        except (yaml.YAMLError, OSError) as e:
+        except (SettingsError, OSError) as e:
             echo(f"Erro ao carregar arquivo YAML: {e}. Usando configuração padrão.", "error")
             return self.get_default_config()
         else:
@@ -119,19 +133,29 @@ class LoggerSingleton(BaseClass):
     def _assign_config(self, config: LoggerDict) -> None:
         """Atribui as configurações do dicionário às variáveis da classe."""
         try:
-            optional_keys = {"suppress", "ignore_libs"}
-            for key in optional_keys:
-                if key not in config["logger"]:
-                    config["logger"][key] = []
+            # As chaves opcionais são lidas sem alterar a seção, que pode ser a das configurações
+            # em cache compartilhadas com o pipeline
             self.file_enabled: bool = bool(config["logger"]["file"]["enabled"])
             self.file_level: str = str(config["logger"]["file"]["level"])
             self.file_path: PathLike = str(config["logger"]["file"]["path"])
+            self.file_max_bytes: int = int(config["logger"]["file"].get("max_bytes", 0))
+            self.file_backup_count: int = int(config["logger"]["file"].get("backup_count", 5))
+            self.file_format: str = str(config["logger"]["file"].get("format", "text"))
             self.console_level: str = str(config["logger"]["console"]["level"])
-            self.suppress_list: list[str] = [str(item) for item in config["logger"]["suppress"]]
-            self.ignore_libs: list[str] = [str(lib) for lib in config["logger"]["ignore_libs"]]
+            self.queue_enabled: bool = bool(config["logger"].get("queue", False))
+            self.suppress_list: list[str] = [
+                str(item) for item in config["logger"].get("suppress", [])
+            ]
+            self.ignore_libs: list[str] = [
+                str(lib) for lib in config["logger"].get("ignore_libs", [])
+            ]
         except KeyError as e:
             echo(f"Erro ao atribuir as chaves do dicionário de configurações: {e}", "error")
             raise
+        if self.file_format not in LOG_FORMATS:
+            msg = f"Formato de log inválido: '{self.file_format}'; aceitos: {LOG_FORMATS}"
+            echo(msg, "error")
+            raise ValueError(msg)
 
     def _suppress_warnings(self) -> None:
         """Suprime warnings específicos e mensagens de bibliotecas configuradas."""
@@ -176,19 +200,59 @@ class LoggerSingleton(BaseClass):
         console_handler = logging.StreamHandler()
         console_handler.setLevel(getattr(logging, self.console_level, logging.INFO))
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers: list[logging.Handler] = [console_handler]
+        structured = False
 
-        # Handler de arquivo (opcional)
+        # Handler de arquivo (opcional), com rotação por tamanho quando `max_bytes` > 0
         if self.file_enabled and self.file_path:
             try:
                 file_path = super()._ensure_path(self.file_path)
-                file_handler = logging.FileHandler(file_path, encoding="utf-8")
+                file_handler: logging.Handler
+                if self.file_max_bytes > 0:
+                    from logging.handlers import RotatingFileHandler  # noqa: PLC0415
+
+                    file_handler = RotatingFileHandler(
+                        file_path,
+                        maxBytes=self.file_max_bytes,
+                        backupCount=self.file_backup_count,
+                        encoding="utf-8",
+                    )
+                else:
+                    file_handler = logging.FileHandler(file_path, encoding="utf-8")
                 file_handler.setLevel(getattr(logging, self.file_level, logging.DEBUG))
-                file_handler.setFormatter(formatter)
-                root_logger.addHandler(file_handler)
-            except OSError:
+                structured = self.file_format == "json"
+                file_handler.setFormatter(JsonFormatter() if structured else formatter)
+                handlers.append(file_handler)
+            except OSError as e:
                 console_handler.setLevel(logging.ERROR)
-                root_logger.exception("Erro ao configurar log de arquivo")
+                echo(f"Erro ao configurar log de arquivo: {e}", "error")
+
+        # A conclusão das etapas vai só para o arquivo JSON, sem poluir o console
+        if structured:
+            console_handler.addFilter(SpanRecordFilter())
+        LoggerSingleton.structured = structured
+
+        # No modo `queue`, o logger só enfileira; a formatação e a escrita ficam em uma thread
+        if self.queue_enabled:
+            from logging.handlers import QueueListener  # noqa: PLC0415
+            from queue import SimpleQueue  # noqa: PLC0415
+
+            from src.infrastructure.log_queue import DeferredQueueHandler  # noqa: PLC0415
+
+            queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+            listener = QueueListener(queue, *handlers, respect_handler_level=True)
+            listener.start()
+            LoggerSingleton._listener = listener
+            queue_handler = DeferredQueueHandler(queue)
+            # O contexto é copiado antes de enfileirar, pois as variáveis são da thread emissora
+            if structured:
+                queue_handler.addFilter(ContextFilter())
+            root_logger.addHandler(queue_handler)
+        else:
+            if structured:
+                handlers[-1].addFilter(ContextFilter())
+            for handler in handlers:
+                root_logger.addHandler(handler)
 
         self._suppress_warnings()
 
@@ -202,10 +266,45 @@ class LoggerSingleton(BaseClass):
                 "file_level": self.file_level,
                 "file_path": str(self.file_path),
                 "console_level": self.console_level,
+                "queue_enabled": self.queue_enabled,
+                "file_max_bytes": self.file_max_bytes,
+                "file_format": self.file_format,
                 "suppress_list": self.suppress_list,
             }
         )
 
+    @classmethod
+    def flush(cls) -> None:
+        """Grava os registros pendentes na fila e esvazia os buffers dos handlers."""
+        listener = cls._listener
+        if listener is not None:
+            # Parar a thread processa toda a fila; ela é reiniciada para os próximos registros
+            listener.stop()
+            listener.start()
+            handlers = listener.handlers
+        else:
+            handlers = tuple(logging.getLogger().handlers)
+        for handler in handlers:
+            handler.flush()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Encerra a thread de escrita do modo `queue`, gravando os registros pendentes."""
+        listener, cls._listener = cls._listener, None
+        if listener is None:
+            return
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+    @classmethod
+    def reconfigure(cls, config: dict[str, Any]) -> logging.Logger:
+        """Substitui a configuração atual do logger, encerrando a fila anterior."""
+        cls.shutdown()
+        cls._instance = None
+        cls(config)
+        return cls.get_logger()
+
     @classmethod
     def get_logger(cls) -> logging.Logger:
         """Instancia o logger, inicializando-o  com a configuração padrão se necessário."""
@@ -220,3 +319,7 @@ class LoggerSingleton(BaseClass):
             raise
         else:
             return cls._instance.logger
+
+
+# Garante que os registros ainda na fila sejam gravados ao encerrar o interpretador
+atexit.register(LoggerSingleton.shutdown)
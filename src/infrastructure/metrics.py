@@ -0,0 +1,194 @@
+"""Módulo de instrumentação do pipeline com spans cronometrados, contadores e exportação."""
+
+import json
+import time
+import uuid
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from src.common.base.base_class import BaseClass
+from src.common.echo import echo
+from src.config.constants import PROCESS_START
+from src.config.constypes import PathLike
+from src.infrastructure.log_context import log_context, phase_fields
+from src.infrastructure.logger import LoggerSingleton
+
+# O selenium é usado só na anotação, para que a exportação não dependa dele
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+
+class MetricsRecorder(BaseClass):
+    """Registra a duração de cada etapa do pipeline e contadores de uso do WebDriver."""
+
+    def __init__(self, run_id: str | None = None) -> None:
+        """Inicializa o registro de métricas de uma execução."""
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        """Identificador da execução, gravado junto às métricas."""
+
+        self.started_at = time.time()
+        """Horário de início da execução, em segundos desde a época."""
+
+        self.spans: list[dict[str, Any]] = []
+        """Spans concluídos, com nome, início relativo, duração e atributos."""
+
+        self.counters: Counter[str] = Counter()
+        """Contadores incrementados durante a execução."""
+
+        self.gauges: dict[str, float] = {}
+        """Valores pontuais registrados ao final de cada etapa."""
+
+        self._origin = time.perf_counter()
+        """Referência do relógio monotônico para o início relativo dos spans."""
+
+        self._lock = Lock()
+        """Protege os registros quando spans são abertos em várias threads."""
+
+    @contextmanager
+    def span(self, name: str, **attributes: str) -> Iterator[None]:
+        """Cronometra o bloco de código e registra o span ao final, mesmo em caso de erro."""
+        start = time.perf_counter()
+        try:
+            with log_context(**phase_fields(name, attributes)):
+                yield
+        finally:
+            end = time.perf_counter()
+            if LoggerSingleton.structured:
+                self._log_span(name, (end - start) * 1000, attributes)
+            with self._lock:
+                self.spans.append(
+                    {
+                        "name": name,
+                        "start_s": start - self._origin,
+                        "duration_s": end - start,
+                        "attributes": attributes,
+                    }
+                )
+
+    def _log_span(self, name: str, elapsed_ms: float, attributes: dict[str, str]) -> None:
+        """Grava a conclusão do span no log estruturado, com a etapa e a disciplina."""
+        with log_context(**phase_fields(name, attributes)):
+            LoggerSingleton.get_logger().info(
+                f"Etapa '{name}' concluída em {elapsed_ms:.1f} ms",
+                extra={"elapsed_ms": elapsed_ms, "event": "span"},
+            )
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Incrementa um contador."""
+        with self._lock:
+            self.counters[name] += value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Registra um valor pontual."""
+        with self._lock:
+            self.gauges[name] = value
+
+    def instrument_driver(self, driver: "webdriver.Chrome") -> None:
+        """Conta cada comando enviado ao WebDriver, no total e por tipo de comando."""
+        execute = driver.execute
+
+        def counted_execute(driver_command: str, params: dict | None = None) -> dict:
+            with self._lock:
+                self.counters["webdriver_commands"] += 1
+                self.counters[f"webdriver_command.{driver_command}"] += 1
+                # Registra o tempo desde o início do processo até a primeira navegação
+                if driver_command == "get" and "startup_to_first_get_s" not in self.gauges:
+                    self.gauges["startup_to_first_get_s"] = time.perf_counter() - PROCESS_START
+            return execute(driver_command, params)
+
+        driver.execute = counted_execute
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Agrega os spans por nome: quantidade, total, média, mínimo e máximo."""
+        durations: dict[str, list[float]] = {}
+        for span in self.spans:
+            durations.setdefault(span["name"], []).append(span["duration_s"])
+        return {
+            name: {
+                "count": len(values),
+                "total_s": sum(values),
+                "avg_s": sum(values) / len(values),
+                "min_s": min(values),
+                "max_s": max(values),
+            }
+            for name, values in durations.items()
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Retorna todas as métricas da execução em um dicionário serializável."""
+        return {
+            "run_id": self.run_id,
+            "started_at": self.started_at,
+            "elapsed_s": time.perf_counter() - self._origin,
+            "summary": self.summary(),
+            "counters": dict(self.counters),
+            "gauges": self.gauges,
+            "spans": self.spans,
+        }
+
+    def export_json(self, path: PathLike) -> None:
+        """Grava as métricas em um arquivo JSON."""
+        path = super()._ensure_path(path)
+        with path.open("w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=4)
+
+    def export_prometheus(self, path: PathLike) -> None:
+        """Grava as métricas no formato de texto do Prometheus."""
+        labels = f'run_id="{self.run_id}"'
+        lines = [
+            "# HELP scraper_phase_duration_seconds Duração das etapas do pipeline.",
+            "# TYPE scraper_phase_duration_seconds summary",
+        ]
+        for name, stats in self.summary().items():
+            lines.append(
+                f'scraper_phase_duration_seconds_sum{{{labels},phase="{name}"}} {stats["total_s"]}'
+            )
+            lines.append(
+                f'scraper_phase_duration_seconds_count{{{labels},phase="{name}"}} {stats["count"]}'
+            )
+
+        lines.extend(
+            [
+                "# HELP scraper_events_total Contadores de eventos do pipeline.",
+                "# TYPE scraper_events_total counter",
+            ]
+        )
+        lines.extend(
+            f'scraper_events_total{{{labels},name="{name}"}} {value}'
+            for name, value in sorted(self.counters.items())
+        )
+
+        lines.extend(
+            [
+                "# HELP scraper_gauge Valores pontuais registrados pelo pipeline.",
+                "# TYPE scraper_gauge gauge",
+            ]
+        )
+        lines.extend(
+            f'scraper_gauge{{{labels},name="{name}"}} {value}'
+            for name, value in sorted(self.gauges.items())
+        )
+
+        path = super()._ensure_path(path)
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def print_summary(self) -> None:
+        """Exibe no terminal uma tabela com a duração agregada de cada etapa."""
+        echo(f"Métricas da execução '{self.run_id}':", "time")
+        echo(f"{'etapa':<28} {'qtd':>5} {'total (ms)':>12} {'média (ms)':>12}", "blank")
+        for name, stats in self.summary().items():
+            echo(
+                f"{name:<28} {stats['count']:>5} {stats['total_s'] * 1000:>12.1f} "
+                f"{stats['avg_s'] * 1000:>12.1f}",
+                "bullet",
+            )
+        echo(f"Comandos enviados ao WebDriver: {self.counters['webdriver_commands']}", "arrow")
+        if "startup_to_first_get_s" in self.gauges:
+            echo(
+                f"Tempo do início até o primeiro driver.get: "
+                f"{self.gauges['startup_to_first_get_s'] * 1000:.1f} ms",
+                "arrow",
+            )
@@ -0,0 +1,192 @@
+"""Orquestrador assíncrono: captura várias disciplinas em abas simultâneas de um navegador."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from selenium.common.exceptions import TimeoutException
+
+from src.common.errors.errors import CircuitOpenError, ProjectError
+from src.config.constants import PROFILE_MODE
+from src.pipeline.records import Subject
+from src.pipeline.scripts import NAVIGATE_SCRIPT, PAGE_READY_SCRIPT
+from src.pipeline.selenium_scraper_pipeline import NAVIGATION_ERRORS, SeleniumScraperPipeline
+
+
+class AsyncSeleniumScraperPipeline(SeleniumScraperPipeline):
+    """Executa o mesmo fluxo do `SeleniumScraperPipeline` com `asyncio` e várias abas."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Inicializa o pipeline com a quantidade de abas usadas na captura das disciplinas."""
+        super().__init__(*args, **kwargs)
+
+        self.tabs = self.settings.async_tabs
+        """Quantidade de abas que carregam disciplinas ao mesmo tempo."""
+
+        self.poll_interval = 0.05
+        """Intervalo, em segundos, entre as verificações de carregamento de cada aba."""
+
+        self._driver_lock = asyncio.Lock()
+        """Serializa os comandos ao WebDriver, que atende uma aba de cada vez."""
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Executa uma chamada bloqueante em uma thread, sem travar o laço de eventos."""
+        return await asyncio.to_thread(func, *args)
+
+    async def _in_tab(self, handle: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Executa uma chamada ao WebDriver com a aba informada em foco."""
+        async with self._driver_lock:
+
+            def call() -> Any:
+                self.driver.switch_to.window(handle)
+                return func(*args)
+
+            return await self._call(call)
+
+    async def _fetch_subject_in_tab(
+        self,
+        handle: str,
+        disciplina: dict[str, str | Any],
+        atividades_ignoradas: list[str | Any],
+    ) -> dict[str, Any] | None:
+        """Carrega a disciplina em uma aba e extrai as atividades quando a página estiver pronta."""
+        link = disciplina["link"]
+        try:
+            with self.metrics.span("subject", disciplina=disciplina["nome"]):
+                self.logger.debug(f"Capturando informações da disciplina: {disciplina['nome']}")
+                atividades = await self.retry_policy.call_async(
+                    "subject",
+                    lambda: self._load_subject_in_tab(handle, disciplina, atividades_ignoradas),
+                    retry_on=NAVIGATION_ERRORS,
+                )
+        except CircuitOpenError:
+            self.logger.warning(f"Disciplina '{disciplina['nome']}' ignorada: disjuntor aberto")
+            return None
+        except (RuntimeError, *NAVIGATION_ERRORS):
+            self.logger.exception(
+                f"Erro ao capturar informações da disciplina '{disciplina['nome']}'"
+            )
+            return None
+
+        self.logger.info(f"Informações da disciplina '{disciplina['nome']}' capturadas.")
+        return {
+            "link_disciplina": link,
+            "atividades": atividades,
+        }
+
+    async def _load_subject_in_tab(
+        self,
+        handle: str,
+        disciplina: dict[str, str | Any],
+        atividades_ignoradas: list[str | Any],
+    ) -> list[dict[str, str]]:
+        """Navega a aba até a disciplina, levantando `TimeoutException` se a página não carregar."""
+        link = disciplina["link"]
+        timeout = self.waiter.timeouts["subject"]
+        await self._in_tab(handle, self.driver.execute_script, NAVIGATE_SCRIPT, link)
+
+        # Aguarda o carregamento enquanto as outras abas usam o WebDriver
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not await self._in_tab(handle, self.driver.execute_script, PAGE_READY_SCRIPT):
+            if loop.time() >= deadline:
+                msg = f"Linha do tempo de '{disciplina['nome']}' não carregou em {timeout} s"
+                raise TimeoutException(msg)
+            await asyncio.sleep(self.poll_interval)
+
+        return await self._in_tab(
+            handle, self._extract_subject, self.driver, disciplina, atividades_ignoradas
+        )
+
+    async def _fetch_subjects_in_tabs(
+        self,
+        disciplinas_info: list[dict[str, str | Any]],
+        atividades_ignoradas: list[str | Any],
+    ) -> list[dict[str, Any] | None]:
+        """Distribui as disciplinas entre as abas, sobrepondo o carregamento das páginas."""
+        handles = await self._call(self._open_tabs, min(self.tabs, len(disciplinas_info)))
+        pending: asyncio.Queue[int] = asyncio.Queue()
+        for index in range(len(disciplinas_info)):
+            pending.put_nowait(index)
+        resultados: list[dict[str, Any] | None] = [None] * len(disciplinas_info)
+
+        async def worker(handle: str) -> None:
+            while not pending.empty():
+                index = pending.get_nowait()
+                resultados[index] = await self._fetch_subject_in_tab(
+                    handle, disciplinas_info[index], atividades_ignoradas
+                )
+
+        try:
+            await asyncio.gather(*(worker(handle) for handle in handles))
+        finally:
+            # Os workers de outras abas podem ainda estar usando o WebDriver após uma exceção
+            async with self._driver_lock:
+                await self._call(self._close_tabs, handles)
+        return resultados
+
+    async def fetch_subjects_information_async(
+        self,
+        disciplinas_info: list[dict[str, str | Any]],
+        atividades_ignoradas: list[str | Any],
+    ) -> list[Subject]:
+        """Captura as disciplinas em abas simultâneas, ou pelo mecanismo síncrono configurado."""
+        use_tabs = (
+            self.snapshot_mode != "replay"
+            and self.fetch_engine == "selenium"
+            and self.tabs > 1
+            and len(disciplinas_info) > 1
+        )
+        if not use_tabs:
+            return await self._call(
+                self.fetch_subjects_information, disciplinas_info, atividades_ignoradas
+            )
+
+        self._open_subject_cache(atividades_ignoradas)
+        resultados = await self._fetch_subjects_in_tabs(disciplinas_info, atividades_ignoradas)
+        return self._merge_results(disciplinas_info, resultados)
+
+    async def run_workflow(self) -> None:
+        """Executa o fluxo principal do script de forma assíncrona."""
+        self._bind_log_context()
+        try:
+            # Reproduz as capturas gravadas sem abrir o navegador
+            if self.snapshot_mode == "replay":
+                self.logger.info(f"Reproduzindo as capturas de '{self.snapshots.directory}'")
+                await self._call(self.snapshots.load)
+            else:
+                with self.metrics.span("browser_session"):
+                    await self._call(self._start_browser_session)
+
+            # Encontra as disciplinas disponíveis
+            with self.metrics.span("find_subjects"):
+                disciplinas_info = await self._call(
+                    self.find_subjects,
+                    self.settings["colaborar_index_url"],
+                    self.settings["matricula"],
+                )
+            self.metrics.increment("subjects_found", len(disciplinas_info))
+
+            # Captura as disciplinas, se em modo "debug"
+            if PROFILE_MODE == "debug" and self.driver:
+                with self.metrics.span("capture_subjects"):
+                    await self._call(self.capture_subjects, disciplinas_info)
+
+            # Captura as informações das disciplinas
+            with self.metrics.span("fetch_subjects"):
+                informacoes_disciplinas = await self.fetch_subjects_information_async(
+                    disciplinas_info,
+                    self.settings.get("atividades_ignoradas", []),
+                )
+
+            # Exporta as informações das disciplinas
+            with self.metrics.span("export"):
+                await self._call(self.export_information, informacoes_disciplinas, self.settings)
+
+            # Registra o tempo efetivamente aguardado em cada etapa
+            self.waiter.report()
+        except ProjectError:
+            self.logger.exception("Erro durante a execução do pipeline.")
+            raise
+        finally:
+            await self._call(self._finish_workflow)
@@ -0,0 +1,196 @@
+"""Módulo de execução do pipeline em lote para várias contas e cursos em processos isolados."""
+
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any
+
+from src.common.base.base_class import BaseClass
+from src.common.echo import echo
+from src.common.errors.errors import SettingsError
+from src.config.constants import CACHE_DIR, OUTPUT_DIR
+from src.config.constypes import PathLike
+from src.config.settings import Settings, load_settings
+from src.infrastructure.logger import LoggerSingleton
+
+FAILED_STATUSES: frozenset[str] = frozenset({"error", "empty"})
+"""Situações de conta que contam como falha do lote: exceção ou nenhuma disciplina extraída."""
+
+
+def _account_id(account: dict[str, Any]) -> str:
+    """Retorna o identificador da conta, usado nos diretórios de saída e de cache."""
+    account_id = str(account.get("id") or f"{account['matricula']}_{account['nome_curso']}")
+    return re.sub(r"[^\w.-]+", "_", account_id).strip("_")
+
+
+def _configure_account_logger(settings: dict[str, Any], output_dir: str) -> None:
+    """Reconfigura o logger do processo de trabalho com um arquivo de log próprio da conta."""
+    # Processos que compartilham um arquivo intercalam as linhas e disputam a rotação
+    section = settings.get("logger") or LoggerSingleton().get_default_config()["logger"]
+    file = dict(section.get("file") or {})
+    file["path"] = str(Path(output_dir) / "logs" / Path(file.get("path") or "app.log").name)
+    LoggerSingleton.reconfigure({"logger": {**section, "file": file}})
+
+
+def _run_account(settings: dict[str, Any], output_dir: str, cache_dir: str) -> dict[str, Any]:
+    """Executa o pipeline de uma conta no processo de trabalho e retorna o seu resultado."""
+    # Importa o pipeline no processo de trabalho, que carrega selenium e o logger próprios
+    from src.pipeline.selenium_scraper_pipeline import SeleniumScraperPipeline  # noqa: PLC0415
+
+    _configure_account_logger(settings, output_dir)
+    start = time.perf_counter()
+    pipeline = SeleniumScraperPipeline(
+        settings, show_browser=False, output_dir=output_dir, cache_dir=cache_dir
+    )
+    pipeline.run_workflow()
+    return {
+        "elapsed_s": time.perf_counter() - start,
+        "subjects_found": pipeline.metrics.counters["subjects_found"],
+        "subjects": pipeline.metrics.counters["subjects_fetched"],
+        "subjects_failed": pipeline.metrics.counters["subjects_failed"],
+    }
+
+
+def _account_status(result: dict[str, Any]) -> str:
+    """Classifica o resultado da conta: `ok`, `partial` com falhas ou `empty` sem disciplinas."""
+    if not result["subjects"]:
+        return "empty"
+    if result["subjects_failed"]:
+        return "partial"
+    return "ok"
+
+
+class BatchRunner(BaseClass):
+    """Distribui as contas de `accounts` entre processos, cada um com o seu próprio Chrome."""
+
+    def __init__(
+        self,
+        settings: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+        output_dir: PathLike = OUTPUT_DIR,
+    ) -> None:
+        """Inicializa o lote com as configurações comuns e a lista de contas."""
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        settings = settings or load_settings()
+
+        self.base_settings = {key: value for key, value in settings.items() if key != "accounts"}
+        """Configurações comuns, sobrescritas pelos campos de cada conta."""
+
+        self.accounts: list[dict[str, Any]] = list(settings.get("accounts") or [])
+        """Perfis de conta: usuário, senha, matrícula, curso e demais campos específicos."""
+
+        self.output_path = Path(output_dir)
+        """Diretório base; cada conta grava em um subdiretório próprio."""
+
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        """Quantidade máxima de contas processadas ao mesmo tempo."""
+
+        self.results: list[dict[str, Any]] = []
+        """Resultado de cada conta, na ordem de conclusão."""
+
+        self._validate_accounts()
+
+    def _validate_accounts(self) -> None:
+        """Valida a lista de contas e os identificadores usados nos diretórios."""
+        if not self.accounts:
+            self._handle_value_error("Nenhuma conta definida em 'accounts'")
+
+        merged = [{**self.base_settings, **account} for account in self.accounts]
+        ids = [_account_id(settings) for settings in merged]
+        duplicated = sorted({account_id for account_id in ids if ids.count(account_id) > 1})
+        if duplicated:
+            self._handle_value_error(f"Contas com identificador repetido: {duplicated}")
+
+        # Valida cada conta antes de iniciar os processos, para falhar antes de abrir o Chrome
+        validated = []
+        for account_id, settings in zip(ids, merged, strict=True):
+            try:
+                validated.append(Settings(settings))
+            except SettingsError as error:
+                msg = f"Conta '{account_id}': {error}"
+                raise SettingsError(msg) from error
+
+        # As capturas de HTML usam um diretório único, que seria sobrescrito pelas contas
+        if any(settings.snapshot_mode != "off" for settings in validated):
+            self._handle_value_error("O modo de capturas não é suportado na execução em lote")
+
+    def run(self) -> list[dict[str, Any]]:
+        """Executa todas as contas e retorna o resultado de cada uma."""
+        start = time.perf_counter()
+        workers = min(self.max_workers, len(self.accounts))
+        self.logger.info(f"Executando {len(self.accounts)} contas em {workers} processos")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for account in self.accounts:
+                settings = {**self.base_settings, **account}
+                account_id = _account_id(settings)
+                future = executor.submit(
+                    _run_account,
+                    settings,
+                    str(self.output_path / account_id),
+                    str(CACHE_DIR / account_id),
+                )
+                futures[future] = account_id
+
+            # Isola as falhas: o erro de uma conta não interrompe as demais
+            for future in as_completed(futures):
+                account_id = futures[future]
+                try:
+                    result = future.result()
+                    result = {"account": account_id, "status": _account_status(result), **result}
+                except Exception as error:
+                    self.logger.exception(f"Falha ao processar a conta '{account_id}'")
+                    result = {"account": account_id, "status": "error", "error": repr(error)}
+                self.results.append(result)
+
+        self._report(time.perf_counter() - start)
+        return self.results
+
+    def _report(self, elapsed: float) -> None:
+        """Exibe o resumo do lote e o grava em `batch_summary.json` no diretório base."""
+        succeeded = [result for result in self.results if result["status"] == "ok"]
+        partial = [result for result in self.results if result["status"] == "partial"]
+        failed = [result for result in self.results if result["status"] in FAILED_STATUSES]
+        subjects = sum(result.get("subjects", 0) for result in self.results)
+
+        summary = {
+            "elapsed_s": elapsed,
+            "accounts": len(self.results),
+            "succeeded": len(succeeded),
+            "partial": len(partial),
+            "failed": len(failed),
+            "accounts_per_minute": len(succeeded) / elapsed * 60 if elapsed else 0.0,
+            "subjects_per_second": subjects / elapsed if elapsed else 0.0,
+            "results": self.results,
+        }
+        summary_path = super()._ensure_path(self.output_path / "batch_summary.json")
+        with summary_path.open("w", encoding="utf-8") as file:
+            json.dump(summary, file, ensure_ascii=False, indent=4)
+
+        super()._separator_line()
+        echo(
+            f"Lote finalizado em {elapsed:.1f} s: {len(succeeded)} contas concluídas, "
+            f"{len(partial)} parciais, {len(failed)} com falha",
+            "time",
+        )
+        echo(
+            f"{summary['accounts_per_minute']:.2f} contas/min, "
+            f"{summary['subjects_per_second']:.2f} disciplinas/s",
+            "arrow",
+        )
+        for result in partial:
+            echo(
+                f"{result['account']}: {result['subjects_failed']} de "
+                f"{result['subjects_found']} disciplinas não capturadas",
+                "warn",
+            )
+        for result in failed:
+            error = result.get("error", "nenhuma disciplina extraída")
+            echo(f"{result['account']}: {error}", "error")
+        echo(f"Resumo salvo em: '{summary_path}'", "success")
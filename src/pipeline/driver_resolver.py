@@ -0,0 +1,123 @@
+"""Módulo de resolução do chromedriver com cache local por versão do Chrome."""
+
+import json
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+from src.common.base.base_class import BaseClass
+from src.common.errors.errors import DriverResolutionError
+from src.config.constants import DRIVER_CACHE_FILE
+from src.config.constypes import PathLike
+from src.infrastructure.logger import LoggerSingleton
+
+
+class DriverResolver(BaseClass):
+    """Localiza o chromedriver sem depender de rede sempre que possível."""
+
+    def __init__(
+        self, explicit_path: PathLike | None = None, cache_file: PathLike = DRIVER_CACHE_FILE
+    ) -> None:
+        """Inicializa o resolvedor com o caminho configurado e o arquivo de cache."""
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.explicit_path = Path(explicit_path) if explicit_path else None
+        """Caminho do chromedriver definido em `chromedriver_path`, usado antes das buscas."""
+
+        self.cache_file = Path(cache_file)
+        """Arquivo JSON que associa cada versão do Chrome ao chromedriver resolvido."""
+
+        self.source: str | None = None
+        """Origem do caminho: `settings`, `cache`, `selenium-manager` ou `webdriver-manager`."""
+
+        self._path: str | None = None
+        """Caminho resolvido, reutilizado pelas sessões seguintes da mesma execução."""
+
+    def chrome_version(self) -> str | None:
+        """Retorna a versão do Chrome instalado, ou `None` quando não detectada."""
+        try:
+            version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        except (OSError, ValueError):
+            version = None
+        if not version:
+            self.logger.warning("Não foi possível detectar a versão do Chrome instalado")
+        return version or None
+
+    def resolve(self) -> str:
+        """Retorna o caminho do chromedriver, consultando as origens em ordem de custo."""
+        if self._path is not None:
+            return self._path
+
+        if self.explicit_path is not None:
+            if not self.explicit_path.is_file():
+                msg = f"Chromedriver de 'chromedriver_path' não encontrado: '{self.explicit_path}'"
+                raise DriverResolutionError(msg)
+            return self._remember("settings", str(self.explicit_path))
+
+        # Sem a versão, não há como saber se o caminho em cache ainda serve ao Chrome instalado
+        version = self.chrome_version()
+        cached = self._load_cache().get(version) if version else None
+        if cached and Path(cached).is_file():
+            return self._remember("cache", cached)
+
+        for source, locate in (
+            ("selenium-manager", self._from_selenium_manager),
+            ("webdriver-manager", self._from_webdriver_manager),
+        ):
+            path = locate()
+            if path:
+                if version:
+                    self._save_cache(version, path)
+                return self._remember(source, path)
+
+        chrome = f"o Chrome {version}" if version else "a versão desconhecida do Chrome"
+        msg = f"Nenhuma origem conseguiu resolver o chromedriver para {chrome}"
+        raise DriverResolutionError(msg)
+
+    def _remember(self, source: str, path: str) -> str:
+        """Memoriza o caminho resolvido e a sua origem."""
+        self.source = source
+        self._path = path
+        self.logger.info(f"Chromedriver resolvido via {source}: '{path}'")
+        return path
+
+    def _from_selenium_manager(self) -> str | None:
+        """Resolve o chromedriver com o Selenium Manager embutido no Selenium."""
+        try:
+            paths = SeleniumManager().binary_paths(["--browser", "chrome"])
+        except (WebDriverException, OSError):
+            self.logger.warning("Selenium Manager não resolveu o chromedriver")
+            return None
+        return paths.get("driver_path") or None
+
+    def _from_webdriver_manager(self) -> str | None:
+        """Resolve o chromedriver com o webdriver-manager, que pode baixar o executável."""
+        try:
+            return ChromeDriverManager().install()
+        except Exception:
+            self.logger.exception("webdriver-manager não resolveu o chromedriver")
+            return None
+
+    def _load_cache(self) -> dict[str, str]:
+        """Carrega o cache de caminhos por versão do Chrome."""
+        if not self.cache_file.is_file():
+            return {}
+        try:
+            return super()._load_file(self.cache_file)
+        except (OSError, ValueError):
+            self.logger.warning(f"Cache do chromedriver inválido, ignorando: '{self.cache_file}'")
+            return {}
+
+    def _save_cache(self, version: str, path: str) -> None:
+        """Associa o caminho resolvido à versão do Chrome no cache."""
+        cache = {**self._load_cache(), version: path}
+        try:
+            cache_file = super()._ensure_path(self.cache_file)
+            with cache_file.open("w", encoding="utf-8") as file:
+                json.dump(cache, file, ensure_ascii=False, indent=4)
+        except OSError:
+            self.logger.exception("Erro ao salvar o cache do chromedriver")
@@ -0,0 +1,238 @@
+"""Módulo de exportação das informações das disciplinas em vários formatos, em paralelo."""
+
+import csv
+import json
+import os
+import stat
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple, TextIO
+
+import yaml
+
+from src.common.base.base_class import BaseClass
+from src.config.constypes import PathLike
+from src.infrastructure.logger import LoggerSingleton
+from src.infrastructure.metrics import MetricsRecorder
+from src.pipeline.ics_writer import IcsWriter
+from src.pipeline.records import Subject, subjects_to_dict
+
+BASENAME: str = "informacoes_disciplinas"
+"""Nome base dos arquivos exportados."""
+
+DEFAULT_FORMATS: tuple[str, ...] = ("json", "yaml", "ics")
+"""Formatos exportados quando `export_formats` não é definido."""
+
+ROW_FIELDS: tuple[str, ...] = (
+    "disciplina",
+    "link_disciplina",
+    "tipo_atividade",
+    "nome_atividade",
+    "periodo",
+    "inicio",
+    "fim",
+)
+"""Colunas das exportações com uma linha por atividade (CSV e NDJSON)."""
+
+YAML_DUMPER: type[yaml.SafeDumper] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+"""Dumper YAML da libyaml em C, ou o dumper em Python puro quando ela não está disponível."""
+
+
+def _read_umask() -> int:
+    """Retorna a umask do processo, que só pode ser lida trocando-a e restaurando-a."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+NEW_FILE_MODE: int = 0o666 & ~_read_umask()
+"""Permissões de um arquivo novo criado com `open`, lidas na importação, antes das threads."""
+
+
+def file_mode(path: Path) -> int:
+    """Retorna as permissões do arquivo existente, ou as de um arquivo novo."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return NEW_FILE_MODE
+
+
+class ExportFormat(NamedTuple):
+    """Formato de exportação registrado: sufixo do arquivo e função de escrita."""
+
+    suffix: str
+    """Sufixo do arquivo gerado, acrescentado ao nome base."""
+
+    write: Callable[[TextIO, Sequence[Subject], dict[str, Any]], None]
+    """Grava as disciplinas no arquivo aberto, recebendo também as configurações."""
+
+    newline: str | None = None
+    """Tradução de quebras de linha do arquivo aberto (`""` preserva CRLF e o CSV)."""
+
+
+def activity_rows(subjects: Sequence[Subject]) -> Iterator[dict[str, Any]]:
+    """Gera uma linha por atividade com as datas de início e fim em ISO 8601."""
+    for subject in subjects:
+        for atividade in subject.atividades:
+            yield {
+                "disciplina": subject.nome,
+                "link_disciplina": subject.link_disciplina,
+                "tipo_atividade": atividade.tipo_atividade,
+                "nome_atividade": atividade.nome_atividade,
+                "periodo": atividade.periodo,
+                "inicio": atividade.start.isoformat() if atividade.start else None,
+                "fim": atividade.end.isoformat() if atividade.end else None,
+            }
+
+
+class Exporter(BaseClass):
+    """Grava os formatos selecionados em paralelo, cada um de forma atômica."""
+
+    def __init__(
+        self,
+        output_dir: PathLike,
+        formats: list[str] | None = None,
+        *,
+        ics_template: PathLike,
+        metrics: MetricsRecorder | None = None,
+    ) -> None:
+        """Inicializa o registro de formatos e valida a seleção de `export_formats`."""
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.output_dir = Path(output_dir)
+        """Diretório onde os arquivos são gravados."""
+
+        self.formats = list(formats or DEFAULT_FORMATS)
+        """Formatos exportados, na ordem configurada."""
+
+        self.ics_template = ics_template
+        """Template do calendário, compilado na primeira exportação ICS."""
+
+        self.metrics = metrics or MetricsRecorder()
+        """Registro de métricas onde cada formato abre um span `export.<formato>`."""
+
+        self.timings: dict[str, float] = {}
+        """Tempo, em segundos, da última gravação de cada formato."""
+
+        self._ics_writer: IcsWriter | None = None
+        """Gravador do calendário com o template compilado."""
+
+        self._formats: dict[str, ExportFormat] = {
+            "json": ExportFormat(".json", self._write_json),
+            "json_compact": ExportFormat(".min.json", self._write_json_compact),
+            "yaml": ExportFormat(".yml", self._write_yaml),
+            "ics": ExportFormat(".ics", self._write_ics, newline=""),
+            "csv": ExportFormat(".csv", self._write_csv, newline=""),
+            "ndjson": ExportFormat(".ndjson", self._write_ndjson),
+        }
+        """Registro dos formatos disponíveis; novos formatos entram por `register`."""
+
+        self._validate_formats()
+
+    def _validate_formats(self) -> None:
+        """Valida os formatos selecionados contra o registro."""
+        unknown = [name for name in self.formats if name not in self._formats]
+        if unknown:
+            self._handle_value_error(
+                f"Formatos de exportação inválidos: {unknown}; disponíveis: {sorted(self._formats)}"
+            )
+
+    def register(self, name: str, export_format: ExportFormat) -> None:
+        """Registra um formato adicional, que pode então ser selecionado."""
+        self._formats[name] = export_format
+
+    def path(self, name: str) -> Path:
+        """Retorna o caminho do arquivo de um formato."""
+        return self.output_dir / f"{BASENAME}{self._formats[name].suffix}"
+
+    def export(self, subjects: Sequence[Subject], config: dict[str, Any]) -> dict[str, Path]:
+        """Grava todos os formatos selecionados e retorna o caminho de cada um."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(
+            max_workers=len(self.formats), thread_name_prefix="exporter"
+        ) as executor:
+            futures = {
+                name: executor.submit(self._export_format, name, subjects, config)
+                for name in self.formats
+            }
+            # Propaga o primeiro erro somente depois que todos os formatos terminarem
+            paths = {name: future.result() for name, future in futures.items()}
+
+        for name, path in paths.items():
+            self.logger.info(
+                f"Informações salvas em {name}: '{path}' ({self.timings[name] * 1000:.1f} ms)"
+            )
+        return paths
+
+    def _export_format(
+        self, name: str, subjects: Sequence[Subject], config: dict[str, Any]
+    ) -> Path:
+        """Grava um formato em um arquivo temporário e o move para o destino final."""
+        export_format = self._formats[name]
+        path = self.path(name)
+        start = time.perf_counter()
+        with self.metrics.span(f"export.{name}"):
+            # O temporário fica no mesmo diretório para que a troca seja atômica
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                newline=export_format.newline,
+                dir=self.output_dir,
+                prefix=f".{path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as file:
+                temp_path = Path(file.name)
+                try:
+                    export_format.write(file, subjects, config)
+                except BaseException:
+                    file.close()
+                    temp_path.unlink(missing_ok=True)
+                    raise
+            # O `NamedTemporaryFile` é criado com 0600; o destino mantém as permissões esperadas
+            temp_path.chmod(file_mode(path))
+            temp_path.replace(path)
+        self.timings[name] = time.perf_counter() - start
+        return path
+
+    def _write_json(self, file: TextIO, subjects: Sequence[Subject], _: dict[str, Any]) -> None:
+        """Grava o JSON indentado, no formato lido de volta por `subjects_from_dict`."""
+        json.dump(subjects_to_dict(subjects), file, ensure_ascii=False, indent=4)
+
+    def _write_json_compact(
+        self, file: TextIO, subjects: Sequence[Subject], _: dict[str, Any]
+    ) -> None:
+        """Grava o JSON sem indentação nem espaços entre os separadores."""
+        json.dump(subjects_to_dict(subjects), file, ensure_ascii=False, separators=(",", ":"))
+
+    def _write_yaml(self, file: TextIO, subjects: Sequence[Subject], _: dict[str, Any]) -> None:
+        """Grava o YAML com o dumper em C."""
+        yaml.dump(
+            subjects_to_dict(subjects),
+            file,
+            Dumper=YAML_DUMPER,
+            allow_unicode=True,
+            default_flow_style=False,
+        )
+
+    def _write_ics(self, file: TextIO, subjects: Sequence[Subject], config: dict[str, Any]) -> None:
+        """Grava o calendário com o template compilado uma única vez."""
+        if self._ics_writer is None:
+            self._ics_writer = IcsWriter(self.ics_template)
+        self._ics_writer.write_to(file, subjects, config)
+
+    def _write_csv(self, file: TextIO, subjects: Sequence[Subject], _: dict[str, Any]) -> None:
+        """Grava uma linha por atividade em CSV."""
+        writer = csv.DictWriter(file, fieldnames=ROW_FIELDS)
+        writer.writeheader()
+        writer.writerows(activity_rows(subjects))
+
+    def _write_ndjson(self, file: TextIO, subjects: Sequence[Subject], _: dict[str, Any]) -> None:
+        """Grava uma atividade por linha em JSON."""
+        for row in activity_rows(subjects):
+            file.write(json.dumps(row, ensure_ascii=False))
+            file.write("\n")
@@ -0,0 +1,33 @@
+"""Módulo com funções compartilhadas entre os modos de extração das atividades."""
+
+from collections.abc import Iterable
+from typing import Any
+
+
+def filter_activities(
+    registros: Iterable[dict[str, str | None]], atividades_ignoradas: list[str | Any]
+) -> list[dict[str, str]]:
+    """Filtra os registros brutos de atividades, descartando ignoradas e incompletas."""
+    atividades = []
+    for registro in registros:
+        tipo_atividade = registro["tipo_atividade"]
+        if tipo_atividade is None:
+            continue
+
+        # Ignora atividades que estão na lista de atividades ignoradas
+        if any(ignorada in tipo_atividade for ignorada in atividades_ignoradas):
+            continue
+
+        # Descarta atividades sem nome ou período, como no modo por elemento
+        if registro["nome_atividade"] is None or registro["periodo"] is None:
+            continue
+
+        atividades.append(
+            {
+                "nome_atividade": registro["nome_atividade"],
+                "tipo_atividade": tipo_atividade,
+                "periodo": registro["periodo"],
+            }
+        )
+
+    return atividades
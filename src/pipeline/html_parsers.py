@@ -0,0 +1,241 @@
+"""Módulo com parsers de HTML bruto das páginas do portal, sem renderização de DOM."""
+
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+_VOID_ELEMENTS: frozenset[str] = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+"""Elementos HTML sem tag de fechamento, que não entram na pilha de elementos abertos."""
+
+_CONTAINER_START: re.Pattern[str] = re.compile(
+    r"<(\w+)\b[^>]*\bid\s*=\s*[\"']?js-activities-container(?=[\"'\s>])[^>]*>", re.IGNORECASE
+)
+"""Localiza a tag de abertura do elemento `#js-activities-container`."""
+
+
+def _normalize_text(text: str) -> str:
+    """Normaliza o texto como o `.text` do WebDriver: linhas aparadas e espaços colapsados."""
+    lines = (" ".join(line.split()) for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+class _Element:
+    """Representa um elemento aberto na pilha do parser."""
+
+    __slots__ = ("classes", "element_id", "tag")
+
+    def __init__(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Extrai a tag, o id e as classes do elemento."""
+        attributes = dict(attrs)
+        self.tag = tag
+        self.element_id = attributes.get("id") or ""
+        self.classes = frozenset((attributes.get("class") or "").split())
+
+
+def extract_container(html: str) -> str | None:
+    """Retorna o trecho de HTML bruto de `#js-activities-container`, sem interpretar o DOM."""
+    start = _CONTAINER_START.search(html)
+    if start is None:
+        return None
+
+    # Conta as aberturas e fechamentos da mesma tag até encontrar o fechamento do container
+    tag = re.compile(rf"<(/?){start.group(1)}\b[^>]*>", re.IGNORECASE)
+    depth = 1
+    for match in tag.finditer(html, start.end()):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return html[start.start() : match.end()]
+    return html[start.start() :]
+
+
+class TimelineParser(HTMLParser):
+    """Extrai as atividades de `#js-activities-container .atividades` a partir do HTML bruto."""
+
+    def __init__(self) -> None:
+        """Inicializa o parser com a pilha de elementos vazia."""
+        super().__init__(convert_charrefs=True)
+
+        self._stack: list[_Element] = []
+        """Pilha dos elementos abertos até o ponto atual do documento."""
+
+        self._container_depth: int | None = None
+        """Profundidade do elemento `#js-activities-container`, quando aberto."""
+
+        self._activity_depth: int | None = None
+        """Profundidade do elemento `.atividades` em processamento, quando aberto."""
+
+        self._fields: dict[str, list[str]] = {}
+        """Textos capturados de cada campo da atividade em processamento."""
+
+        self._captures: dict[str, int] = {}
+        """Campos em captura, associados à profundidade do elemento que os contém."""
+
+        self.registros: list[dict[str, str | None]] = []
+        """Registros brutos no mesmo formato retornado pelo `ACTIVITIES_SCRIPT`."""
+
+    def _has_ancestor(self, tag: str, css_class: str) -> bool:
+        """Indica se há um elemento aberto na atividade com a tag e a classe informadas."""
+        return any(
+            element.tag == tag and css_class in element.classes
+            for element in self._stack[self._activity_depth or 0 :]
+        )
+
+    def _start_capture(self, field: str) -> None:
+        """Inicia a captura de texto de um campo, mantendo apenas a primeira ocorrência."""
+        if field in self._fields:
+            return
+        self._fields[field] = []
+        self._captures[field] = len(self._stack)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Empilha o elemento e identifica container, atividades e campos de interesse."""
+        if tag == "br" and "titulo" in self._captures:
+            self._fields["titulo"].append("\n")
+        if tag in _VOID_ELEMENTS:
+            return
+
+        element = _Element(tag, attrs)
+        self._stack.append(element)
+
+        if self._container_depth is None:
+            if element.element_id == "js-activities-container":
+                self._container_depth = len(self._stack)
+        elif self._activity_depth is None:
+            if "atividades" in element.classes:
+                self._activity_depth = len(self._stack)
+        else:
+            self._handle_activity_element(element)
+
+    def _handle_activity_element(self, element: _Element) -> None:
+        """Inicia a captura dos campos da atividade conforme o elemento aberto."""
+        if element.tag == "h4" and "timeline-title" in element.classes:
+            if self._has_ancestor("div", "timeline-heading"):
+                self._start_capture("titulo")
+        elif element.tag == "small" and "titulo" in self._captures:
+            # O `small` do título é exibido em uma nova linha, como no `.text` do WebDriver
+            self._fields["titulo"].append("\n")
+            self._start_capture("nome_atividade")
+        elif element.tag == "em" and self._has_ancestor("small", "text-muted"):
+            self._start_capture("periodo")
+
+    def handle_endtag(self, tag: str) -> None:
+        """Desempilha elementos até a tag fechada e finaliza capturas e atividades."""
+        if tag in _VOID_ELEMENTS or all(element.tag != tag for element in self._stack):
+            return
+
+        while self._stack:
+            depth = len(self._stack)
+            element = self._stack.pop()
+            self._close_element(depth)
+            if element.tag == tag:
+                break
+
+    def _close_element(self, depth: int) -> None:
+        """Encerra capturas, a atividade ou o container conforme a profundidade fechada."""
+        self._captures = {field: d for field, d in self._captures.items() if d != depth}
+
+        if self._activity_depth == depth:
+            self.registros.append(self._build_record())
+            self._activity_depth = None
+            self._fields = {}
+            self._captures = {}
+        elif self._container_depth == depth:
+            self._container_depth = None
+
+    def handle_data(self, data: str) -> None:
+        """Acumula o texto dos campos em captura, tratando quebras do código-fonte como espaço."""
+        text = data.replace("\n", " ")
+        for field in self._captures:
+            self._fields[field].append(text)
+
+    def _field_text(self, field: str) -> str | None:
+        """Retorna o texto normalizado de um campo ou None se ele não foi encontrado."""
+        if field not in self._fields:
+            return None
+        return _normalize_text("".join(self._fields[field]))
+
+    def _build_record(self) -> dict[str, str | None]:
+        """Monta o registro bruto da atividade a partir dos textos capturados."""
+        titulo = self._field_text("titulo")
+        return {
+            "tipo_atividade": titulo.split("\n")[0] if titulo is not None else None,
+            "nome_atividade": self._field_text("nome_atividade"),
+            "periodo": self._field_text("periodo"),
+        }
+
+
+def parse_activities(html: str) -> list[dict[str, str | None]]:
+    """Retorna os registros brutos das atividades presentes no HTML de uma disciplina."""
+    parser = TimelineParser()
+    parser.feed(html)
+    parser.close()
+    return parser.registros
+
+
+class SubjectListParser(HTMLParser):
+    """Extrai nome e link das disciplinas de `li.atividadesCronograma a.atividadeNome`."""
+
+    def __init__(self, base_url: str) -> None:
+        """Inicializa o parser com a URL usada para resolver links relativos."""
+        super().__init__(convert_charrefs=True)
+
+        self.base_url = base_url
+        """URL da página de origem, usada para resolver os links como o `href` do WebDriver."""
+
+        self._stack: list[_Element] = []
+        """Pilha dos elementos abertos até o ponto atual do documento."""
+
+        self.disciplinas: list[dict[str, str]] = []
+        """Disciplinas encontradas, no formato retornado por `find_subjects`."""
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Registra os links de disciplina dentro dos itens do cronograma."""
+        if tag in _VOID_ELEMENTS:
+            return
+
+        element = _Element(tag, attrs)
+        in_schedule = any(
+            parent.tag == "li" and "atividadesCronograma" in parent.classes
+            for parent in self._stack
+        )
+        self._stack.append(element)
+
+        if tag != "a" or "atividadeNome" not in element.classes or not in_schedule:
+            return
+
+        attributes = dict(attrs)
+        href = attributes.get("href")
+        title = attributes.get("title")
+        if href and title:
+            self.disciplinas.append({"nome": title.strip(), "link": urljoin(self.base_url, href)})
+
+    def handle_endtag(self, tag: str) -> None:
+        """Desempilha elementos até a tag fechada."""
+        if tag in _VOID_ELEMENTS or all(element.tag != tag for element in self._stack):
+            return
+        while self._stack and self._stack.pop().tag != tag:
+            pass
+
+
+def parse_subjects(html: str, base_url: str) -> list[dict[str, str]]:
+    """Retorna as disciplinas listadas no HTML da página do curso."""
+    parser = SubjectListParser(base_url)
+    parser.feed(html)
+    parser.close()
+    return parser.disciplinas
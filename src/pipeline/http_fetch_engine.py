@@ -0,0 +1,220 @@
+"""Módulo do mecanismo de captura via HTTP que reutiliza os cookies da sessão do Selenium."""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Self
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.common.base.base_class import BaseClass
+from src.common.errors.errors import CircuitOpenError
+from src.config.constants import USER_AGENT
+from src.infrastructure.logger import LoggerSingleton
+from src.infrastructure.metrics import MetricsRecorder
+from src.pipeline.extraction import filter_activities
+from src.pipeline.html_parsers import extract_container, parse_activities
+from src.pipeline.resilience import RetryPolicy
+from src.pipeline.subject_cache import SubjectCache, fingerprint
+
+
+class TransientHTTPError(requests.HTTPError):
+    """Resposta de falha passageira do portal (5xx, 429 ou corpo vazio), repetida com backoff."""
+
+
+class HttpFetchEngine(BaseClass):
+    """Captura as páginas das disciplinas com um `requests.Session` sem abrir o navegador."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        cookies: list[dict[str, Any]],
+        *,
+        max_workers: int = 16,
+        timeout: float = 30,
+        on_page: Callable[[dict[str, str | Any], str], None] | None = None,
+        metrics: MetricsRecorder | None = None,
+        subject_cache: SubjectCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        login_url: str | None = None,
+    ) -> None:
+        """Inicializa a sessão HTTP com os cookies autenticados do WebDriver."""
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.max_workers = max(1, max_workers)
+        """Quantidade máxima de requisições simultâneas."""
+
+        self.timeout = timeout
+        """Tempo limite, em segundos, de cada requisição."""
+
+        self.on_page = on_page
+        """Função chamada com a disciplina e o HTML de cada página baixada."""
+
+        self.metrics = metrics or MetricsRecorder()
+        """Registro de métricas onde cada disciplina capturada abre um span."""
+
+        self.subject_cache = subject_cache
+        """Cache de resultados usado nas requisições condicionais e na detecção de alterações."""
+
+        self.retry_policy = retry_policy or RetryPolicy({"attempts": 1}, self.metrics)
+        """Novas tentativas das requisições com falha transitória (conexão, tempo, 5xx ou 429)."""
+
+        self.login_path = urlsplit(login_url).path if login_url else None
+        """Caminho da página de login, para onde o portal redireciona uma sessão expirada."""
+
+        self.session = requests.Session()
+        """Sessão HTTP com pool de conexões compartilhado entre as threads."""
+
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["User-Agent"] = USER_AGENT
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+    def __enter__(self) -> Self:
+        """Retorna o próprio mecanismo para uso em blocos `with`."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Encerra a sessão HTTP ao sair do bloco `with`."""
+        self.close()
+
+    def _request(self, url: str, headers: dict[str, str] | None = None) -> requests.Response:
+        """Executa um GET autenticado e levanta erro para respostas de falha."""
+        self.metrics.increment("http_requests")
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        # Erros do servidor, limite de requisições e páginas vazias costumam passar sozinhos;
+        # os demais 4xx são definitivos e seguem pelo `raise_for_status`
+        status = response.status_code
+        if status >= HTTPStatus.INTERNAL_SERVER_ERROR or status == HTTPStatus.TOO_MANY_REQUESTS:
+            msg = f"Falha temporária do portal ({status}) em '{url}'"
+            raise TransientHTTPError(msg, response=response)
+        response.raise_for_status()
+        if status != HTTPStatus.NOT_MODIFIED and not response.content:
+            msg = f"Resposta vazia do portal em '{url}'"
+            raise TransientHTTPError(msg, response=response)
+        return response
+
+    def fetch_page(self, url: str) -> str:
+        """Baixa o HTML de uma página autenticada."""
+        return self._request(url).text
+
+    def is_authenticated(self, url: str, login_url: str) -> bool:
+        """Indica se a sessão acessa a URL informada sem ser redirecionada para o login."""
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException:
+            self.logger.exception(f"Erro ao validar a sessão em '{url}'")
+            return False
+        return response.ok and urlsplit(response.url).path != urlsplit(login_url).path
+
+    def _redirected_to_login(self, response: requests.Response) -> bool:
+        """Indica se a requisição foi redirecionada para a página de login."""
+        return (
+            bool(response.history)
+            and self.login_path is not None
+            and urlsplit(response.url).path == self.login_path
+        )
+
+    def _miss(self, disciplina: dict[str, str | Any], reason: str) -> None:
+        """Registra uma página que não é a linha do tempo da disciplina."""
+        self.metrics.increment("http_subject_misses")
+        self.logger.warning(
+            f"Disciplina '{disciplina['nome']}' não capturada via HTTP: {reason}; "
+            "usando o resultado anterior, se houver"
+        )
+
+    def _fetch_subject(
+        self, disciplina: dict[str, str | Any], atividades_ignoradas: list[str | Any]
+    ) -> dict[str, Any] | None:
+        """Baixa e interpreta a página de uma disciplina."""
+        with self.metrics.span("subject", disciplina=disciplina["nome"]):
+            # Envia os validadores da execução anterior, exceto ao gravar capturas
+            headers = {}
+            if self.subject_cache is not None and self.on_page is None:
+                headers = self.subject_cache.validators(disciplina["link"])
+
+            try:
+                self.logger.debug(f"Baixando a disciplina via HTTP: {disciplina['nome']}")
+                response = self.retry_policy.call(
+                    "http_subject",
+                    self._request,
+                    disciplina["link"],
+                    headers,
+                    retry_on=(requests.ConnectionError, requests.Timeout, TransientHTTPError),
+                )
+            except (requests.RequestException, CircuitOpenError):
+                self.logger.exception(
+                    f"Erro ao capturar informações da disciplina '{disciplina['nome']}'"
+                )
+                return None
+
+            # Uma sessão expirada é redirecionada ao login, que não pode virar uma disciplina vazia
+            if self._redirected_to_login(response):
+                self._miss(disciplina, "sessão redirecionada para o login")
+                return None
+
+            atividades = None
+            if response.status_code == HTTPStatus.NOT_MODIFIED and self.subject_cache is not None:
+                atividades = self.subject_cache.not_modified(disciplina["link"])
+            if atividades is None:
+                atividades = self._parse(disciplina["link"], response, atividades_ignoradas)
+                if atividades is None:
+                    self._miss(disciplina, "página sem a linha do tempo das atividades")
+                    return None
+                if self.on_page is not None:
+                    self.on_page(disciplina, response.text)
+        self.logger.info(f"Informações da disciplina '{disciplina['nome']}' capturadas.")
+        return {
+            "link_disciplina": disciplina["link"],
+            "atividades": atividades,
+        }
+
+    def _parse(
+        self, link: str, response: requests.Response, atividades_ignoradas: list[str | Any]
+    ) -> list[dict[str, str]] | None:
+        """Interpreta a página, ou retorna `None` quando ela não contém a linha do tempo."""
+        container = extract_container(response.text)
+        if container is None:
+            return None
+        if self.subject_cache is None:
+            return filter_activities(parse_activities(container), atividades_ignoradas)
+
+        digest = fingerprint(container)
+        atividades = self.subject_cache.lookup(link, digest)
+        if atividades is None:
+            atividades = filter_activities(parse_activities(container), atividades_ignoradas)
+        self.subject_cache.store(
+            link,
+            digest,
+            atividades,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return atividades
+
+    def fetch_subjects(
+        self,
+        disciplinas_info: list[dict[str, str | Any]],
+        atividades_ignoradas: list[str | Any],
+    ) -> list[dict[str, Any] | None]:
+        """Captura todas as disciplinas em paralelo, retornando os resultados na ordem original."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda disciplina: self._fetch_subject(disciplina, atividades_ignoradas),
+                    disciplinas_info,
+                )
+            )
+
+    def close(self) -> None:
+        """Encerra a sessão HTTP e libera as conexões do pool."""
+        self.session.close()
@@ -0,0 +1,181 @@
+"""Módulo de geração do calendário ICS em fluxo a partir de um template compilado."""
+
+import hashlib
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from datetime import UTC, date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, TextIO
+
+from src.common.base.base_class import BaseClass
+from src.config.constypes import PathLike
+from src.infrastructure.logger import LoggerSingleton
+from src.pipeline.records import Activity, Subject
+
+CRLF: str = "\r\n"
+"""Terminador de linha exigido pela RFC 5545."""
+
+FOLD_LIMIT: int = 75
+"""Tamanho máximo, em octetos, de uma linha de conteúdo antes da dobra."""
+
+TEXT_ESCAPES: dict[int, str] = str.maketrans(
+    {"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n", "\r": ""}
+)
+"""Tabela de escape dos valores do tipo TEXT (RFC 5545, seção 3.3.11)."""
+
+UTF8_CONTINUATION: range = range(0x80, 0xC0)
+"""Octetos de continuação de um caractere UTF-8 multibyte, onde a dobra não pode ocorrer."""
+
+UID_DOMAIN: str = "colaboraread.com.br"
+"""Domínio usado como sufixo dos UIDs dos eventos."""
+
+
+def escape_text(value: str) -> str:
+    """Escapa barras, pontos e vírgulas, vírgulas e quebras de linha de um valor TEXT."""
+    return value.translate(TEXT_ESCAPES)
+
+
+def fold_line(line: str) -> str:
+    """Dobra uma linha de conteúdo em partes de até 75 octetos, sem partir caracteres UTF-8."""
+    # Caminho rápido: linhas ASCII curtas, a grande maioria, não são codificadas
+    if len(line) <= FOLD_LIMIT and line.isascii():
+        return line
+    encoded = line.encode("utf-8")
+    if len(encoded) <= FOLD_LIMIT:
+        return line
+
+    parts = []
+    start, limit = 0, FOLD_LIMIT
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Recua até o início de um caractere para não dividir uma sequência multibyte
+        while end < len(encoded) and encoded[end] in UTF8_CONTINUATION:
+            end -= 1
+        parts.append(encoded[start:end].decode("utf-8"))
+        # As linhas de continuação começam com um espaço, que conta no limite
+        start, limit = end, FOLD_LIMIT - 1
+    return f"{CRLF} ".join(parts)
+
+
+def event_uid(disciplina: str, atividade: Activity, tipo_periodo: str, occurrence: int = 0) -> str:
+    """Retorna um UID estável do evento, que permite aos clientes de calendário deduplicá-lo."""
+    fields = (disciplina, atividade.tipo_atividade, atividade.nome_atividade, tipo_periodo)
+    # Só as repetições recebem o índice, mantendo o UID já publicado da primeira ocorrência
+    if occurrence:
+        fields = (*fields, str(occurrence))
+    key = "\x1f".join(fields)
+    return f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}@{UID_DOMAIN}"  # noqa: S324
+
+
+@lru_cache(maxsize=4096)
+def ics_date(value: date) -> str:
+    """Formata a data no tipo DATE do ICS, `yyyymmdd`."""
+    return f"{value.year:04d}{value.month:02d}{value.day:02d}"
+
+
+class IcsWriter(BaseClass):
+    """Compila o template ICS uma única vez e grava os eventos no arquivo um a um."""
+
+    def __init__(self, template_path: PathLike) -> None:
+        """Lê o template e separa o cabeçalho e as linhas do evento."""
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        template: str = super()._load_file(template_path)["ics_content"].strip()
+        header, event = template.split("BEGIN:VEVENT", 1)
+        event_lines = [line for line in event.splitlines() if line.strip()]
+
+        self.header_lines = [line.strip() for line in header.splitlines() if line.strip()]
+        """Linhas do cabeçalho do calendário, formatadas uma vez por arquivo."""
+
+        self.event_lines = [line for line in event_lines if line != "END:VEVENT"]
+        """Linhas de propriedade do evento, formatadas para cada início e fim de atividade."""
+
+        self.event_template = CRLF.join(
+            ["BEGIN:VEVENT", "UID:{uid}", "DTSTAMP:{dtstamp}", *self.event_lines, "END:VEVENT"]
+        )
+        """Evento compilado em um único template, com UID e DTSTAMP exigidos pela RFC 5545."""
+
+        self.events_written = 0
+        """Quantidade de eventos gravados na última chamada de `write`."""
+
+        self.events_skipped = 0
+        """Atividades descartadas na última chamada de `write` por período inválido."""
+
+    def events(self, subjects: Iterable[Subject], dtstamp: str) -> Iterator[str]:
+        """Gera o texto de cada evento, já escapado e dobrado, sem acumular o calendário."""
+        template = self.event_template
+        for subject in subjects:
+            disciplina = subject.nome
+            disciplina_ics = escape_text(disciplina)
+            # Atividades de mesmo tipo e nome na disciplina são distinguidas pela ocorrência
+            occurrences: Counter[tuple[str, str]] = Counter()
+            for atividade in subject.atividades:
+                identity = (atividade.tipo_atividade, atividade.nome_atividade)
+                occurrence = occurrences[identity]
+                occurrences[identity] += 1
+                if atividade.start is None or atividade.end is None:
+                    self.logger.warning(
+                        f"Atividade '{atividade.nome_atividade}' de '{disciplina}' fora do "
+                        f"calendário: período inválido '{atividade.periodo}'"
+                    )
+                    self.events_skipped += 1
+                    continue
+
+                nome_atividade = escape_text(atividade.nome_atividade)
+                inicio = ics_date(atividade.start)
+                fim = ics_date(atividade.end)
+
+                # Atividades de um único dia geram apenas o evento de início
+                periodos = [("Início", inicio)]
+                if inicio != fim:
+                    periodos.append(("Fim", fim))
+                for tipo_periodo, data_periodo in periodos:
+                    event = template.format(
+                        uid=event_uid(disciplina, atividade, tipo_periodo, occurrence),
+                        dtstamp=dtstamp,
+                        tipo_periodo=tipo_periodo,
+                        nome_atividade=nome_atividade,
+                        data_periodo=data_periodo,
+                        disciplina=disciplina_ics,
+                    )
+                    yield CRLF.join(map(fold_line, event.split(CRLF)))
+
+    def write(
+        self,
+        subjects: Iterable[Subject],
+        output_path: PathLike,
+        config: dict[str, Any],
+    ) -> int:
+        """Grava o calendário em fluxo e retorna a quantidade de eventos escritos."""
+        with Path(output_path).open("w", encoding="utf-8", newline="") as ics_file:
+            return self.write_to(ics_file, subjects, config)
+
+    def write_to(
+        self,
+        ics_file: TextIO,
+        subjects: Iterable[Subject],
+        config: dict[str, Any],
+    ) -> int:
+        """Grava o calendário em um arquivo já aberto sem tradução de quebras de linha."""
+        header = CRLF.join(
+            fold_line(
+                line.format(
+                    nome_aluno=escape_text(str(config["nome_aluno"])),
+                    semestre=escape_text(str(config["semestre"])),
+                    nome_curso=escape_text(str(config["nome_curso"])),
+                )
+            )
+            for line in self.header_lines
+        )
+        dtstamp = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%SZ")
+
+        self.events_written = 0
+        self.events_skipped = 0
+        ics_file.write(header + CRLF)
+        for event in self.events(subjects, dtstamp):
+            ics_file.write(event + CRLF)
+            self.events_written += 1
+        ics_file.write("END:VCALENDAR" + CRLF)
+        return self.events_written
@@ -0,0 +1,82 @@
+"""Módulo de interpretação dos períodos das atividades no formato `dd/mm/yy - dd/mm/yy`."""
+
+import re
+from datetime import date
+from functools import lru_cache
+from typing import NamedTuple
+
+from src.common.errors.errors import PeriodFormatError
+
+PERIOD_PATTERN: re.Pattern[str] = re.compile(
+    r"\s*(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})\s*-\s*(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})\s*"
+)
+"""Formato aceito pelo caminho lento: espaços opcionais, dia e mês com um dígito, ano com quatro."""
+
+FAST_PERIOD_LENGTH: int = len("dd/mm/yy - dd/mm/yy")
+"""Tamanho do período no formato exibido pelo portal, tratado pelo caminho rápido."""
+
+CENTURY_PIVOT: int = 69
+"""Anos de dois dígitos abaixo deste valor pertencem a 20xx, como no `%y` do `strptime`."""
+
+
+class Period(NamedTuple):
+    """Datas de início e fim de uma atividade, no calendário de Brasília."""
+
+    start: date
+    """Data de início da atividade."""
+
+    end: date
+    """Data de fim da atividade."""
+
+
+def _year(value: str) -> int:
+    """Converte o ano de dois ou quatro dígitos com a mesma regra do `%y`."""
+    year = int(value)
+    if len(value) > 2:  # noqa: PLR2004
+        return year
+    return year + (2000 if year < CENTURY_PIVOT else 1900)
+
+
+def _date(day: str, month: str, year: str, periodo: str) -> date:
+    """Monta a data, levantando `PeriodFormatError` para dias e meses inexistentes."""
+    try:
+        return date(_year(year), int(month), int(day))
+    except ValueError as error:
+        msg = f"Data inválida no período '{periodo}': {error}"
+        raise PeriodFormatError(msg) from error
+
+
+@lru_cache(maxsize=4096)
+def parse_period(periodo: str) -> Period:
+    """Interpreta um período `dd/mm/yy - dd/mm/yy`, memorizando os períodos repetidos."""
+    period = _parse(periodo)
+    if period.end < period.start:
+        msg = f"Período com fim anterior ao início: '{periodo}'"
+        raise PeriodFormatError(msg)
+    return period
+
+
+def _parse(periodo: str) -> Period:
+    """Separa as datas do período, pelo caminho rápido ou pela expressão regular."""
+    # Caminho rápido: fatias fixas no formato exato exibido pelo portal
+    if (
+        len(periodo) == FAST_PERIOD_LENGTH
+        and periodo[2] == periodo[5] == periodo[13] == periodo[16] == "/"
+        and periodo[8:11] == " - "
+        and (periodo[0:2] + periodo[3:5] + periodo[6:8]).isdigit()
+        and (periodo[11:13] + periodo[14:16] + periodo[17:19]).isdigit()
+    ):
+        return Period(
+            _date(periodo[0:2], periodo[3:5], periodo[6:8], periodo),
+            _date(periodo[11:13], periodo[14:16], periodo[17:19], periodo),
+        )
+
+    match = PERIOD_PATTERN.fullmatch(periodo)
+    if match is None:
+        msg = f"Período fora do formato 'dd/mm/yy - dd/mm/yy': '{periodo}'"
+        raise PeriodFormatError(msg)
+    start_day, start_month, start_year, end_day, end_month, end_year = match.groups()
+    return Period(
+        _date(start_day, start_month, start_year, periodo),
+        _date(end_day, end_month, end_year, periodo),
+    )
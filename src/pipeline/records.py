@@ -0,0 +1,108 @@
+"""Módulo dos registros tipados de disciplinas e atividades, compactos em memória."""
+
+import sys
+from collections.abc import Iterable
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from src.common.errors.errors import PeriodFormatError
+from src.pipeline.periods import parse_period
+
+# As datas são usadas só nas anotações
+if TYPE_CHECKING:
+    from datetime import date
+
+
+class Activity:
+    """Atividade de uma disciplina, com o período já interpretado."""
+
+    __slots__ = ("end", "nome_atividade", "periodo", "start", "tipo_atividade")
+
+    def __init__(self, nome_atividade: str, tipo_atividade: str, periodo: str) -> None:
+        """Cria a atividade, internando o tipo e interpretando o período uma única vez."""
+        self.nome_atividade = nome_atividade
+        """Nome da atividade exibido no portal."""
+
+        self.tipo_atividade = sys.intern(tipo_atividade)
+        """Tipo da atividade, internado: poucos valores se repetem em todas as disciplinas."""
+
+        self.periodo = periodo
+        """Período no formato original, `dd/mm/yy - dd/mm/yy`, preservado na exportação."""
+
+        self.start: date | None = None
+        """Data de início, ou `None` quando o período é inválido."""
+
+        self.end: date | None = None
+        """Data de fim, ou `None` quando o período é inválido."""
+
+        # As datas vêm do `Period` em cache, compartilhado pelas atividades do mesmo período
+        with suppress(PeriodFormatError):
+            self.start, self.end = parse_period(periodo)
+
+    @classmethod
+    def from_dict(cls, atividade: dict[str, Any]) -> "Activity":
+        """Cria a atividade a partir do dicionário gravado no JSON e no cache de disciplinas."""
+        return cls(
+            str(atividade["nome_atividade"]),
+            str(atividade.get("tipo_atividade") or ""),
+            str(atividade["periodo"]),
+        )
+
+    def to_dict(self) -> dict[str, str]:
+        """Retorna a atividade no formato de `informacoes_disciplinas.json`."""
+        return {
+            "nome_atividade": self.nome_atividade,
+            "tipo_atividade": self.tipo_atividade,
+            "periodo": self.periodo,
+        }
+
+    def __repr__(self) -> str:
+        """Representa a atividade pelo nome, tipo e período."""
+        return f"Activity({self.nome_atividade!r}, {self.tipo_atividade!r}, {self.periodo!r})"
+
+
+class Subject:
+    """Disciplina com o link da linha do tempo e as suas atividades."""
+
+    __slots__ = ("atividades", "link_disciplina", "nome")
+
+    def __init__(self, nome: str, link_disciplina: str | None, atividades: list[Activity]) -> None:
+        """Cria a disciplina."""
+        self.nome = nome
+        """Nome da disciplina, usado como chave no JSON e no YAML."""
+
+        self.link_disciplina = link_disciplina
+        """Link da linha do tempo da disciplina no portal."""
+
+        self.atividades = atividades
+        """Atividades da disciplina, na ordem do portal."""
+
+    @classmethod
+    def from_dict(cls, nome: str, dados: dict[str, Any]) -> "Subject":
+        """Cria a disciplina a partir de um resultado de captura ou de uma entrada do JSON."""
+        return cls(
+            nome,
+            dados.get("link_disciplina"),
+            [Activity.from_dict(atividade) for atividade in dados["atividades"]],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Retorna a disciplina no formato de `informacoes_disciplinas.json`, sem o nome."""
+        return {
+            "link_disciplina": self.link_disciplina,
+            "atividades": [atividade.to_dict() for atividade in self.atividades],
+        }
+
+    def __repr__(self) -> str:
+        """Representa a disciplina pelo nome e pela quantidade de atividades."""
+        return f"Subject({self.nome!r}, {len(self.atividades)} atividades)"
+
+
+def subjects_from_dict(informacoes: dict[str, Any]) -> list[Subject]:
+    """Converte o conteúdo de `informacoes_disciplinas.json` em registros."""
+    return [Subject.from_dict(nome, dados) for nome, dados in informacoes.items()]
+
+
+def subjects_to_dict(subjects: Iterable[Subject]) -> dict[str, Any]:
+    """Converte os registros no conteúdo de `informacoes_disciplinas.json`."""
+    return {subject.nome: subject.to_dict() for subject in subjects}
@@ -0,0 +1,185 @@
+"""Módulo de resiliência da navegação: novas tentativas com backoff e disjuntor por execução."""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from threading import Lock
+from typing import Any
+
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException
+
+from src.common.base.base_class import BaseClass
+from src.common.errors.errors import CircuitOpenError
+from src.infrastructure.logger import LoggerSingleton
+from src.infrastructure.metrics import MetricsRecorder
+
+DEFAULT_RETRY: dict[str, float] = {
+    "attempts": 3,
+    "base_delay": 0.5,
+    "max_delay": 8.0,
+    "failure_threshold": 10,
+}
+"""Valores padrão da seção `retry` das configurações."""
+
+SESSION_LOST_ERRORS: tuple[type[Exception], ...] = (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+)
+"""Exceções que indicam que a sessão do WebDriver morreu e precisa ser recriada."""
+
+
+class CircuitBreaker(BaseClass):
+    """Interrompe as chamadas ao portal após uma sequência de falhas na mesma execução."""
+
+    def __init__(self, threshold: int) -> None:
+        """Inicializa o disjuntor fechado com o limite de falhas consecutivas."""
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.threshold = max(1, threshold)
+        """Falhas consecutivas que abrem o disjuntor."""
+
+        self.failures = 0
+        """Falhas consecutivas desde o último sucesso."""
+
+        self.is_open = False
+        """Indica se o disjuntor abriu; permanece aberto até o fim da execução."""
+
+        self._lock = Lock()
+        """Protege o contador quando as disciplinas são capturadas em paralelo."""
+
+    def check(self, step: str) -> None:
+        """Levanta `CircuitOpenError` se o disjuntor estiver aberto."""
+        if self.is_open:
+            msg = f"Disjuntor aberto após {self.failures} falhas, etapa '{step}' não executada"
+            raise CircuitOpenError(msg)
+
+    def record_success(self) -> None:
+        """Zera a sequência de falhas."""
+        with self._lock:
+            self.failures = 0
+
+    def record_failure(self, step: str) -> None:
+        """Conta uma falha e abre o disjuntor ao atingir o limite."""
+        with self._lock:
+            self.failures += 1
+            if self.is_open or self.failures < self.threshold:
+                return
+            self.is_open = True
+        self.logger.error(
+            f"Disjuntor aberto na etapa '{step}' após {self.failures} falhas consecutivas; "
+            f"as próximas chamadas ao portal nesta execução serão ignoradas"
+        )
+
+
+class RetryPolicy(BaseClass):
+    """Repete as etapas de navegação e extração com backoff exponencial e jitter."""
+
+    def __init__(
+        self, config: dict[str, Any] | None = None, metrics: MetricsRecorder | None = None
+    ) -> None:
+        """Inicializa a política a partir da seção `retry` das configurações."""
+        config = {**DEFAULT_RETRY, **(config or {})}
+
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.attempts = max(1, int(config["attempts"]))
+        """Quantidade máxima de tentativas de cada etapa, incluindo a primeira."""
+
+        self.base_delay = float(config["base_delay"])
+        """Espera máxima, em segundos, antes da segunda tentativa; dobra a cada nova falha."""
+
+        self.max_delay = float(config["max_delay"])
+        """Limite, em segundos, da espera entre tentativas, que mantém a latência de cauda."""
+
+        self.breaker = CircuitBreaker(int(config["failure_threshold"]))
+        """Disjuntor compartilhado por todas as etapas da execução."""
+
+        self.metrics = metrics or MetricsRecorder()
+        """Registro de métricas onde as novas tentativas são contadas."""
+
+        self.spent: dict[str, float] = {}
+        """Duração, em segundos, das chamadas de cada etapa que precisaram de novas tentativas."""
+
+        self._lock = Lock()
+        """Protege o acumulado de tempo quando usado por várias threads."""
+
+    def backoff(self, attempt: int) -> float:
+        """Retorna a espera após a falha informada, sorteada entre zero e o teto exponencial."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)  # noqa: S311
+
+    def call(
+        self,
+        step: str,
+        func: Callable[..., Any],
+        *args: Any,
+        retry_on: tuple[type[BaseException], ...],
+        on_retry: Callable[[BaseException], None] | None = None,
+    ) -> Any:
+        """Executa a função, repetindo-a nas exceções de `retry_on` até esgotar as tentativas."""
+        start = time.perf_counter()
+        for attempt in range(1, self.attempts + 1):
+            self.breaker.check(step)
+            try:
+                result = func(*args)
+            except retry_on as error:
+                self.breaker.record_failure(step)
+                if attempt == self.attempts or self.breaker.is_open:
+                    if attempt > 1:
+                        self._record(step, time.perf_counter() - start)
+                    raise
+                time.sleep(self._retry_delay(step, attempt, error))
+                if on_retry is not None:
+                    on_retry(error)
+            else:
+                self.breaker.record_success()
+                if attempt > 1:
+                    self._record(step, time.perf_counter() - start)
+                return result
+        return None
+
+    async def call_async(
+        self,
+        step: str,
+        func: Callable[[], Awaitable[Any]],
+        *,
+        retry_on: tuple[type[BaseException], ...],
+    ) -> Any:
+        """Versão de `call` para corrotinas, que aguarda o backoff sem travar o laço de eventos."""
+        start = time.perf_counter()
+        for attempt in range(1, self.attempts + 1):
+            self.breaker.check(step)
+            try:
+                result = await func()
+            except retry_on as error:
+                self.breaker.record_failure(step)
+                if attempt == self.attempts or self.breaker.is_open:
+                    if attempt > 1:
+                        self._record(step, time.perf_counter() - start)
+                    raise
+                await asyncio.sleep(self._retry_delay(step, attempt, error))
+            else:
+                self.breaker.record_success()
+                if attempt > 1:
+                    self._record(step, time.perf_counter() - start)
+                return result
+        return None
+
+    def _retry_delay(self, step: str, attempt: int, error: BaseException) -> float:
+        """Registra a falha que será repetida e retorna a espera antes da nova tentativa."""
+        delay = self.backoff(attempt)
+        self.logger.warning(
+            f"Falha na etapa '{step}' ({type(error).__name__}), tentativa "
+            f"{attempt}/{self.attempts}; repetindo em {delay:.2f} s"
+        )
+        self.metrics.increment("retries")
+        self.metrics.increment(f"retries.{step}")
+        return delay
+
+    def _record(self, step: str, elapsed: float) -> None:
+        """Acumula o tempo de uma etapa que precisou de novas tentativas."""
+        with self._lock:
+            self.spent[step] = self.spent.get(step, 0.0) + elapsed
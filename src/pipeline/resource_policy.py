@@ -0,0 +1,139 @@
+"""Módulo da política de bloqueio de recursos de rede aplicada às sessões do Chrome."""
+
+import json
+from collections import Counter
+from threading import Lock
+from typing import Any
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from src.common.base.base_class import BaseClass
+from src.infrastructure.logger import LoggerSingleton
+
+RESOURCE_PATTERNS: dict[str, list[str]] = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "stylesheet": ["*.css"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.ogg", "*.wav", "*.m3u8"],
+}
+"""Padrões de URL bloqueados para cada tipo de recurso."""
+
+
+class ResourcePolicy(BaseClass):
+    """Bloqueia tipos de recurso e domínios de terceiros e contabiliza as requisições bloqueadas."""
+
+    def __init__(self, config: dict[str, Any] | None = None) -> None:
+        """Inicializa a política a partir da seção `resource_policy` das configurações."""
+        config = config or {}
+
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.enabled = bool(config.get("enabled", False))
+        """Indica se a política é aplicada às sessões do Chrome."""
+
+        self.block_types = [str(item) for item in config.get("block_types", [])]
+        """Tipos de recurso bloqueados (`image`, `font`, `stylesheet`, `media`)."""
+
+        self.deny_domains = [str(item) for item in config.get("deny_domains", [])]
+        """Domínios sempre bloqueados, incluindo seus subdomínios."""
+
+        self.allow_domains = [str(item) for item in config.get("allow_domains", [])]
+        """Domínios permitidos; quando preenchida, bloqueia todos os demais domínios."""
+
+        self.blocked_requests: Counter[str] = Counter()
+        """Requisições bloqueadas, agrupadas por tipo de recurso."""
+
+        self.transferred_bytes = 0
+        """Bytes que as sessões ainda transferiram com a política ativa, não os evitados."""
+
+        self.finished_requests = 0
+        """Total de requisições concluídas pelas sessões."""
+
+        self._lock = Lock()
+        """Protege os contadores quando várias sessões são coletadas em paralelo."""
+
+        unknown_types = set(self.block_types) - RESOURCE_PATTERNS.keys()
+        if unknown_types:
+            self._handle_value_error(f"Tipos de recurso inválidos: {sorted(unknown_types)}")
+
+    def blocked_urls(self) -> list[str]:
+        """Retorna os padrões de URL enviados ao `Network.setBlockedURLs`."""
+        patterns = [pattern for kind in self.block_types for pattern in RESOURCE_PATTERNS[kind]]
+        for domain in self.deny_domains:
+            patterns.extend([f"*://{domain}/*", f"*://*.{domain}/*"])
+        return patterns
+
+    def apply_options(self, chrome_options: webdriver.ChromeOptions) -> None:
+        """Configura as opções do Chrome antes da criação da sessão."""
+        if not self.enabled:
+            return
+
+        # Habilita o log de desempenho usado para contabilizar as requisições
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        if "image" in self.block_types:
+            chrome_options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+
+        # Resolve apenas os domínios permitidos; os demais falham na resolução de nomes
+        if self.allow_domains:
+            excludes = ", ".join(
+                f"EXCLUDE {host}"
+                for domain in self.allow_domains
+                for host in (domain, f"*.{domain}")
+            )
+            chrome_options.add_argument(f"--host-resolver-rules=MAP * ~NOTFOUND, {excludes}")
+
+    def apply(self, driver: webdriver.Chrome) -> None:
+        """Aplica o bloqueio de URLs na sessão recém-criada via Chrome DevTools Protocol."""
+        if not self.enabled:
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls()})
+
+    def collect(self, driver: webdriver.Chrome) -> None:
+        """Contabiliza as requisições bloqueadas e os bytes transferidos pela sessão."""
+        if not self.enabled:
+            return
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException:
+            self.logger.warning("Log de desempenho indisponível, tráfego não contabilizado")
+            return
+
+        blocked: Counter[str] = Counter()
+        transferred = 0
+        finished = 0
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            if message["method"] == "Network.loadingFailed":
+                if params.get("blockedReason") or "NAME_NOT_RESOLVED" in params.get(
+                    "errorText", ""
+                ):
+                    blocked[params.get("type", "Other")] += 1
+            elif message["method"] == "Network.loadingFinished":
+                transferred += int(params.get("encodedDataLength", 0))
+                finished += 1
+
+        with self._lock:
+            self.blocked_requests.update(blocked)
+            self.transferred_bytes += transferred
+            self.finished_requests += finished
+
+    def report(self) -> None:
+        """Registra no log as requisições bloqueadas e o tráfego transferido com a política."""
+        if not self.enabled:
+            return
+        total = sum(self.blocked_requests.values())
+        detalhes = ", ".join(f"{kind}: {count}" for kind, count in self.blocked_requests.items())
+        self.logger.info(f"Requisições bloqueadas pela política de recursos: {total} ({detalhes})")
+        # O Chrome não informa o tamanho das requisições bloqueadas, que nunca recebem resposta;
+        # a economia é a diferença para uma execução com `resource_policy.enabled: false`
+        self.logger.info(
+            f"Tráfego transferido com a política ativa: {self.transferred_bytes / 1024:.1f} KiB "
+            f"em {self.finished_requests} requisições"
+        )
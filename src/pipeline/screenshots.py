@@ -0,0 +1,138 @@
+"""Módulo de gravação das capturas de tela em segundo plano no modo de depuração."""
+
+import importlib.util
+import io
+import time
+from pathlib import Path
+from queue import Queue
+from threading import Lock, Thread
+from typing import Any
+
+from src.common.base.base_class import BaseClass
+from src.config.constypes import PathLike
+from src.infrastructure.logger import LoggerSingleton
+
+IMAGE_FORMATS: dict[str, str] = {"png": "PNG", "jpeg": "JPEG", "webp": "WEBP"}
+"""Formatos de imagem aceitos e o nome correspondente no Pillow."""
+
+
+class ScreenshotWriter(BaseClass):
+    """Numera as capturas em memória e grava os arquivos em uma thread dedicada."""
+
+    def __init__(self, directory: PathLike, config: dict[str, Any] | None = None) -> None:
+        """Inicializa o gravador a partir da seção `screenshots` das configurações."""
+        config = config or {}
+
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.directory = Path(directory)
+        """Diretório onde as capturas de tela são gravadas."""
+
+        self.image_format = str(config.get("format", "png")).lower()
+        """Formato dos arquivos gravados: `png`, `jpeg` ou `webp`."""
+
+        self.max_width = config.get("max_width")
+        """Largura máxima, em pixels, das imagens convertidas (None mantém o tamanho original)."""
+
+        self.quality = int(config.get("quality", 80))
+        """Qualidade da compressão dos formatos `jpeg` e `webp`."""
+
+        self.written = 0
+        """Quantidade de capturas gravadas em disco."""
+
+        self.write_seconds = 0.0
+        """Tempo total, em segundos, gasto pela thread de gravação."""
+
+        self._queue: Queue[tuple[Path, bytes] | None] = Queue(
+            maxsize=int(config.get("queue_size", 32))
+        )
+        """Fila limitada de capturas pendentes; bloqueia a captura quando cheia."""
+
+        self._counter = 0
+        """Última etiqueta numérica atribuída a uma captura."""
+
+        self._lock = Lock()
+        """Protege o contador de etiquetas."""
+
+        self._thread: Thread | None = None
+        """Thread que consome a fila e grava os arquivos."""
+
+        if self.image_format not in IMAGE_FORMATS:
+            self._handle_value_error(f"Formato de captura inválido: '{self.image_format}'")
+
+        if self._needs_conversion() and importlib.util.find_spec("PIL") is None:
+            self.logger.warning("Pillow não instalado, capturas serão gravadas em PNG")
+            self.image_format = "png"
+            self.max_width = None
+
+    def _needs_conversion(self) -> bool:
+        """Indica se os bytes PNG precisam ser convertidos ou redimensionados antes da gravação."""
+        return self.image_format != "png" or self.max_width is not None
+
+    def start(self) -> None:
+        """Cria o diretório, retoma a numeração existente e inicia a thread de gravação."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Lê o diretório uma única vez para continuar a numeração de capturas anteriores
+        tags = [
+            int(image_file.name.split("_")[0])
+            for image_file in self.directory.iterdir()
+            if image_file.name.split("_")[0].isdigit()
+        ]
+        self._counter = max(tags, default=0)
+
+        self._thread = Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, filename: str, png: bytes) -> Path:
+        """Agenda a gravação dos bytes PNG e retorna o caminho final do arquivo."""
+        with self._lock:
+            self._counter += 1
+            tag = self._counter
+        path = self.directory / f"{tag}_{filename}.{self.image_format}"
+        self._queue.put((path, png))
+        return path
+
+    def _run(self) -> None:
+        """Consome a fila até receber o sinal de encerramento."""
+        while (item := self._queue.get()) is not None:
+            path, png = item
+            start = time.perf_counter()
+            try:
+                path.write_bytes(self._convert(png))
+            except (OSError, ValueError):
+                self.logger.exception(f"Erro ao gravar a captura de tela '{path}'")
+            else:
+                self.written += 1
+                self.logger.debug(f"Captura de tela salva em: {path}")
+            self.write_seconds += time.perf_counter() - start
+
+    def _convert(self, png: bytes) -> bytes:
+        """Converte e redimensiona a captura conforme o formato configurado."""
+        if not self._needs_conversion():
+            return png
+
+        from PIL import Image  # noqa: PLC0415
+
+        with Image.open(io.BytesIO(png)) as image:
+            converted = image.convert("RGB") if self.image_format == "jpeg" else image.copy()
+        if self.max_width and converted.width > self.max_width:
+            height = round(converted.height * self.max_width / converted.width)
+            converted = converted.resize((self.max_width, height))
+
+        buffer = io.BytesIO()
+        converted.save(buffer, format=IMAGE_FORMATS[self.image_format], quality=self.quality)
+        return buffer.getvalue()
+
+    def close(self) -> None:
+        """Aguarda a gravação das capturas pendentes e encerra a thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self.logger.info(
+            f"Capturas de tela gravadas: {self.written} em {self.write_seconds:.2f} s "
+            f"fora da thread de navegação"
+        )
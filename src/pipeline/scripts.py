@@ -0,0 +1,57 @@
+"""Módulo com os scripts JavaScript executados nas páginas do portal via `execute_script`."""
+
+ACTIVITIES_SCRIPT: str = """
+const text = (element) => (element ? element.innerText.trim() : null);
+const atividades = document.querySelectorAll("#js-activities-container .atividades");
+return Array.from(atividades, (atividade) => {
+    const titulo = atividade.querySelector("div.timeline-heading h4.timeline-title");
+    return {
+        tipo_atividade: titulo ? titulo.innerText.trim().split("\\n")[0] : null,
+        nome_atividade: text(
+            atividade.querySelector("div.timeline-heading h4.timeline-title small")
+        ),
+        periodo: text(atividade.querySelector("small.text-muted em")),
+    };
+});
+"""
+"""Extrai tipo, nome e período de todas as atividades da linha do tempo em uma única chamada."""
+
+CONTAINER_SCRIPT: str = """
+const container = document.getElementById("js-activities-container");
+return container ? container.outerHTML : null;
+"""
+"""Retorna o HTML da linha do tempo, usado como impressão digital do conteúdo da disciplina."""
+
+NAVIGATE_SCRIPT: str = """
+const url = arguments[0];
+// Marca o documento atual, que deixa de valer assim que a nova página substituí-lo
+window.__colaborarNavegando = true;
+window.setTimeout(() => { window.location.href = url; }, 0);
+"""
+"""Agenda a navegação da aba para a URL informada sem aguardar o carregamento da página."""
+
+PAGE_READY_SCRIPT: str = """
+// Sem comparar URLs, redirecionamentos do servidor (barra final, query, https) não atrasam a aba
+return window.__colaborarNavegando !== true
+    && document.readyState === "complete"
+    && document.getElementById("js-activities-container") !== null;
+"""
+"""Indica se a aba já deixou a página anterior, terminou de carregar e exibe a linha do tempo."""
+
+BULK_ATTRIBUTES_SCRIPT: str = """
+const [selector, names] = arguments;
+const read = (element, name) => {
+    // Prefere a propriedade do DOM, como o `get_attribute` do WebDriver (ex.: `href` absoluto)
+    const value = element[name];
+    return typeof value === "string" ? value : element.getAttribute(name);
+};
+return Array.from(document.querySelectorAll(selector), (element) =>
+    Object.fromEntries(names.map((name) => [name, read(element, name)]))
+);
+"""
+"""Lê os atributos informados de todos os elementos que correspondem ao seletor CSS."""
+
+TAB_MEMORY_SCRIPT: str = """
+return performance.memory ? performance.memory.usedJSHeapSize : null;
+"""
+"""Retorna o heap JavaScript em uso pela aba, em bytes, quando exposto pelo Chrome."""
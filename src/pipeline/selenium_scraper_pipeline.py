@@ -1,44 +1,99 @@
 """Orquestrador principal: executa scraping, transformação e armazenamento."""
 
-import json
 import os
 import sys
 import time
+from collections.abc import Sequence
 from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
 from typing import Any
 
-import yaml
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.support import expected_conditions as ec
 
 from src.common.base.base_class import BaseClass
 from src.common.echo import echo
-from src.common.errors.errors import ProjectError
-from src.config.constants import BRT, IMAGE_DIR, OUTPUT_DIR, PROFILE_MODE, SETTINGS_FILE
+from src.common.errors.errors import CircuitOpenError, ProjectError
+from src.config.constants import (
+    BRT,
+    CACHE_DIR,
+    ICS_TEMPLATE_FILE,
+    IMAGE_DIR,
+    OUTPUT_DIR,
+    PROFILE_MODE,
+    SESSION_CACHE_FILE,
+    SUBJECT_CACHE_FILE,
+    USER_AGENT,
+)
 from src.config.constypes import PathLike
+from src.config.settings import as_settings, load_settings
+from src.infrastructure.log_context import bind_process_context
 from src.infrastructure.logger import LoggerSingleton
+from src.infrastructure.metrics import MetricsRecorder
+from src.pipeline.driver_resolver import DriverResolver
+from src.pipeline.exporters import Exporter
+from src.pipeline.extraction import filter_activities
+from src.pipeline.html_parsers import parse_activities, parse_subjects
+from src.pipeline.http_fetch_engine import HttpFetchEngine
+from src.pipeline.records import Subject
+from src.pipeline.resilience import SESSION_LOST_ERRORS, RetryPolicy
+from src.pipeline.resource_policy import ResourcePolicy
+from src.pipeline.screenshots import ScreenshotWriter
+from src.pipeline.scripts import (
+    ACTIVITIES_SCRIPT,
+    BULK_ATTRIBUTES_SCRIPT,
+    CONTAINER_SCRIPT,
+    NAVIGATE_SCRIPT,
+    PAGE_READY_SCRIPT,
+    TAB_MEMORY_SCRIPT,
+)
+from src.pipeline.session_cache import SessionCache
+from src.pipeline.snapshots import SnapshotStore
+from src.pipeline.subject_cache import SubjectCache, fingerprint
+from src.pipeline.waits import PageWaiter
+from src.pipeline.webdriver_pool import WebDriverPool, authenticate_driver
 
 # Verifica se o modo de perfil foi definido
 if not PROFILE_MODE:
     raise RuntimeError("O modo de perfil não foi definido.")
 
+LOGIN_BUTTON_SELECTOR: str = "button.btn.btn-primary.btn-lg.btn-block.mb-10"
+"""Seletor CSS do botão de login do portal."""
+
+SUBJECT_LINK_SELECTOR: str = "li.atividadesCronograma a.atividadeNome"
+"""Seletor CSS dos links das disciplinas na página do curso."""
+
+NAVIGATION_ERRORS: tuple[type[Exception], ...] = (TimeoutException, WebDriverException)
+"""Falhas de navegação e extração repetidas pela política de novas tentativas."""
+
 
 class SeleniumScraperPipeline(BaseClass):
     """Classe para automação de scraping com Selenium no portal ColaborarEAD."""
 
-    def __init__(self, config: dict[str, Any] | None = None, *, show_browser: bool = False) -> None:
+    def __init__(  # noqa: PLR0915
+        self,
+        config: dict[str, Any] | None = None,
+        *,
+        show_browser: bool = False,
+        output_dir: PathLike = OUTPUT_DIR,
+        cache_dir: PathLike = CACHE_DIR,
+    ) -> None:
         """Inicializa a instância do SeleniumScraperPipeline."""
         self.logger = LoggerSingleton().logger or LoggerSingleton.get_logger()
         """Logger singleton para registrar eventos e erros."""
 
-        self.settings = config if config else super()._load_file(SETTINGS_FILE)
-        """Configurações carregadas do arquivo ou fornecidas via parâmetro."""
+        self.settings = load_settings() if not config else as_settings(config)
+        """Configurações validadas, carregadas do arquivo ou fornecidas via parâmetro."""
 
         self.driver = None
         """Instância do WebDriver do Selenium."""
@@ -46,33 +101,108 @@ class SeleniumScraperPipeline(BaseClass):
         self.image_folder = IMAGE_DIR
         """Diretório onde as capturas de tela serão salvas."""
 
-        self.output_path = OUTPUT_DIR
+        self.screenshot_writer: ScreenshotWriter | None = None
+        """Gravador das capturas de tela em segundo plano, iniciado no modo de depuração."""
+
+        self.output_path = Path(output_dir)
         """Diretório de saída para arquivos gerados."""
 
-        self.login_url = "https://www.colaboraread.com.br/login/auth"
+        self.cache_dir = Path(cache_dir)
+        """Diretório dos caches de sessão e de disciplinas desta conta."""
+
+        self.login_url = self.settings.get(
+            "colaborar_url", "https://www.colaboraread.com.br/login/auth"
+        )
         """URL da página de login do portal."""
 
-        self.json_filepath = OUTPUT_DIR / "informacoes_disciplinas.json"
-        """Caminho do arquivo JSON de saída."""
+        self.ics_template_filepath = ICS_TEMPLATE_FILE
+        """Caminho do template ICS."""
 
-        self.yml_filepath = OUTPUT_DIR / "informacoes_disciplinas.yml"
-        """Caminho do arquivo YAML de saída."""
+        self.metrics = MetricsRecorder()
+        """Spans cronometrados das etapas e contadores de comandos do WebDriver."""
 
-        self.ics_filepath = OUTPUT_DIR / "informacoes_disciplinas.ics"
-        """Caminho do arquivo ICS de saída."""
+        self.account = str(self.settings.get("id") or self.settings.get("matricula", ""))
+        """Conta identificada nos logs estruturados: o `id` do lote ou a matrícula."""
 
-        self.ics_template_filepath = "./src/config/files/ics_template.ics"
-        """Caminho do template ICS."""
+        self.exporter = Exporter(
+            self.output_path,
+            self.settings.get("export_formats"),
+            ics_template=self.ics_template_filepath,
+            metrics=self.metrics,
+        )
+        """Exportação dos formatos selecionados em `export_formats`."""
 
         self.show_browser = show_browser
         """Define se o navegador será exibido (modo headless ou não)."""
 
-    def _convert_ics_date(self, date_str: str) -> str:
-        """Converte uma string de data do formato 'ddmmyy' para 'yyyymmdd'."""
-        return datetime.strptime(date_str, "%d%m%y").replace(tzinfo=BRT).strftime("%Y%m%d")
+        self.pool_size = self.settings.pool_size
+        """Quantidade de sessões do WebDriver usadas na captura concorrente das disciplinas."""
+
+        self.prefetch_tabs = self.settings.prefetch_tabs
+        """Disciplinas carregadas antecipadamente em abas enquanto a atual é extraída."""
+
+        self.extraction_mode = self.settings.extraction_mode
+        """Modo de extração das atividades: `element` (uma chamada por campo) ou `script`."""
+
+        self.fetch_engine = self.settings.fetch_engine
+        """Mecanismo de captura das disciplinas: `selenium` (navegador) ou `http` (requests)."""
+
+        self.http_max_workers = self.settings.http_max_workers
+        """Quantidade de requisições simultâneas do mecanismo HTTP."""
+
+        self.session_cache_minutes = self.settings.session_cache_minutes
+        """Validade, em minutos, da sessão salva em cache (0 desativa o cache)."""
+
+        self.session_cache = SessionCache(
+            self.cache_dir / SESSION_CACHE_FILE.name, ttl_seconds=self.session_cache_minutes * 60
+        )
+        """Cache em disco dos cookies e da URL do curso entre execuções."""
+
+        self.waiter = PageWaiter(self.settings.get("wait_timeouts"))
+        """Esperas explícitas por condições de prontidão, com orçamento por etapa."""
+
+        self.resource_policy = ResourcePolicy(self.settings.get("resource_policy"))
+        """Política de bloqueio de recursos de rede aplicada a cada sessão do Chrome."""
+
+        self.snapshot_mode = self.settings.snapshot_mode
+        """Modo das capturas de HTML: `off`, `record` (grava) ou `replay` (reproduz)."""
+
+        self.snapshots = SnapshotStore()
+        """Armazenamento das capturas de HTML em `data/html`."""
+
+        self.subject_cache_enabled = self.settings.subject_cache
+        """Define se disciplinas sem alteração reaproveitam as atividades da execução anterior."""
+
+        self.subject_cache: SubjectCache | None = None
+        """Cache de resultados por disciplina, aberto na captura das informações."""
+
+        self.driver_resolver = DriverResolver(self.settings.get("chromedriver_path"))
+        """Resolve o chromedriver uma única vez, com cache local por versão do Chrome."""
+
+        self.retry_policy = RetryPolicy(self.settings.get("retry"), self.metrics)
+        """Novas tentativas com backoff e disjuntor aplicados à navegação e à extração."""
+
+        self._extractors = {
+            "element": self._extract_activities,
+            "script": self._extract_activities_script,
+        }
+        """Mapeia cada modo de extração ao método que o implementa."""
+
+        self._validate_options()
+
+    def _validate_options(self) -> None:
+        """Valida os modos de execução configurados."""
+        if self.extraction_mode not in self._extractors:
+            self._handle_value_error(f"Modo de extração inválido: '{self.extraction_mode}'")
+
+        if self.fetch_engine not in {"selenium", "http"}:
+            self._handle_value_error(f"Mecanismo de captura inválido: '{self.fetch_engine}'")
+
+        if self.snapshot_mode not in {"off", "record", "replay"}:
+            self._handle_value_error(f"Modo de capturas inválido: '{self.snapshot_mode}'")
 
     def _setup_webdriver(self) -> webdriver.Chrome:
-        """Configura e inicializa o WebDriver do Chrome usando webdriver-manager."""
+        """Configura e inicializa o WebDriver do Chrome com o chromedriver resolvido."""
         chrome_options = webdriver.ChromeOptions()
         chrome_options.add_argument("--disable-dev-tools")
         chrome_options.add_argument("--log-level=3")
@@ -85,39 +215,27 @@ class SeleniumScraperPipeline(BaseClass):
         if not self.show_browser:
             chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/110.0.5481.77 Safari/537.36"
-        )
-        service = ChromeService(ChromeDriverManager().install(), log_path=os.devnull)
-        return webdriver.Chrome(service=service, options=chrome_options)
-
-    def _save_screenshot(self, filename: str, image_format: str = "png") -> None:
-        """Salva uma captura de tela do navegador em um diretório especificado."""
-        # Se o modo de perfil não for "debug", não executa a função
-        if PROFILE_MODE != "debug":
+        chrome_options.add_argument(f"user-agent={USER_AGENT}")
+        self.resource_policy.apply_options(chrome_options)
+        with self.metrics.span("driver_resolution"):
+            driver_path = self.driver_resolver.resolve()
+        service = ChromeService(driver_path, log_path=os.devnull)
+        with self.metrics.span("driver_startup"):
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.metrics.instrument_driver(driver)
+        self.resource_policy.apply(driver)
+        return driver
+
+    def _save_screenshot(self, filename: str) -> None:
+        """Captura a tela do navegador e agenda a gravação do arquivo em segundo plano."""
+        # Se o modo de perfil não for "debug" ou não houver navegador, não executa a função
+        if PROFILE_MODE != "debug" or self.driver is None or self.screenshot_writer is None:
             return
 
-        # Lista os arquivos existentes no diretório de imagens
-        existing_files: list[str] = []
-        for image_file in Path(self.image_folder).iterdir():
-            if image_file.is_file() and image_file.name.endswith(f".{image_format}"):
-                existing_files.append(image_file.name)
-
-        # Extrai as tags numéricas dos arquivos existentes
-        tags = []
-        for file in existing_files:
-            if "_" in file and file.split("_")[0].isdigit():
-                tags.append(int(file.split("_")[0]))
-
-        # Define a nova tag numérica
-        tag = str(max(tags) + 1) if tags else "1"
-        new_filename = f"{tag}_{filename}.{image_format}"
-
-        # Salva a captura de tela no caminho especificado
-        screenshot_path = Path(self.image_folder) / new_filename
-        self.driver.save_screenshot(screenshot_path)
-        self.logger.debug(f"Captura de tela salva em: {screenshot_path}")
+        # Captura os bytes na thread de navegação; a gravação em disco fica com o gravador
+        with self.metrics.span("screenshot"):
+            png = self.driver.get_screenshot_as_png()
+        self.screenshot_writer.submit(filename, png)
 
     def portal_login(self, username: str, password: str) -> None:
         """Realiza o login no site e captura screenshots em diferentes etapas do processo."""
@@ -126,7 +244,12 @@ class SeleniumScraperPipeline(BaseClass):
         # Abre a página de login
         self.logger.info(f"Abrindo o site de login: '{self.login_url}'")
         self.driver.get(self.login_url)
-        self.driver.implicitly_wait(5)
+        self.waiter.until(
+            self.driver,
+            "login",
+            ec.element_to_be_clickable((By.CSS_SELECTOR, LOGIN_BUTTON_SELECTOR)),
+            "botão de login clicável",
+        )
         self._save_screenshot("pagina_login")
 
         # Preenche o campo de login
@@ -141,80 +264,188 @@ class SeleniumScraperPipeline(BaseClass):
         password_field.send_keys(password)
         self._save_screenshot("campo_senha_preenchido")
 
-        # Fecha o aviso de cookies, se presente
-        try:
-            self.logger.info("Fechando o aviso de cookies")
-            cookies_button = self.driver.find_element(By.ID, "btnCookiesAuth")
+        # Fecha o aviso de cookies, se presente, sem aguardar quando ausente
+        self.logger.info("Fechando o aviso de cookies")
+        cookies_button = self.waiter.optional(self.driver, By.ID, "btnCookiesAuth")
+        if cookies_button is None:
+            self.logger.warning("Aviso de cookies não encontrado, prosseguindo")
+        else:
             cookies_button.click()
-            self.driver.implicitly_wait(1)
+            try:
+                self.waiter.until(
+                    self.driver,
+                    "optional",
+                    ec.invisibility_of_element(cookies_button),
+                    "aviso de cookies fechado",
+                )
+            except TimeoutException:
+                self.logger.warning("Aviso de cookies ainda visível, prosseguindo")
             self._save_screenshot("aviso_cookies_fechado")
-        except NoSuchElementException:
-            self.logger.warning("Aviso de cookies não encontrado, prosseguindo")
 
         # Clica no botão de login
         self.logger.info("Clicando no botão de login")
-        login_button = self.driver.find_element(
-            By.CSS_SELECTOR, "button.btn.btn-primary.btn-lg.btn-block.mb-10"
-        )
+        login_button = self.driver.find_element(By.CSS_SELECTOR, LOGIN_BUTTON_SELECTOR)
         login_button.click()
         self._save_screenshot("botao_login_clicado")
-        self.driver.implicitly_wait(5)
+        try:
+            self.waiter.until(
+                self.driver, "login", ec.url_changes(self.login_url), "saída da página de login"
+            )
+        except TimeoutException:
+            self.logger.warning("A página de login não foi redirecionada, prosseguindo")
 
     def access_course(self, curso_nome: str) -> None:
         """Acessa o curso especificado."""
         try:
             self.logger.info(f"Acessando o curso: '{curso_nome}'")
 
-            # Encontra e clica no botão do curso
-            course_button = self.driver.find_element(
-                By.CSS_SELECTOR,
-                f"button.btn.btn-primary.entrar[title='Entrar em {curso_nome}']",
+            # Recarrega a página inicial entre as tentativas de abrir o curso
+            self.retry_policy.call(
+                "access_course",
+                self._open_course,
+                curso_nome,
+                retry_on=NAVIGATION_ERRORS,
+                on_retry=lambda _: self.driver.refresh(),
             )
-            course_button.click()
-            self.driver.implicitly_wait(5)
 
             # Salva a captura de tela após clicar no botão
             self._save_screenshot("botao_acessar_curso_clicado")
-        except NoSuchElementException:
+        except (NoSuchElementException, TimeoutException, CircuitOpenError):
             self.logger.exception("Erro ao tentar acessar o curso")
 
+    def _open_course(self, curso_nome: str) -> None:
+        """Clica no botão do curso e aguarda a lista de disciplinas."""
+        course_button = self.waiter.until(
+            self.driver,
+            "course",
+            ec.element_to_be_clickable(
+                (
+                    By.CSS_SELECTOR,
+                    f"button.btn.btn-primary.entrar[title='Entrar em {curso_nome}']",
+                )
+            ),
+            "botão do curso clicável",
+        )
+        course_button.click()
+        self._wait_subject_list()
+
+    def _wait_subject_list(self) -> None:
+        """Aguarda a lista de disciplinas do curso estar presente na página."""
+        self.waiter.until(
+            self.driver,
+            "course",
+            ec.presence_of_element_located((By.CSS_SELECTOR, SUBJECT_LINK_SELECTOR)),
+            "lista de disciplinas",
+        )
+
+    def _require_subject_page(
+        self, driver: webdriver.Chrome, nome: str, *, navigated: bool = False
+    ) -> None:
+        """Aguarda a linha do tempo da disciplina, levantando `TimeoutException` se ausente."""
+        # Em abas pré-carregadas, confirma também que a aba já deixou a página anterior
+        condition = (
+            (lambda current: current.execute_script(PAGE_READY_SCRIPT))
+            if navigated
+            else ec.presence_of_element_located((By.ID, "js-activities-container"))
+        )
+        self.waiter.until(driver, "subject", condition, f"linha do tempo de '{nome}'")
+
+    def _wait_subject_page(self, driver: webdriver.Chrome, nome: str) -> None:
+        """Aguarda a linha do tempo da disciplina, seguindo adiante se ela não aparecer."""
+        try:
+            self._require_subject_page(driver, nome)
+        except TimeoutException:
+            self.logger.warning(f"Linha do tempo da disciplina '{nome}' não encontrada")
+
+    def _restore_session(self) -> bool:
+        """Reutiliza a sessão em cache no WebDriver, se ela ainda for aceita pelo portal."""
+        if self.session_cache_minutes <= 0:
+            return False
+
+        session = self.session_cache.load()
+        if session is None:
+            return False
+
+        # Valida a sessão com uma única requisição HTTP antes de abrir as páginas no navegador
+        with HttpFetchEngine(session["cookies"], max_workers=1, timeout=10) as engine:
+            if not engine.is_authenticated(session["landing_url"], self.login_url):
+                self.logger.info("Sessão em cache rejeitada pelo portal, realizando novo login")
+                self.session_cache.clear()
+                return False
+
+        self.logger.info("Reutilizando a sessão em cache, login ignorado")
+        authenticate_driver(self.driver, session["cookies"], self.login_url)
+        self.driver.get(session["landing_url"])
+        try:
+            self._wait_subject_list()
+        except TimeoutException:
+            self.logger.warning("Lista de disciplinas não carregada com a sessão em cache")
+            self.session_cache.clear()
+            return False
+        return True
+
+    def _store_session(self) -> None:
+        """Salva os cookies e a URL atual do curso no cache de sessão."""
+        if self.session_cache_minutes <= 0:
+            return
+        try:
+            self.session_cache.save(self.driver.get_cookies(), self.driver.current_url)
+        except OSError:
+            self.logger.exception("Erro ao salvar a sessão em cache")
+
     def find_subjects(self, index_url: str, matricula: str) -> list[dict[str, str | Any]]:
         """Encontra os links e nomes das disciplinas disponíveis."""
         try:
             self.logger.info("Encontrando links e nomes das disciplinas")
-            disciplinas = self.driver.find_elements(
-                By.CSS_SELECTOR, "li.atividadesCronograma a.atividadeNome"
-            )
 
-            # Coleta as informações das disciplinas
-            disciplinas_info = []
-            for disciplina in disciplinas:
-                if disciplina.get_attribute("href") and disciplina.get_attribute("title"):
-                    disciplinas_info.append(
-                        {
-                            "nome": disciplina.get_attribute("title").strip(),
-                            "link": disciplina.get_attribute("href"),
-                        }
+            # Coleta as informações das disciplinas a partir da captura gravada
+            if self.snapshot_mode == "replay":
+                dashboard_url, dashboard_html = self.snapshots.load_dashboard()
+                disciplinas_info = parse_subjects(dashboard_html, dashboard_url)
+            else:
+                # Coleta todos os pares de link e título com uma única chamada ao navegador
+                disciplinas_info = [
+                    {"nome": registro["title"].strip(), "link": registro["href"]}
+                    for registro in self.bulk_extract_attributes(
+                        SUBJECT_LINK_SELECTOR, ("href", "title")
                     )
+                    if registro["href"] and registro["title"]
+                ]
 
-            # Filtra as disciplinas
+                # Grava a página do curso, se em modo "record"
+                if self.snapshot_mode == "record":
+                    self.snapshots.record_dashboard(
+                        self.driver.current_url, self.driver.page_source
+                    )
+
+            # Filtra o link geral do curso e as disciplinas repetidas, mantendo a ordem
+            links_vistos = {f"{index_url}/{matricula}"}
             disciplinas_filtradas = []
             for info in disciplinas_info:
-                if info["link"] != f"{index_url}/{matricula}":
-                    disciplinas_filtradas.append(info)
-
-            # Loga as disciplinas encontradas
-            for info in disciplinas_filtradas:
+                if info["link"] in links_vistos:
+                    continue
+                links_vistos.add(info["link"])
+                disciplinas_filtradas.append(info)
                 self.logger.info(f"Disciplina encontrada: '{info['nome']}'")
 
             self._save_screenshot("disciplinas_encontradas")
 
-        except NoSuchElementException:
+        except (NoSuchElementException, JavascriptException):
             self.logger.exception("Erro ao tentar encontrar os links e nomes das disciplinas")
             return []
         else:
             return disciplinas_filtradas
 
+    def bulk_extract_attributes(
+        self,
+        selector: str,
+        attributes: Sequence[str],
+        driver: webdriver.Chrome | None = None,
+    ) -> list[dict[str, str | None]]:
+        """Lê os atributos de todos os elementos do seletor CSS com um único `execute_script`."""
+        driver = driver or self.driver
+        return driver.execute_script(BULK_ATTRIBUTES_SCRIPT, selector, list(attributes)) or []
+
     def capture_subjects(self, disciplinas_info: list[dict[str, str | Any]]) -> None:
         """Acessa cada disciplina e tira uma captura de tela."""
         # Itera sobre cada disciplina
@@ -223,7 +454,7 @@ class SeleniumScraperPipeline(BaseClass):
                 # Acessa a página da disciplina
                 self.logger.info(f"Acessando a disciplina: {disciplina['nome']}")
                 self.driver.get(disciplina["link"])
-                self.driver.implicitly_wait(5)
+                self._wait_subject_page(self.driver, disciplina["nome"])
 
                 # Salva a captura de tela da disciplina
                 screenshot_filename = f"{disciplina['nome'].replace(' ', '_')}"
@@ -238,171 +469,445 @@ class SeleniumScraperPipeline(BaseClass):
             except RuntimeError:
                 self.logger.exception(f"Erro ao acessar a disciplina '{disciplina['nome']}'")
 
-    def fetch_subjects_information(
-        self,
-        disciplinas_info: list[dict[str, str | Any]],
-        atividades_ignoradas: list[str | Any],
-    ) -> dict[str, str | list[dict[str, str]]]:
-        """Captura informações de cada disciplina e as salva em um JSON."""
-        # Itera sobre cada disciplina para capturar suas informações
-        informacoes_disciplinas: dict[str, Any] = {}
-        for disciplina in disciplinas_info:
-            try:
-                # Acessa a página da disciplina
-                self.logger.debug(f"Capturando informações da disciplina: {disciplina['nome']}")
-                self.driver.get(disciplina["link"])
-                self.driver.implicitly_wait(5)
+    def _extract_activities(
+        self, driver: webdriver.Chrome, atividades_ignoradas: list[str | Any]
+    ) -> list[dict[str, str]]:
+        """Extrai as atividades da página de disciplina aberta no WebDriver informado."""
+        # Encontra os elementos das atividades na página da disciplina
+        atividades_elements = driver.find_elements(
+            By.CSS_SELECTOR, "#js-activities-container .atividades"
+        )
 
-                # Encontra os elementos das atividades na página da disciplina
-                atividades_elements = self.driver.find_elements(
-                    By.CSS_SELECTOR, "#js-activities-container .atividades"
+        # Itera sobre cada elemento de atividade para extrair suas informações
+        atividades = []
+        for atividade_element in atividades_elements:
+            try:
+                # Extrai o tipo de atividade
+                tipo_atividade = (
+                    atividade_element.find_element(
+                        By.CSS_SELECTOR, "div.timeline-heading h4.timeline-title"
+                    )
+                    .text.strip()
+                    .split("\n")[0]
                 )
 
-                # Itera sobre cada elemento de atividade para extrair suas informações
-                atividades = []
-                for atividade_element in atividades_elements:
-                    try:
-                        # Extrai o tipo de atividade
-                        tipo_atividade = (
-                            atividade_element.find_element(
-                                By.CSS_SELECTOR, "div.timeline-heading h4.timeline-title"
-                            )
-                            .text.strip()
-                            .split("\n")[0]
-                        )
-
-                        # Ignora atividades que estão na lista de atividades ignoradas
-                        if any(ignorada in tipo_atividade for ignorada in atividades_ignoradas):
-                            continue
-
-                        # Extrai o nome e o período da atividade
-                        nome_atividade = atividade_element.find_element(
-                            By.CSS_SELECTOR, "div.timeline-heading h4.timeline-title small"
-                        ).text.strip()
-
-                        periodo = atividade_element.find_element(
-                            By.CSS_SELECTOR, "small.text-muted em"
-                        ).text.strip()
-
-                        # Adiciona a atividade à lista de atividades da disciplina
-                        atividades.append(
-                            {
-                                "nome_atividade": nome_atividade,
-                                "tipo_atividade": tipo_atividade,
-                                "periodo": periodo,
-                            }
-                        )
-                    except NoSuchElementException:
-                        continue
-
-                # Adiciona as informações da disciplina ao dicionário
-                informacoes_disciplinas[disciplina["nome"]] = {
-                    "link_disciplina": disciplina["link"],
-                    "atividades": atividades,
-                }
-                self.logger.info(f"Informações da disciplina '{disciplina['nome']}' capturadas.")
-            except RuntimeError:
-                self.logger.exception(
-                    f"Erro ao capturar informações da disciplina '{disciplina['nome']}'"
+                # Ignora atividades que estão na lista de atividades ignoradas
+                if any(ignorada in tipo_atividade for ignorada in atividades_ignoradas):
+                    continue
+
+                # Extrai o nome e o período da atividade
+                nome_atividade = atividade_element.find_element(
+                    By.CSS_SELECTOR, "div.timeline-heading h4.timeline-title small"
+                ).text.strip()
+
+                periodo = atividade_element.find_element(
+                    By.CSS_SELECTOR, "small.text-muted em"
+                ).text.strip()
+
+                # Adiciona a atividade à lista de atividades da disciplina
+                atividades.append(
+                    {
+                        "nome_atividade": nome_atividade,
+                        "tipo_atividade": tipo_atividade,
+                        "periodo": periodo,
+                    }
                 )
+            except NoSuchElementException:
+                continue
+
+        return atividades
+
+    def _extract_activities_script(
+        self, driver: webdriver.Chrome, atividades_ignoradas: list[str | Any]
+    ) -> list[dict[str, str]]:
+        """Extrai as atividades da página aberta com um único `execute_script`."""
+        registros: list[dict[str, str | None]] = driver.execute_script(ACTIVITIES_SCRIPT) or []
+        return filter_activities(registros, atividades_ignoradas)
+
+    def _extract_with_cache(
+        self, driver: webdriver.Chrome, link: str, atividades_ignoradas: list[str | Any]
+    ) -> list[dict[str, str]]:
+        """Extrai as atividades da página aberta, reaproveitando o cache se ela não mudou."""
+        extractor = self._extractors[self.extraction_mode]
+        if self.subject_cache is None:
+            return extractor(driver, atividades_ignoradas)
+
+        # Compara a impressão digital da linha do tempo antes de extrair campo a campo
+        container: str | None = driver.execute_script(CONTAINER_SCRIPT)
+        if container is None:
+            return extractor(driver, atividades_ignoradas)
+
+        digest = fingerprint(container)
+        atividades = self.subject_cache.lookup(link, digest)
+        if atividades is None:
+            atividades = extractor(driver, atividades_ignoradas)
+        self.subject_cache.store(link, digest, atividades)
+        return atividades
+
+    def _extract_subject(
+        self,
+        driver: webdriver.Chrome,
+        disciplina: dict[str, str | Any],
+        atividades_ignoradas: list[str | Any],
+    ) -> list[dict[str, str]]:
+        """Extrai as atividades da disciplina já carregada no WebDriver informado."""
+        # Grava a página da disciplina, se em modo "record"
+        if self.snapshot_mode == "record":
+            self.snapshots.record_subject(disciplina, driver.page_source)
+
+        inicio = time.perf_counter()
+        atividades = self._extract_with_cache(driver, disciplina["link"], atividades_ignoradas)
+        self.logger.debug(
+            f"Extração '{self.extraction_mode}' de '{disciplina['nome']}' concluída em "
+            f"{(time.perf_counter() - inicio) * 1000:.1f} ms"
+        )
+        return atividades
 
-        return informacoes_disciplinas
+    def _fetch_subject(
+        self,
+        driver: webdriver.Chrome,
+        disciplina: dict[str, str | Any],
+        atividades_ignoradas: list[str | Any],
+        *,
+        prefetched: bool = False,
+        pool: WebDriverPool | None = None,
+    ) -> dict[str, Any] | None:
+        """Acessa uma disciplina no WebDriver informado e retorna suas informações."""
+        # Uma sessão perdida é recriada: a principal no pipeline, as demais pelo pool de origem
+        main_session = driver is self.driver
+
+        def attempt() -> list[dict[str, str]]:
+            nonlocal prefetched
+            current = self.driver if main_session else driver
+            # Após uma falha, a página pré-carregada é descartada e aberta de novo
+            loaded, prefetched = prefetched, False
+            return self._load_subject(current, disciplina, atividades_ignoradas, loaded=loaded)
+
+        def restart(error: BaseException) -> None:
+            nonlocal driver
+            if main_session:
+                self._restart_lost_session(error)
+            elif pool is not None and isinstance(error, SESSION_LOST_ERRORS):
+                driver = self._replace_pool_session(pool, driver)
 
-    def _convert_json_to_yaml(self, json_filepath: PathLike, yml_filepath: PathLike) -> None:
-        """Converte um arquivo JSON para YML."""
-        yml_filepath = Path(yml_filepath)
-        json_filepath = Path(json_filepath)
-        data = super()._load_file(json_filepath)
+        try:
+            with self.metrics.span("subject", disciplina=disciplina["nome"]):
+                self.logger.debug(f"Capturando informações da disciplina: {disciplina['nome']}")
+                atividades = self.retry_policy.call(
+                    "subject",
+                    attempt,
+                    retry_on=NAVIGATION_ERRORS,
+                    on_retry=restart if main_session or pool is not None else None,
+                )
+        except CircuitOpenError:
+            self.logger.warning(f"Disciplina '{disciplina['nome']}' ignorada: disjuntor aberto")
+            return None
+        except (RuntimeError, *NAVIGATION_ERRORS):
+            self.logger.exception(
+                f"Erro ao capturar informações da disciplina '{disciplina['nome']}'"
+            )
+            return None
 
-        with yml_filepath.open("w", encoding="utf-8") as yml_file:
-            yaml.dump(data, yml_file, allow_unicode=True, default_flow_style=False)
+        self.logger.info(f"Informações da disciplina '{disciplina['nome']}' capturadas.")
+        return {
+            "link_disciplina": disciplina["link"],
+            "atividades": atividades,
+        }
 
-        self.logger.info(f"Arquivo YML salvo em '{yml_filepath}'.")
+    def _load_subject(
+        self,
+        driver: webdriver.Chrome,
+        disciplina: dict[str, str | Any],
+        atividades_ignoradas: list[str | Any],
+        *,
+        loaded: bool,
+    ) -> list[dict[str, str]]:
+        """Abre a disciplina, se ainda não carregada na aba, e extrai as atividades."""
+        if loaded:
+            # A navegação já foi iniciada na aba; apenas aguarda o fim do carregamento
+            self._require_subject_page(driver, disciplina["nome"], navigated=True)
+        else:
+            # Acessa a página da disciplina
+            driver.get(disciplina["link"])
+            self._require_subject_page(driver, disciplina["nome"])
+        return self._extract_subject(driver, disciplina, atividades_ignoradas)
+
+    def _restart_lost_session(self, error: BaseException) -> None:
+        """Reinicia o navegador e a sessão autenticada quando o WebDriver deixa de responder."""
+        if not isinstance(error, SESSION_LOST_ERRORS):
+            return
 
-    def _ensure_string(self, template: str, **kwargs: str) -> str:
-        """Garante que o template é string antes de aplicar .format."""
-        if not isinstance(template, str):
-            template = str(template)
-        return template.format(**kwargs)
+        self.logger.warning("Sessão do WebDriver perdida, reiniciando o navegador")
+        self.metrics.increment("driver_restarts")
+        with self.metrics.span("driver_restart"):
+            # Contabiliza o tráfego da sessão perdida; o novo driver já sai com a política aplicada
+            self.resource_policy.collect(self.driver)
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                self.logger.debug("WebDriver anterior já encerrado")
+            self.driver = self._setup_webdriver()
+            self._authenticate()
+
+    def _replace_pool_session(
+        self, pool: WebDriverPool, driver: webdriver.Chrome
+    ) -> webdriver.Chrome:
+        """Substitui uma sessão perdida do pool por outra autenticada com os mesmos cookies."""
+        self.logger.warning("Sessão do pool perdida, abrindo uma nova sessão")
+        self.metrics.increment("driver_restarts")
+        with self.metrics.span("driver_restart"):
+            return pool.replace(driver)
+
+    def _fetch_subject_snapshot(
+        self, disciplina: dict[str, str | Any], atividades_ignoradas: list[str | Any]
+    ) -> dict[str, Any] | None:
+        """Interpreta a captura gravada de uma disciplina, sem navegador."""
+        with self.metrics.span("subject", disciplina=disciplina["nome"]):
+            html = self.snapshots.load_subject(disciplina["link"])
+            if html is None:
+                self.logger.warning(f"Captura da disciplina '{disciplina['nome']}' não encontrada")
+                return None
+
+            atividades = filter_activities(parse_activities(html), atividades_ignoradas)
+        self.logger.info(f"Informações da disciplina '{disciplina['nome']}' reproduzidas.")
+        return {
+            "link_disciplina": disciplina["link"],
+            "atividades": atividades,
+        }
+
+    def _fetch_subjects_concurrently(
+        self,
+        disciplinas_info: list[dict[str, str | Any]],
+        atividades_ignoradas: list[str | Any],
+    ) -> list[dict[str, Any] | None]:
+        """Distribui as disciplinas entre um pool de sessões autenticadas com os cookies atuais."""
+        cookies = self.driver.get_cookies()
+        pool_size = min(self.pool_size, len(disciplinas_info))
+
+        with WebDriverPool(
+            self._setup_webdriver, pool_size, on_close=self.resource_policy.collect
+        ) as pool:
+            pool.start(cookies, self.login_url)
+            return pool.map(
+                lambda driver, disciplina: self._fetch_subject(
+                    driver, disciplina, atividades_ignoradas, pool=pool
+                ),
+                disciplinas_info,
+            )
 
-    def _generate_ics_file(
+    def _open_tabs(self, count: int) -> list[str]:
+        """Abre as abas adicionais e retorna os identificadores de todas, a atual primeiro."""
+        main_handle = self.driver.current_window_handle
+        handles = [main_handle]
+        for _ in range(count - 1):
+            self.driver.switch_to.new_window("tab")
+            handles.append(self.driver.current_window_handle)
+        self.driver.switch_to.window(main_handle)
+        return handles
+
+    def _close_tabs(self, handles: list[str]) -> None:
+        """Fecha as abas adicionais e devolve o foco à aba principal."""
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+
+    def _fetch_subjects_prefetch(
         self,
-        informacoes: dict[str, Any],
-        template_path: PathLike,
-        output_path: PathLike,
-        config: dict[str, Any],
-    ) -> None:
-        """Gera um arquivo .ics a partir das informações das disciplinas."""
-        # Carrega o template do arquivo .ics
-        template_dict: dict[str, str] = super()._load_file(template_path)
-        # Extrai o conteúdo do template ICS
-        template = template_dict["ics_content"].strip()
-
-        # Obtém apenas o cabeçalho
-        header, event_template = template.split("BEGIN:VEVENT", 1)
-        event_template = "BEGIN:VEVENT" + event_template
-        header = self._ensure_string(
-            header,
-            nome_aluno=config["nome_aluno"],
-            semestre=config["semestre"],
-            nome_curso=config["nome_curso"],
-        ).strip()  # Remove espaços em branco no início e no fim
-
-        eventos = []
-
-        # Itera sobre as disciplinas e atividades
-        for disciplina, dados in informacoes.items():
-            for atividade in dados["atividades"]:
-                nome_atividade = atividade["nome_atividade"]
-                periodo = str(atividade["periodo"]).split(" - ")
-                inicio = self._convert_ics_date(periodo[0].replace("/", ""))
-                fim = self._convert_ics_date(periodo[1].replace("/", ""))
-
-                # Adiciona evento de início
-                eventos.append(
-                    self._ensure_string(
-                        event_template,
-                        tipo_periodo="Início",
-                        nome_atividade=nome_atividade,
-                        data_periodo=inicio,
-                        disciplina=disciplina,
+        disciplinas_info: list[dict[str, str | Any]],
+        atividades_ignoradas: list[str | Any],
+    ) -> list[dict[str, Any] | None]:
+        """Extrai cada disciplina enquanto as próximas carregam em abas de segundo plano."""
+        handles = self._open_tabs(min(self.prefetch_tabs + 1, len(disciplinas_info)))
+        driver = self.driver
+        resultados: list[dict[str, Any] | None] = []
+        memoria: list[int] = []
+        try:
+            # Inicia o carregamento das primeiras disciplinas, uma por aba
+            for handle, disciplina in zip(handles, disciplinas_info, strict=False):
+                self.driver.switch_to.window(handle)
+                self.driver.execute_script(NAVIGATE_SCRIPT, disciplina["link"])
+
+            for index, disciplina in enumerate(disciplinas_info):
+                # Se a sessão foi reiniciada, as abas se perderam; segue sem pré-carregamento
+                if self.driver is not driver:
+                    resultados.append(
+                        self._fetch_subject(self.driver, disciplina, atividades_ignoradas)
                     )
-                )
+                    continue
 
-                if inicio != fim:
-                    eventos.append(
-                        self._ensure_string(
-                            event_template,
-                            tipo_periodo="Fim",
-                            nome_atividade=nome_atividade,
-                            data_periodo=fim,
-                            disciplina=disciplina,
-                        )
+                handle = handles[index % len(handles)]
+                self.driver.switch_to.window(handle)
+                resultados.append(
+                    self._fetch_subject(
+                        self.driver, disciplina, atividades_ignoradas, prefetched=True
                     )
+                )
+                if self.driver is not driver:
+                    continue
+                heap = self.driver.execute_script(TAB_MEMORY_SCRIPT)
+                if heap:
+                    memoria.append(int(heap))
+
+                # Reaproveita a aba liberada para a próxima disciplina ainda não carregada
+                proxima = index + len(handles)
+                if proxima < len(disciplinas_info):
+                    self.driver.execute_script(NAVIGATE_SCRIPT, disciplinas_info[proxima]["link"])
+        finally:
+            if self.driver is driver:
+                self._close_tabs(handles)
 
-        ics_content = f"{header}\n" + "\n".join(eventos) + "\nEND:VCALENDAR\n"
+        self._report_tab_memory(memoria)
+        return resultados
 
-        with output_path.open("w", encoding="utf-8") as ics_file:
-            ics_file.write(ics_content)
+    def _report_tab_memory(self, memoria: list[int]) -> None:
+        """Registra o heap JavaScript medido em cada aba após a extração da disciplina."""
+        if not memoria:
+            return
+        media = sum(memoria) / len(memoria)
+        self.metrics.set_gauge("prefetch_tab_heap_bytes_avg", media)
+        self.metrics.set_gauge("prefetch_tab_heap_bytes_max", max(memoria))
+        self.logger.info(
+            f"Memória por aba de pré-carregamento: média {media / 2**20:.1f} MiB, "
+            f"máximo {max(memoria) / 2**20:.1f} MiB (heap JavaScript)"
+        )
 
-        self.logger.info(f"Informações salvas em ICS: '{output_path}'")
+    def _fetch_subjects_http(
+        self,
+        disciplinas_info: list[dict[str, str | Any]],
+        atividades_ignoradas: list[str | Any],
+    ) -> list[dict[str, Any] | None]:
+        """Captura as disciplinas via HTTP com os cookies da sessão autenticada do WebDriver."""
+        cookies = self.driver.get_cookies()
+        on_page = self.snapshots.record_subject if self.snapshot_mode == "record" else None
+        with HttpFetchEngine(
+            cookies,
+            max_workers=self.http_max_workers,
+            on_page=on_page,
+            metrics=self.metrics,
+            subject_cache=self.subject_cache,
+            retry_policy=self.retry_policy,
+            login_url=self.login_url,
+        ) as engine:
+            return engine.fetch_subjects(disciplinas_info, atividades_ignoradas)
 
-    def export_information(self, informacoes: dict[str, str | Any], config: dict[str, Any]) -> None:
-        """Salva as informações das disciplinas em arquivos JSON, YAML e ICS."""
-        # Salva as informações em formato JSON
-        with self.json_filepath.open("w", encoding="utf-8") as json_file:
-            json.dump(informacoes, json_file, ensure_ascii=False, indent=4)
+    def fetch_subjects_information(
+        self,
+        disciplinas_info: list[dict[str, str | Any]],
+        atividades_ignoradas: list[str | Any],
+    ) -> list[Subject]:
+        """Captura as informações de cada disciplina e as retorna como registros."""
+        self._open_subject_cache(atividades_ignoradas)
+
+        # Reproduz as disciplinas a partir das capturas gravadas, sem navegador
+        if self.snapshot_mode == "replay":
+            resultados = [
+                self._fetch_subject_snapshot(disciplina, atividades_ignoradas)
+                for disciplina in disciplinas_info
+            ]
+        # Captura as disciplinas via HTTP, usando o navegador apenas para o login
+        elif self.fetch_engine == "http":
+            resultados = self._fetch_subjects_http(disciplinas_info, atividades_ignoradas)
+        # Captura as disciplinas em paralelo quando o pool estiver habilitado
+        elif self.pool_size > 1 and len(disciplinas_info) > 1:
+            resultados = self._fetch_subjects_concurrently(disciplinas_info, atividades_ignoradas)
+        # Pré-carrega as próximas disciplinas em abas enquanto a atual é extraída
+        elif self.prefetch_tabs > 0 and len(disciplinas_info) > 1:
+            resultados = self._fetch_subjects_prefetch(disciplinas_info, atividades_ignoradas)
+        else:
+            resultados = [
+                self._fetch_subject(self.driver, disciplina, atividades_ignoradas)
+                for disciplina in disciplinas_info
+            ]
+
+        return self._merge_results(disciplinas_info, resultados)
+
+    def _open_subject_cache(self, atividades_ignoradas: list[str | Any]) -> None:
+        """Abre o cache de resultados das disciplinas capturadas no portal."""
+        if self.subject_cache_enabled and self.snapshot_mode != "replay":
+            self.subject_cache = SubjectCache(
+                atividades_ignoradas, self.cache_dir / SUBJECT_CACHE_FILE.name
+            )
 
-        # Salva as informações em formato YAML
-        with self.yml_filepath.open("w", encoding="utf-8") as yml_file:
-            yaml.dump(informacoes, yml_file, allow_unicode=True, default_flow_style=False)
+    def _merge_results(
+        self,
+        disciplinas_info: list[dict[str, str | Any]],
+        resultados: list[dict[str, Any] | None],
+    ) -> list[Subject]:
+        """Combina os resultados capturados e em cache, na ordem original das disciplinas."""
+        # Converte cada resultado em registro, na ordem original; os dicionários são descartados
+        subjects: list[Subject] = []
+        for disciplina, resultado in zip(disciplinas_info, resultados, strict=True):
+            informacoes = resultado or self._cached_result(disciplina)
+            if informacoes is not None:
+                subjects.append(Subject.from_dict(disciplina["nome"], informacoes))
+
+        self._save_subject_cache(len(disciplinas_info))
+
+        self.metrics.increment("subjects_fetched", len(subjects))
+        self.metrics.increment("subjects_failed", len(disciplinas_info) - len(subjects))
+        return subjects
+
+    def _cached_result(self, disciplina: dict[str, str | Any]) -> dict[str, Any] | None:
+        """Retorna as últimas atividades conhecidas de uma disciplina cuja captura falhou."""
+        if self.subject_cache is None:
+            return None
+        atividades = self.subject_cache.cached(disciplina["link"])
+        if atividades is None:
+            return None
+        self.logger.warning(
+            f"Usando as atividades em cache da disciplina '{disciplina['nome']}' após falha"
+        )
+        return {
+            "link_disciplina": disciplina["link"],
+            "atividades": atividades,
+        }
+
+    def _save_subject_cache(self, total: int) -> None:
+        """Grava o cache de resultados e registra quantas disciplinas não mudaram."""
+        if self.subject_cache is None:
+            return
+        self.metrics.increment("subjects_unchanged", self.subject_cache.hits)
+        self.logger.info(
+            f"Disciplinas sem alteração desde a execução anterior: {self.subject_cache.hits} "
+            f"de {total}"
+        )
+        try:
+            self.subject_cache.save()
+        except OSError:
+            self.logger.exception("Erro ao salvar o cache de disciplinas")
+
+    def export_information(self, subjects: list[Subject], config: dict[str, Any]) -> None:
+        """Salva as informações das disciplinas nos formatos de `export_formats`, em paralelo."""
+        self.exporter.export(subjects, config)
+
+    def _export_metrics(self) -> None:
+        """Grava as métricas da execução no diretório de saída e exibe o resumo no terminal."""
+        for step, elapsed in self.waiter.waited.items():
+            self.metrics.set_gauge(f"wait_seconds.{step}", elapsed)
+        if self.resource_policy.enabled:
+            self.metrics.set_gauge(
+                "resource_policy.blocked_requests",
+                sum(self.resource_policy.blocked_requests.values()),
+            )
+            self.metrics.set_gauge(
+                "resource_policy.transferred_bytes", self.resource_policy.transferred_bytes
+            )
+        for step, elapsed in self.retry_policy.spent.items():
+            self.metrics.set_gauge(f"retry_seconds.{step}", elapsed)
+        self.metrics.set_gauge("circuit_open", int(self.retry_policy.breaker.is_open))
 
-        # Gera o arquivo ICS com base nas informações e no template
-        self._generate_ics_file(informacoes, self.ics_template_filepath, self.ics_filepath, config)
+        metrics_filepath = self.output_path / "metricas_execucao.json"
+        try:
+            self.metrics.export_json(metrics_filepath)
+            if self.settings.metrics_prometheus:
+                self.metrics.export_prometheus(metrics_filepath.with_suffix(".prom"))
+        except OSError:
+            self.logger.exception("Erro ao salvar as métricas da execução")
+        else:
+            self.logger.info(f"Métricas salvas em JSON: '{metrics_filepath}'")
 
-        # Loga as informações dos arquivos salvos
-        self.logger.info(f"Informações salvas em JSON: '{self.json_filepath}'")
-        self.logger.info(f"Informações salvas em YAML: '{self.yml_filepath}'")
+        self.metrics.print_summary()
 
     def _shutdown_resources(self) -> None:
         """Encerra todos os recursos abertos (WebDriver, pools, etc.) de forma segura."""
@@ -410,65 +915,117 @@ class SeleniumScraperPipeline(BaseClass):
         if getattr(self, "driver", None):
             try:
                 self.logger.info("Encerrando o WebDriver...")
+                self.resource_policy.collect(self.driver)
                 self.driver.quit()
             except Exception:
                 self.logger.exception("Erro ao encerrar o WebDriver.")
             finally:
                 self.driver = None
 
-    def run_workflow(self) -> None:
-        """Executa o fluxo principal do script."""
-        try:
-            # Configura o WebDriver
+        # Aguarda a gravação das capturas de tela pendentes
+        if self.screenshot_writer is not None:
+            self.screenshot_writer.close()
+
+        # Grava os registros de log ainda na fila do modo `queue`
+        LoggerSingleton.flush()
+
+    def _start_browser_session(self) -> None:
+        """Abre o navegador e deixa a sessão autenticada na página do curso."""
+        # Configura o WebDriver
+        with self.metrics.span("setup_webdriver"):
             self.driver = self._setup_webdriver()
 
-            # Define o diretório de imagens com base no modo de perfil
-            if PROFILE_MODE == "debug":
-                timestamp = datetime.now(tz=BRT).strftime("%Y%m%d_%H%M%S")
-                self.image_folder = self.image_folder / timestamp
-                self.image_folder.mkdir(parents=True, exist_ok=True)
-            else:
-                self.image_folder = self.image_folder
+        # Define o diretório de imagens com base no modo de perfil
+        if PROFILE_MODE == "debug":
+            timestamp = datetime.now(tz=BRT).strftime("%Y%m%d_%H%M%S")
+            self.image_folder = self.image_folder / timestamp
+            self.screenshot_writer = ScreenshotWriter(
+                self.image_folder, self.settings.get("screenshots")
+            )
+            self.screenshot_writer.start()
+        else:
+            self.image_folder = self.image_folder
+
+        self._authenticate()
+
+    def _authenticate(self) -> None:
+        """Reutiliza a sessão em cache ou realiza o login e acessa o curso."""
+        with self.metrics.span("restore_session"):
+            restored = self._restore_session()
 
+        if not restored:
             # Realiza o login no portal
-            self.portal_login(
-                self.settings["usuario"],
-                self.settings["senha"],
-            )
+            with self.metrics.span("login"):
+                self.portal_login(
+                    self.settings["usuario"],
+                    self.settings["senha"],
+                )
 
             # Acessa o curso especificado
-            self.access_course(self.settings["nome_curso"])
+            with self.metrics.span("access_course"):
+                self.access_course(self.settings["nome_curso"])
+            self._store_session()
+
+    def _bind_log_context(self) -> None:
+        """Identifica a execução e a conta em todos os registros do log estruturado."""
+        bind_process_context(run_id=self.metrics.run_id, account=self.account)
+
+    def run_workflow(self) -> None:
+        """Executa o fluxo principal do script."""
+        self._bind_log_context()
+        try:
+            # Reproduz as capturas gravadas sem abrir o navegador
+            if self.snapshot_mode == "replay":
+                self.logger.info(f"Reproduzindo as capturas de '{self.snapshots.directory}'")
+                self.snapshots.load()
+            else:
+                with self.metrics.span("browser_session"):
+                    self._start_browser_session()
 
             # Encontra as disciplinas disponíveis
-            disciplinas_info = self.find_subjects(
-                self.settings["colaborar_index_url"],
-                self.settings["matricula"],
-            )
+            with self.metrics.span("find_subjects"):
+                disciplinas_info = self.find_subjects(
+                    self.settings["colaborar_index_url"],
+                    self.settings["matricula"],
+                )
+            self.metrics.increment("subjects_found", len(disciplinas_info))
 
             # Captura as disciplinas, se em modo "debug"
-            if PROFILE_MODE == "debug":
-                for disciplina in disciplinas_info:
-                    self.capture_subjects([disciplina])
+            if PROFILE_MODE == "debug" and self.driver:
+                with self.metrics.span("capture_subjects"):
+                    for disciplina in disciplinas_info:
+                        self.capture_subjects([disciplina])
 
             # Captura as informações das disciplinas
-            informacoes_disciplinas = self.fetch_subjects_information(
-                disciplinas_info,
-                self.settings.get("atividades_ignoradas", []),
-            )
+            with self.metrics.span("fetch_subjects"):
+                informacoes_disciplinas = self.fetch_subjects_information(
+                    disciplinas_info,
+                    self.settings.get("atividades_ignoradas", []),
+                )
 
             # Exporta as informações das disciplinas
-            self.export_information(informacoes_disciplinas, self.settings)
+            with self.metrics.span("export"):
+                self.export_information(informacoes_disciplinas, self.settings)
+
+            # Registra o tempo efetivamente aguardado em cada etapa
+            self.waiter.report()
         except KeyboardInterrupt:
             self.logger.warning("Script interrompido pelo usuário.")
         except ProjectError:
             self.logger.exception("Erro durante a execução do pipeline.")
             raise
         finally:
-            if PROFILE_MODE == "debug" and self.driver and self.image_folder:
-                self._save_screenshot("final_state")
-            self._shutdown_resources()
-            super()._separator_line()
-            echo(
-                f"Pipeline finalizado com sucesso. Resultado salvo em: '{self.output_path}'",
-                "success",
-            )
+            self._finish_workflow()
+
+    def _finish_workflow(self) -> None:
+        """Encerra os recursos e registra as métricas ao final de uma execução."""
+        if PROFILE_MODE == "debug" and self.driver and self.image_folder:
+            self._save_screenshot("final_state")
+        self._shutdown_resources()
+        self.resource_policy.report()
+        self._export_metrics()
+        super()._separator_line()
+        echo(
+            f"Pipeline finalizado com sucesso. Resultado salvo em: '{self.output_path}'",
+            "success",
+        )
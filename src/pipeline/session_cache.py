@@ -0,0 +1,74 @@
+"""Módulo do cache em disco da sessão autenticada no portal."""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from src.common.base.base_class import BaseClass
+from src.config.constants import SESSION_CACHE_FILE
+from src.config.constypes import PathLike
+from src.infrastructure.logger import LoggerSingleton
+
+
+class SessionCache(BaseClass):
+    """Persiste os cookies e a URL do curso para reutilizar a sessão entre execuções."""
+
+    def __init__(self, path: PathLike = SESSION_CACHE_FILE, ttl_seconds: int = 3600) -> None:
+        """Inicializa o cache com o arquivo de destino e o tempo de validade."""
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.path = Path(path)
+        """Arquivo JSON onde a sessão é armazenada."""
+
+        self.ttl_seconds = ttl_seconds
+        """Tempo máximo, em segundos, de reutilização de uma sessão salva."""
+
+    def load(self) -> dict[str, Any] | None:
+        """Retorna a sessão salva se ela existir e ainda não tiver expirado."""
+        if not self.path.is_file():
+            return None
+
+        try:
+            session = super()._load_file(self.path)
+        except (OSError, ValueError):
+            self.logger.warning(f"Cache de sessão inválido, descartando: '{self.path}'")
+            self.clear()
+            return None
+
+        if session.get("expires_at", 0) <= time.time():
+            self.logger.info("Sessão em cache expirada")
+            self.clear()
+            return None
+
+        return session
+
+    def save(self, cookies: list[dict[str, Any]], landing_url: str) -> None:
+        """Salva os cookies e a URL do curso com o horário de expiração."""
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+
+        # Respeita a expiração dos próprios cookies, quando anterior ao prazo do cache
+        cookie_expiries = [cookie["expiry"] for cookie in cookies if "expiry" in cookie]
+        if cookie_expiries:
+            expires_at = min(expires_at, *cookie_expiries)
+
+        path = super()._ensure_path(self.path)
+        with path.open("w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "created_at": now,
+                    "expires_at": expires_at,
+                    "landing_url": landing_url,
+                    "cookies": cookies,
+                },
+                file,
+                ensure_ascii=False,
+            )
+        path.chmod(0o600)
+        self.logger.info(f"Sessão salva em cache: '{path}'")
+
+    def clear(self) -> None:
+        """Remove a sessão salva."""
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,86 @@
+"""Módulo de gravação e reprodução de capturas de HTML das páginas do portal."""
+
+import json
+import re
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from src.common.base.base_class import BaseClass
+from src.config.constants import HTML_DIR
+from src.config.constypes import PathLike
+from src.infrastructure.logger import LoggerSingleton
+
+
+class SnapshotStore(BaseClass):
+    """Grava o HTML da página do curso e das disciplinas e o disponibiliza para reprodução."""
+
+    def __init__(self, directory: PathLike = HTML_DIR) -> None:
+        """Inicializa o armazenamento no diretório informado."""
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.directory = Path(directory)
+        """Diretório onde as capturas e o manifesto são gravados."""
+
+        self.manifest_path = self.directory / "manifest.json"
+        """Manifesto que relaciona cada página ao seu arquivo de captura."""
+
+        self.manifest: dict[str, Any] = {"dashboard": None, "subjects": {}}
+        """Conteúdo do manifesto: página do curso e disciplinas indexadas pelo link."""
+
+        self._lock = Lock()
+        """Protege o manifesto quando várias sessões gravam capturas em paralelo."""
+
+    def _write(self, filename: str, html: str) -> None:
+        """Grava o HTML de uma página no diretório de capturas."""
+        path = super()._ensure_path(self.directory / filename)
+        path.write_text(html, encoding="utf-8")
+
+    def _save_manifest(self) -> None:
+        """Grava o manifesto atual em disco."""
+        path = super()._ensure_path(self.manifest_path)
+        with path.open("w", encoding="utf-8") as file:
+            json.dump(self.manifest, file, ensure_ascii=False, indent=4)
+
+    def record_dashboard(self, url: str, html: str) -> None:
+        """Grava a página do curso com a lista de disciplinas."""
+        self._write("dashboard.html", html)
+        with self._lock:
+            self.manifest["dashboard"] = {"url": url, "file": "dashboard.html"}
+            self._save_manifest()
+        self.logger.debug(f"Captura da página do curso gravada em '{self.directory}'")
+
+    def record_subject(self, disciplina: dict[str, str | Any], html: str) -> None:
+        """Grava a página de uma disciplina."""
+        filename = f"subjects/{re.sub(r'[^\w-]+', '_', disciplina['nome']).strip('_')}.html"
+        self._write(filename, html)
+        with self._lock:
+            self.manifest["subjects"][disciplina["link"]] = {
+                "nome": disciplina["nome"],
+                "file": filename,
+            }
+            self._save_manifest()
+        self.logger.debug(f"Captura da disciplina '{disciplina['nome']}' gravada")
+
+    def load(self) -> None:
+        """Carrega o manifesto das capturas gravadas anteriormente."""
+        if not self.manifest_path.is_file():
+            msg = f"Manifesto de capturas não encontrado: '{self.manifest_path}'"
+            raise FileNotFoundError(msg)
+        self.manifest = super()._load_file(self.manifest_path)
+
+    def load_dashboard(self) -> tuple[str, str]:
+        """Retorna a URL e o HTML da página do curso gravada."""
+        dashboard = self.manifest["dashboard"]
+        if dashboard is None:
+            raise FileNotFoundError("A página do curso não foi gravada no manifesto.")
+        html = (self.directory / dashboard["file"]).read_text(encoding="utf-8")
+        return dashboard["url"], html
+
+    def load_subject(self, link: str) -> str | None:
+        """Retorna o HTML gravado da disciplina ou None se ela não foi capturada."""
+        subject = self.manifest["subjects"].get(link)
+        if subject is None:
+            return None
+        return (self.directory / subject["file"]).read_text(encoding="utf-8")
@@ -0,0 +1,120 @@
+"""Módulo do cache de resultados por disciplina com detecção de alterações."""
+
+import hashlib
+import json
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from src.common.base.base_class import BaseClass
+from src.config.constants import SUBJECT_CACHE_FILE
+from src.config.constypes import PathLike
+from src.infrastructure.logger import LoggerSingleton
+
+
+def fingerprint(container_html: str) -> str:
+    """Retorna o hash SHA-256 do HTML da linha do tempo de uma disciplina."""
+    return hashlib.sha256(container_html.encode("utf-8")).hexdigest()
+
+
+class SubjectCache(BaseClass):
+    """Guarda as atividades de cada disciplina associadas à impressão digital da página."""
+
+    def __init__(
+        self, atividades_ignoradas: list[str | Any], path: PathLike = SUBJECT_CACHE_FILE
+    ) -> None:
+        """Inicializa o cache, descartando-o se a lista de atividades ignoradas mudou."""
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.path = Path(path)
+        """Arquivo JSON onde os resultados são armazenados."""
+
+        self.filter_key = json.dumps(sorted(map(str, atividades_ignoradas)), ensure_ascii=False)
+        """Lista de atividades ignoradas usada no filtro dos resultados armazenados."""
+
+        self.entries: dict[str, dict[str, Any]] = {}
+        """Resultados por link da disciplina: impressão digital, validadores HTTP e atividades."""
+
+        self.hits = 0
+        """Disciplinas sem alteração, reaproveitadas do cache nesta execução."""
+
+        self._lock = Lock()
+        """Protege as entradas quando as disciplinas são capturadas em paralelo."""
+
+        self._load()
+
+    def _load(self) -> None:
+        """Carrega as entradas salvas, se compatíveis com o filtro atual."""
+        if not self.path.is_file():
+            return
+        try:
+            data = super()._load_file(self.path)
+        except (OSError, ValueError):
+            self.logger.warning(f"Cache de disciplinas inválido, descartando: '{self.path}'")
+            return
+
+        if data.get("filter_key") != self.filter_key:
+            self.logger.info("Atividades ignoradas alteradas, cache de disciplinas descartado")
+            return
+        self.entries = data.get("subjects", {})
+
+    def lookup(self, link: str, digest: str) -> list[dict[str, str]] | None:
+        """Retorna as atividades em cache se a impressão digital da disciplina não mudou."""
+        with self._lock:
+            entry = self.entries.get(link)
+            if entry is None or entry["fingerprint"] != digest:
+                return None
+            self.hits += 1
+            return entry["atividades"]
+
+    def validators(self, link: str) -> dict[str, str]:
+        """Retorna os cabeçalhos de requisição condicional (ETag e Last-Modified) da disciplina."""
+        entry = self.entries.get(link, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def not_modified(self, link: str) -> list[dict[str, str]] | None:
+        """Retorna as atividades em cache de uma disciplina que o servidor indicou inalterada."""
+        with self._lock:
+            entry = self.entries.get(link)
+            if entry is None:
+                return None
+            self.hits += 1
+            return entry["atividades"]
+
+    def cached(self, link: str) -> list[dict[str, str]] | None:
+        """Retorna as últimas atividades conhecidas da disciplina, sem validar a página."""
+        entry = self.entries.get(link)
+        return entry["atividades"] if entry is not None else None
+
+    def store(
+        self,
+        link: str,
+        digest: str,
+        atividades: list[dict[str, str]],
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Armazena as atividades interpretadas junto à impressão digital da página."""
+        with self._lock:
+            self.entries[link] = {
+                "fingerprint": digest,
+                "etag": etag,
+                "last_modified": last_modified,
+                "atividades": atividades,
+            }
+
+    def save(self) -> None:
+        """Grava as entradas no arquivo de cache."""
+        path = super()._ensure_path(self.path)
+        with path.open("w", encoding="utf-8") as file:
+            json.dump(
+                {"filter_key": self.filter_key, "subjects": self.entries},
+                file,
+                ensure_ascii=False,
+            )
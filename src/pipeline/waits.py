@@ -0,0 +1,84 @@
+"""Módulo de esperas explícitas por condições de prontidão das páginas do portal."""
+
+import time
+from collections.abc import Callable
+from threading import Lock
+from typing import Any
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.wait import WebDriverWait
+
+from src.common.base.base_class import BaseClass
+from src.infrastructure.logger import LoggerSingleton
+
+DEFAULT_TIMEOUTS: dict[str, float] = {
+    "login": 15,
+    "course": 15,
+    "subject": 10,
+    "optional": 2,
+}
+"""Orçamento padrão, em segundos, de cada etapa de espera do pipeline."""
+
+
+class PageWaiter(BaseClass):
+    """Aguarda condições de prontidão com orçamento por etapa e registra o tempo esperado."""
+
+    def __init__(
+        self, timeouts: dict[str, float] | None = None, poll_frequency: float = 0.1
+    ) -> None:
+        """Inicializa o orçamento de cada etapa a partir dos valores padrão e configurados."""
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        """Tempo máximo, em segundos, de cada etapa de espera."""
+
+        self.poll_frequency = poll_frequency
+        """Intervalo, em segundos, entre as verificações de uma condição."""
+
+        self.waited: dict[str, float] = {}
+        """Tempo total, em segundos, efetivamente aguardado em cada etapa."""
+
+        self._lock = Lock()
+        """Protege o acumulado de esperas quando usado por várias sessões em paralelo."""
+
+    def _record(self, step: str, elapsed: float) -> None:
+        """Acumula o tempo aguardado em uma etapa."""
+        with self._lock:
+            self.waited[step] = self.waited.get(step, 0.0) + elapsed
+
+    def until(
+        self,
+        driver: webdriver.Chrome,
+        step: str,
+        condition: Callable[[webdriver.Chrome], Any],
+        description: str,
+    ) -> Any:
+        """Aguarda a condição dentro do orçamento da etapa e retorna o seu resultado."""
+        timeout = self.timeouts.get(step, DEFAULT_TIMEOUTS["optional"])
+        start = time.perf_counter()
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=self.poll_frequency).until(
+                condition
+            )
+        except TimeoutException:
+            self.logger.warning(
+                f"Tempo esgotado na etapa '{step}' após {timeout:.1f} s aguardando {description}"
+            )
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self._record(step, elapsed)
+            self.logger.debug(f"Etapa '{step}' aguardou {elapsed * 1000:.0f} ms: {description}")
+
+    def optional(self, driver: webdriver.Chrome, by: str, selector: str) -> WebElement | None:
+        """Retorna o elemento se ele já estiver na página, sem aguardar quando ausente."""
+        elements = driver.find_elements(by, selector)
+        return elements[0] if elements else None
+
+    def report(self) -> None:
+        """Registra no log o tempo total aguardado em cada etapa."""
+        for step, elapsed in self.waited.items():
+            self.logger.info(f"Tempo aguardado na etapa '{step}': {elapsed:.2f} s")
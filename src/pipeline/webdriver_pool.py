@@ -0,0 +1,147 @@
+"""Módulo do pool de sessões do WebDriver para captura concorrente de páginas."""
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from threading import Lock
+from types import TracebackType
+from typing import Any, Self
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+
+from src.common.base.base_class import BaseClass
+from src.infrastructure.logger import LoggerSingleton
+
+
+def authenticate_driver(
+    driver: webdriver.Chrome, cookies: list[dict[str, Any]], login_url: str
+) -> None:
+    """Injeta cookies autenticados no WebDriver, abrindo antes a raiz do domínio do portal."""
+    parts = urlsplit(login_url)
+    driver.get(f"{parts.scheme}://{parts.netloc}/")
+    for cookie in cookies:
+        driver.add_cookie(cookie)
+
+
+class WebDriverPool(BaseClass):
+    """Mantém um conjunto limitado de sessões do Chrome autenticadas com os mesmos cookies."""
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], webdriver.Chrome],
+        size: int,
+        on_close: Callable[[webdriver.Chrome], None] | None = None,
+    ) -> None:
+        """Inicializa o pool sem abrir nenhuma sessão."""
+        self.logger = LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.driver_factory = driver_factory
+        """Função responsável por criar uma nova sessão do WebDriver."""
+
+        self.size = max(1, size)
+        """Quantidade máxima de sessões simultâneas."""
+
+        self.on_close = on_close
+        """Função chamada com cada sessão imediatamente antes de encerrá-la."""
+
+        self.drivers: list[webdriver.Chrome] = []
+        """Sessões abertas pelo pool."""
+
+        self._available: Queue[webdriver.Chrome] = Queue()
+        """Fila de sessões livres para uso pelas threads de trabalho."""
+
+        self._credentials: tuple[list[dict[str, Any]], str] = ([], "")
+        """Cookies e URL de login usados em `start`, reaproveitados ao substituir uma sessão."""
+
+        self._successors: dict[webdriver.Chrome, webdriver.Chrome] = {}
+        """Sessões substituídas durante um item, devolvidas à fila pela substituta."""
+
+        self._lock = Lock()
+        """Protege a lista de sessões e as substituições feitas por várias threads."""
+
+    def __enter__(self) -> Self:
+        """Retorna o próprio pool para uso em blocos `with`."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Encerra todas as sessões ao sair do bloco `with`."""
+        self.close()
+
+    def _open_session(self, cookies: list[dict[str, Any]], login_url: str) -> webdriver.Chrome:
+        """Cria uma sessão e injeta os cookies autenticados no domínio do portal."""
+        driver = self.driver_factory()
+        authenticate_driver(driver, cookies, login_url)
+        return driver
+
+    def start(self, cookies: list[dict[str, Any]], login_url: str) -> None:
+        """Abre as sessões do pool em paralelo, todas autenticadas com os cookies informados."""
+        self.logger.info(f"Abrindo {self.size} sessões do WebDriver em paralelo")
+        self._credentials = (cookies, login_url)
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [
+                executor.submit(self._open_session, cookies, login_url) for _ in range(self.size)
+            ]
+            for future in futures:
+                try:
+                    driver = future.result()
+                except Exception:
+                    self.logger.exception("Erro ao abrir sessão do pool")
+                    continue
+                self.drivers.append(driver)
+                self._available.put(driver)
+
+        if not self.drivers:
+            raise RuntimeError("Nenhuma sessão do WebDriver pôde ser aberta no pool.")
+
+    def map[T, R](self, func: Callable[[webdriver.Chrome, T], R], items: Iterable[T]) -> list[R]:
+        """Distribui os itens entre as sessões livres e retorna os resultados na ordem original."""
+
+        def run(item: T) -> R:
+            driver = self._available.get()
+            try:
+                return func(driver, item)
+            finally:
+                self._available.put(self._latest(driver))
+
+        with ThreadPoolExecutor(max_workers=len(self.drivers)) as executor:
+            return list(executor.map(run, items))
+
+    def replace(self, driver: webdriver.Chrome) -> webdriver.Chrome:
+        """Encerra uma sessão perdida e a substitui por uma nova, autenticada com os cookies."""
+        self._close_driver(driver)
+        successor = self._open_session(*self._credentials)
+        with self._lock:
+            self.drivers[self.drivers.index(driver)] = successor
+            self._successors[driver] = successor
+        return successor
+
+    def _latest(self, driver: webdriver.Chrome) -> webdriver.Chrome:
+        """Retorna a sessão que substituiu a informada, seguindo substituições sucessivas."""
+        with self._lock:
+            while driver in self._successors:
+                driver = self._successors.pop(driver)
+        return driver
+
+    def _close_driver(self, driver: webdriver.Chrome) -> None:
+        """Repassa a sessão ao `on_close` e a encerra, registrando falhas sem propagá-las."""
+        try:
+            if self.on_close is not None:
+                self.on_close(driver)
+            driver.quit()
+        except Exception:
+            self.logger.exception("Erro ao encerrar sessão do pool.")
+
+    def close(self) -> None:
+        """Encerra todas as sessões abertas pelo pool."""
+        for driver in self.drivers:
+            self._close_driver(driver)
+        self.drivers.clear()
+        self._available = Queue()